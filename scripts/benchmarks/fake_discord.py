@@ -0,0 +1,120 @@
+"""
+Objets Discord factices pour les benchmarks hors ligne.
+
+Ils reproduisent uniquement les attributs et méthodes utilisés par les
+services et les cogs (cache des membres et des événements, pagination des
+participants et des membres) ; aucun appel réseau n'est effectué.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import discord
+
+# Tailles de page de l'API Discord, pour compter les appels simulés
+EVENT_USERS_PAGE_SIZE = 100
+GUILD_MEMBERS_PAGE_SIZE = 1000
+
+
+class FakeMember:
+    def __init__(self, member_id: int, name: str):
+        self.id = member_id
+        self.name = name
+        self.display_name = name
+        self.mention = f"<@{member_id}>"
+
+
+class FakeChannel:
+    """Canal textuel : les messages envoyés sont seulement comptés"""
+
+    def __init__(self, channel_id: int):
+        self.id = channel_id
+        self.sent = 0
+
+    async def send(self, content: Optional[str] = None, **kwargs) -> None:
+        self.sent += 1
+
+
+class FakeScheduledEvent:
+    def __init__(self, guild: "FakeGuild", event_id: int, name: str, start_time: datetime, participants: List[FakeMember]):
+        self.guild = guild
+        self.guild_id = guild.id
+        self.id = event_id
+        self.name = name
+        self.description = f"Description de {name}"
+        self.start_time = start_time
+        self.status = discord.EventStatus.scheduled
+        self.entity_type = discord.EntityType.voice
+        self.url = f"https://discord.com/events/{guild.id}/{event_id}"
+        self.participants = participants
+        self.api_calls = 0
+
+    async def users(self, limit: Optional[int] = None):
+        """Itère les participants page par page, comme discord.py"""
+        for start in range(0, len(self.participants) + 1, EVENT_USERS_PAGE_SIZE):
+            self.api_calls += 1
+            for member in self.participants[start:start + EVENT_USERS_PAGE_SIZE]:
+                yield member
+
+
+class FakeGuild:
+    """Guild synthétique : `members` membres, `events` événements de `participants` inscrits"""
+
+    def __init__(self, members: int, events: int, participants: int, seed: int = 42, guild_id: int = 1):
+        rng = random.Random(seed)
+        self.id = guild_id
+        self.name = "Guild de benchmark"
+        self.members = [FakeMember(10_000_000 + index, f"membre_{index}") for index in range(members)]
+        self._members_by_id: Dict[int, FakeMember] = {member.id: member for member in self.members}
+        self.notification_channel = FakeChannel(1)
+        self.api_calls = 0
+
+        now = datetime.now(timezone.utc)
+        self.scheduled_events = [
+            FakeScheduledEvent(
+                self,
+                20_000_000 + index,
+                f"Soirée {index}",
+                now + timedelta(hours=6 * (index + 1)),
+                rng.sample(self.members, min(participants, members)),
+            )
+            for index in range(events)
+        ]
+
+    def get_member(self, member_id: int) -> Optional[FakeMember]:
+        return self._members_by_id.get(member_id)
+
+    def get_channel(self, channel_id: int) -> Optional[FakeChannel]:
+        return self.notification_channel if channel_id == self.notification_channel.id else None
+
+    async def fetch_members(self, limit: Optional[int] = None):
+        for start in range(0, len(self.members) + 1, GUILD_MEMBERS_PAGE_SIZE):
+            self.api_calls += 1
+            for member in self.members[start:start + GUILD_MEMBERS_PAGE_SIZE]:
+                yield member
+
+
+class FakeBot:
+    def __init__(self, guild: FakeGuild):
+        self.guild = guild
+
+    def get_guild(self, guild_id: int) -> Optional[FakeGuild]:
+        return self.guild if guild_id == self.guild.id else None
+
+    def get_channel(self, channel_id: int) -> Optional[FakeChannel]:
+        return self.guild.get_channel(channel_id)
+
+
+class FakeContext:
+    """Contexte de commande : les messages envoyés sont seulement comptés"""
+
+    def __init__(self, guild: FakeGuild):
+        self.guild = guild
+        self.author = guild.members[0] if guild.members else FakeMember(1, "auteur")
+        self.sent = 0
+
+    async def send(self, content: Optional[str] = None, **kwargs) -> None:
+        self.sent += 1
+
+    async def defer(self) -> None:
+        pass
@@ -0,0 +1,227 @@
+"""
+Benchmarks hors ligne du bot (sans connexion Discord).
+
+Pour chaque échelle (nombre de membres), une guild factice est construite et
+une base SQLite temporaire est utilisée. Les chemins critiques sont mesurés :
+synchronisation complète (à froid puis sans changement), rafale d'inscriptions
+temps réel, `$list_events`, `$event_detail` et `create_text_table`. Chaque
+mesure indique sa durée, le nombre de requêtes SQL émises et les formes de
+requêtes répétées (N+1 probables).
+
+Les résultats sont écrits en JSON (dans src/data/benchmarks par défaut) ;
+`--compare` affiche l'écart avec un fichier de résultats précédent.
+
+Utilisation :
+    python scripts/benchmarks/run_benchmarks.py --scales 100,1000,10000,100000
+    python scripts/benchmarks/run_benchmarks.py --compare src/data/benchmarks/<fichier>.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import bot.core.database as database  # noqa: E402
+import bot.infrastructure.unit_of_work_impl as unit_of_work_impl  # noqa: E402
+from bot.core.config import DATA_DIR  # noqa: E402
+from bot.domain.services.synchronization_service import SynchronizationService  # noqa: E402
+from bot.domain.utils.create_text_table import create_text_table  # noqa: E402
+from bot.infrastructure.query_monitor import format_repeated, track_queries  # noqa: E402
+from bot.infrastructure.render_cache import render_cache  # noqa: E402
+from cogs.events import EventsCommands  # noqa: E402
+from fake_discord import FakeBot, FakeContext, FakeGuild, FakeMember  # noqa: E402
+
+DEFAULT_SCALES = "100,1000,10000"
+RESULTS_DIR = DATA_DIR / "benchmarks"
+
+
+class BenchmarkRun:
+    """Base temporaire et guild factice pour une échelle donnée"""
+
+    def __init__(self, members: int, events: int, participants: int):
+        self.guild = FakeGuild(members, events, participants)
+        self.bot = FakeBot(self.guild)
+        self._tmp_dir = tempfile.TemporaryDirectory(prefix="dictabot-bench-")
+        self.engine = database.DatabaseEngine(Path(self._tmp_dir.name) / "bench.db")
+        # Les unités de travail du bot utilisent la base temporaire
+        database.db_engine = self.engine
+        unit_of_work_impl.db_engine = self.engine
+        self.engine.create_tables()
+        self.sync_service = SynchronizationService(unit_of_work_impl.create_unit_of_work, self.guild.notification_channel.id)
+        self.events_cog = EventsCommands(self.bot)
+
+    @property
+    def api_calls(self) -> int:
+        """Pages demandées à l'API Discord simulée (membres et participants)"""
+        return self.guild.api_calls + sum(e.api_calls for e in self.guild.scheduled_events)
+
+    def close(self) -> None:
+        self.engine.close()
+        self._tmp_dir.cleanup()
+
+
+async def measure(
+    run: BenchmarkRun,
+    name: str,
+    func: Callable[[], Awaitable[Any]],
+    repeat: int = 1,
+    setup: Optional[Callable[[], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Exécute `func` `repeat` fois : durée médiane, requêtes SQL et appels d'API par
+    exécution, et formes de requêtes répétées (N+1 probables) de la dernière exécution.
+    """
+    durations: List[float] = []
+    queries: List[int] = []
+    api_calls: List[int] = []
+    n_plus_one = ""
+    for _ in range(repeat):
+        if setup:
+            setup()
+        api_calls_before = run.api_calls
+        with track_queries(name) as stats:
+            start = time.perf_counter()
+            await func()
+            durations.append(time.perf_counter() - start)
+        queries.append(stats.count)
+        api_calls.append(run.api_calls - api_calls_before)
+        n_plus_one = format_repeated(stats.repeated()[:3])
+    return {
+        'benchmark': name,
+        'repeat': repeat,
+        'median_ms': round(statistics.median(durations) * 1000, 2),
+        'min_ms': round(min(durations) * 1000, 2),
+        'queries': max(queries),
+        'api_calls': max(api_calls),
+        'n_plus_one': n_plus_one,
+    }
+
+
+async def run_scale(members: int, events: int, participation: float, burst: int, repeat: int) -> List[Dict[str, Any]]:
+    participants = max(1, int(members * participation))
+    run = BenchmarkRun(members, events, participants)
+    results: List[Dict[str, Any]] = []
+    try:
+        results.append(await measure(run, "sync_guild_cold", lambda: run.sync_service.sync_guild(run.bot, run.guild)))
+        results.append(await measure(
+            run, "sync_guild_unchanged", lambda: run.sync_service.sync_guild(run.bot, run.guild), repeat
+        ))
+
+        # Rafale d'inscriptions temps réel de nouveaux utilisateurs sur un même événement
+        target = run.guild.scheduled_events[0]
+        newcomers = [FakeMember(90_000_000 + index, f"nouveau_{index}") for index in range(burst)]
+
+        async def user_add_burst():
+            for member in newcomers:
+                await run.sync_service.handle_user_add(run.bot, target, member)
+
+        results.append(await measure(run, f"handle_user_add_x{burst}", user_add_burst))
+
+        ctx = FakeContext(run.guild)
+        largest = max(run.guild.scheduled_events, key=lambda e: len(e.participants))
+        invalidate = render_cache.invalidate
+        results.append(await measure(
+            run, "list_events", lambda: run.events_cog.list_events.callback(run.events_cog, ctx), repeat, invalidate
+        ))
+        results.append(await measure(
+            run, "list_events_cached", lambda: run.events_cog.list_events.callback(run.events_cog, ctx), repeat
+        ))
+        results.append(await measure(
+            run, "event_detail",
+            lambda: run.events_cog.event_detail.callback(run.events_cog, ctx, largest.id), repeat, invalidate
+        ))
+
+        rows = [
+            {'rank': str(index), 'username': member.display_name, 'joined_at': '20:30 14/03'}
+            for index, member in enumerate(run.guild.members, 1)
+        ]
+        columns = {'rank': '#', 'username': 'Nom', 'joined_at': 'Inscrit le'}
+
+        async def text_table():
+            create_text_table(rows, columns)
+
+        results.append(await measure(run, f"create_text_table_{len(rows)}_rows", text_table, repeat))
+    finally:
+        run.close()
+
+    for result in results:
+        result.update({'members': members, 'events': events, 'participants_per_event': participants})
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_results(results: List[Dict[str, Any]], baseline: Optional[Dict[str, Any]] = None) -> None:
+    previous = {(r['members'], r['benchmark']): r for r in (baseline or {}).get('results', [])}
+    print(f"{'membres':>8}  {'benchmark':<34} {'médiane':>12} {'requêtes':>9}  {'écart':>8}")
+    for result in results:
+        delta = ""
+        before = previous.get((result['members'], result['benchmark']))
+        if before and before['median_ms']:
+            delta = f"{(result['median_ms'] / before['median_ms'] - 1) * 100:+.0f} %"
+        print(
+            f"{result['members']:>8}  {result['benchmark']:<34} {result['median_ms']:>9.2f} ms "
+            f"{result['queries']:>9}  {delta:>8}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks hors ligne de DictaBot")
+    parser.add_argument("--scales", default=DEFAULT_SCALES, help=f"nombres de membres (défaut : {DEFAULT_SCALES})")
+    parser.add_argument("--events", type=int, default=20, help="événements programmés (défaut : 20)")
+    parser.add_argument("--participation", type=float, default=0.05,
+                        help="part des membres inscrite à chaque événement (défaut : 0.05)")
+    parser.add_argument("--burst", type=int, default=200, help="inscriptions temps réel de la rafale (défaut : 200)")
+    parser.add_argument("--repeat", type=int, default=5, help="répétitions des mesures rapides (défaut : 5)")
+    parser.add_argument("--output", type=Path, help="fichier JSON de résultats")
+    parser.add_argument("--compare", type=Path, help="résultats précédents à comparer")
+    args = parser.parse_args()
+
+    # Seuls les avertissements du bot sont affichés pendant les mesures
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results: List[Dict[str, Any]] = []
+    for members in (int(scale) for scale in args.scales.split(",")):
+        print(f"⏱️ Échelle {members} membres...", flush=True)
+        results.extend(asyncio.run(run_scale(members, args.events, args.participation, args.burst, args.repeat)))
+
+    commit = _git_commit()
+    report = {
+        'commit': commit,
+        'created_at': datetime.now().isoformat(timespec="seconds"),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'parameters': {key: value for key, value in vars(args).items() if key not in ('output', 'compare')},
+        'results': results,
+    }
+    output = args.output or RESULTS_DIR / f"bench_{datetime.now():%Y-%m-%d_%H-%M-%S}_{commit or 'local'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else None
+    _print_results(results, baseline)
+    print(f"📁 Résultats : {output}")
+
+
+if __name__ == "__main__":
+    main()
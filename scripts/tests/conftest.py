@@ -0,0 +1,61 @@
+"""
+Fixtures communes : guild factice et base SQLite temporaire des benchmarks.
+"""
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, Iterator, List
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+sys.path.insert(0, str(REPO_ROOT / "scripts" / "benchmarks"))
+
+import bot.core.database as database  # noqa: E402
+import bot.infrastructure.unit_of_work_impl as unit_of_work_impl  # noqa: E402
+from bot.core.logging_config import stop_logging  # noqa: E402
+from bot.core.interfaces.unit_of_work import UnitOfWork  # noqa: E402
+from bot.infrastructure.render_cache import render_cache  # noqa: E402
+from run_benchmarks import BenchmarkRun  # noqa: E402
+
+
+@pytest.fixture
+def bench_run() -> Iterator[Callable[..., BenchmarkRun]]:
+    """Construit des guilds factices sur base temporaire ; le moteur du bot est restauré ensuite"""
+    engines = (database.db_engine, unit_of_work_impl.db_engine)
+    runs: List[BenchmarkRun] = []
+
+    def factory(members: int, events: int, participants: int) -> BenchmarkRun:
+        run = BenchmarkRun(members, events, participants)
+        runs.append(run)
+        return run
+
+    render_cache.invalidate()
+    try:
+        yield factory
+    finally:
+        for run in runs:
+            run.close()
+        database.db_engine, unit_of_work_impl.db_engine = engines
+        render_cache.invalidate()
+
+
+@pytest.fixture
+def uow_factory() -> Iterator[Callable[[], UnitOfWork]]:
+    """Unités de travail sur une base temporaire vide ; le moteur du bot est restauré ensuite"""
+    engines = (database.db_engine, unit_of_work_impl.db_engine)
+    with tempfile.TemporaryDirectory(prefix="dictabot-test-") as tmp_dir:
+        engine = database.DatabaseEngine(Path(tmp_dir) / "test.db")
+        database.db_engine = unit_of_work_impl.db_engine = engine
+        engine.create_tables()
+        try:
+            yield unit_of_work_impl.create_unit_of_work
+        finally:
+            engine.close()
+            database.db_engine, unit_of_work_impl.db_engine = engines
+
+
+def pytest_sessionfinish(session, exitstatus) -> None:
+    # Vide les logs du bot tant que la sortie capturée par pytest est encore ouverte
+    stop_logging()
@@ -0,0 +1,26 @@
+"""
+Recherche des jeux par nom : normalisation et correspondance approchée.
+"""
+from bot.core.utils import normalize_name
+
+
+def test_normalize_name_keeps_non_latin_letters():
+    assert normalize_name("ÉLDEN-Ring") == "elden ring"
+    assert normalize_name("原神") == "原神"
+    assert normalize_name("Ведьмак 3") == "ведьмак 3"
+    assert normalize_name("!!!") == ""
+
+
+def test_get_by_name_distinguishes_non_latin_games(uow_factory):
+    with uow_factory() as uow:
+        uow.games.create_game("原神")
+        uow.games.create_game("Ведьмак")
+
+    with uow_factory() as uow:
+        assert uow.games.get_by_name("原神").name == "原神"
+        # Correspondance approchée : casse ignorée
+        assert uow.games.get_by_name("ВЕДЬМАК").name == "Ведьмак"
+        # Un autre titre non latin ne correspond à aucun jeu suivi
+        assert uow.games.get_by_name("崩壊") is None
+        assert uow.games.get_by_name("!!!") is None
+        assert [game.name for game, _ in uow.games.search_by_name("ведьмак")] == ["Ведьмак"]
@@ -0,0 +1,44 @@
+"""
+Ordonnanceur HTTP : ordre de service des voies de priorité sous limitation.
+"""
+import asyncio
+
+from bot.infrastructure.http_scheduler import HttpScheduler, RequestPriority
+
+
+async def test_token_goes_to_highest_priority_waiting_when_available():
+    scheduler = HttpScheduler()
+    scheduler.register_api("api", rate=20.0, burst=1)
+    lane = scheduler._get_lane("api")
+    served = []
+
+    async def acquire(name: str, priority: RequestPriority) -> None:
+        await scheduler._acquire(lane, priority)
+        served.append(name)
+
+    try:
+        await acquire("first", RequestPriority.BACKGROUND)  # Consomme la rafale
+        background = asyncio.ensure_future(acquire("background", RequestPriority.BACKGROUND))
+        await asyncio.sleep(0.01)  # La requête d'arrière-plan attend le jeton suivant
+        interactive = asyncio.ensure_future(acquire("interactive", RequestPriority.INTERACTIVE))
+        await asyncio.gather(background, interactive)
+    finally:
+        await scheduler.close()
+
+    assert served == ["first", "interactive", "background"]
+
+
+async def test_cancelled_request_does_not_consume_token():
+    scheduler = HttpScheduler()
+    scheduler.register_api("api", rate=5.0, burst=1)  # Un jeton toutes les 200 ms
+    lane = scheduler._get_lane("api")
+    try:
+        await scheduler._acquire(lane, RequestPriority.BACKGROUND)
+        cancelled = asyncio.ensure_future(scheduler._acquire(lane, RequestPriority.BACKGROUND))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        await asyncio.sleep(0.25)  # Jeton obtenu sans requête à servir : il est restitué
+        assert lane.bucket.tokens >= 1
+        await asyncio.wait_for(scheduler._acquire(lane, RequestPriority.BACKGROUND), timeout=0.05)
+    finally:
+        await scheduler.close()
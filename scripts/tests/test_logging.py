@@ -0,0 +1,25 @@
+"""
+Logs structurés : champs conservés au passage par la file de logs.
+"""
+import json
+import logging
+import queue
+import sys
+
+from bot.core.logging_config import DroppingQueueHandler, JsonFormatter
+
+
+def test_json_log_keeps_traceback_separate_from_message():
+    handler = DroppingQueueHandler(queue.Queue())
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        record = logging.LogRecord(
+            "DictaBot", logging.ERROR, __file__, 0, "💥 [SYNC] Échec %s", ("guild",), sys.exc_info()
+        )
+    handler.handle(record)
+
+    entry = json.loads(JsonFormatter().format(handler.queue.get_nowait()))
+    assert entry["message"] == "💥 [SYNC] Échec guild"
+    assert entry["component"] == "sync"
+    assert entry["exc_info"].splitlines()[-1] == "ZeroDivisionError: division by zero"
@@ -0,0 +1,58 @@
+"""
+Budgets de requêtes SQL des chemins critiques (guild factice, base temporaire).
+
+Un dépassement signale une régression : requête ajoutée dans une boucle,
+chargement paresseux déclenché par un rendu, cache contourné…
+"""
+from bot.infrastructure.query_monitor import assert_max_queries, assert_no_n_plus_one
+from bot.infrastructure.render_cache import render_cache
+from fake_discord import FakeContext
+
+MEMBERS = 1000
+# Moins d'événements que le seuil de N+1 : seules les répétitions par membre sont signalées
+EVENTS = 5
+PARTICIPANTS = 200
+
+LIST_EVENTS_MAX_QUERIES = 1
+EVENT_DETAIL_MAX_QUERIES = 1
+# Événements et utilisateurs lus en une requête, puis inscrits de chaque événement
+SYNC_UNCHANGED_MAX_QUERIES = EVENTS + 2
+
+
+async def test_sync_guild_cold_has_no_n_plus_one(bench_run):
+    run = bench_run(MEMBERS, EVENTS, PARTICIPANTS)
+    with assert_no_n_plus_one(name="sync_guild_cold") as stats:
+        await run.sync_service.sync_guild(run.bot, run.guild)
+    assert stats.count > 0
+
+
+async def test_sync_guild_unchanged_budget(bench_run):
+    run = bench_run(MEMBERS, EVENTS, PARTICIPANTS)
+    await run.sync_service.sync_guild(run.bot, run.guild)
+    with assert_max_queries(SYNC_UNCHANGED_MAX_QUERIES, "sync_guild_unchanged"):
+        await run.sync_service.sync_guild(run.bot, run.guild)
+
+
+async def test_list_events_budget(bench_run):
+    run = bench_run(MEMBERS, EVENTS, PARTICIPANTS)
+    await run.sync_service.sync_guild(run.bot, run.guild)
+    ctx = FakeContext(run.guild)
+    render_cache.invalidate()
+    with assert_max_queries(LIST_EVENTS_MAX_QUERIES, "list_events"):
+        await run.events_cog.list_events.callback(run.events_cog, ctx)
+    assert ctx.sent > 0
+
+    # Rendu suivant servi par le cache
+    with assert_max_queries(0, "list_events_cached"):
+        await run.events_cog.list_events.callback(run.events_cog, ctx)
+
+
+async def test_event_detail_budget(bench_run):
+    run = bench_run(MEMBERS, EVENTS, PARTICIPANTS)
+    await run.sync_service.sync_guild(run.bot, run.guild)
+    ctx = FakeContext(run.guild)
+    largest = max(run.guild.scheduled_events, key=lambda e: len(e.participants))
+    render_cache.invalidate()
+    with assert_max_queries(EVENT_DETAIL_MAX_QUERIES, "event_detail"):
+        await run.events_cog.event_detail.callback(run.events_cog, ctx, largest.id)
+    assert ctx.sent > 0
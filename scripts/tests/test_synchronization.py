@@ -0,0 +1,41 @@
+"""
+Synchronisation : pages de l'API Discord comptées dans les statistiques.
+"""
+from types import SimpleNamespace
+
+import discord
+
+PARTICIPANTS = 250  # Trois pages de 100 participants
+
+
+async def test_participant_pages_match_api_calls(bench_run):
+    run = bench_run(1000, 1, PARTICIPANTS)
+    discord_event = run.guild.scheduled_events[0]
+    participants, _, pages = await run.sync_service._collect_event_participants(discord_event)
+    assert len(participants) == PARTICIPANTS
+    assert pages == discord_event.api_calls == 3
+
+
+async def test_participant_pages_stop_at_http_error(bench_run):
+    run = bench_run(1000, 1, PARTICIPANTS)
+    discord_event = run.guild.scheduled_events[0]
+    users = discord_event.users
+
+    async def failing_users(limit=None):
+        # La troisième page échoue après deux pages reçues
+        async for index, user in _enumerate(users(limit)):
+            if index == 200:
+                raise discord.HTTPException(SimpleNamespace(status=500, reason="Server Error"), "boom")
+            yield user
+
+    discord_event.users = failing_users
+    participants, _, pages = await run.sync_service._collect_event_participants(discord_event)
+    assert len(participants) == 200
+    assert pages == 2
+
+
+async def _enumerate(iterator):
+    index = 0
+    async for item in iterator:
+        yield index, item
+        index += 1
@@ -23,6 +23,10 @@ DISCORD_PREFIX: str = os.getenv("DISCORD_PREFIX", "$")
 LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 LOGS_DIR: Path = DATA_DIR / "logs"
 LOG_RETENTION_DAYS: int = int(os.getenv("LOG_RETENTION_DAYS", "7"))  # Rétention des logs 7 jours
+LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text").lower()  # "text" ou "json" (une ligne JSON par log)
+# Répétitions d'une même requête SQL signalées comme N+1 probable (0 = désactivé, actif par défaut en DEBUG)
+SQL_N_PLUS_ONE_THRESHOLD: int = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "10" if LOG_LEVEL == "DEBUG" else "0"))
+LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))  # Taille max de la file de logs (au-delà : messages perdus)
 
 # Configuration des cogs
 COGS_DIR: str = "src.cogs"
@@ -34,12 +38,60 @@ PARIS_TZ = pytz.timezone(PARIS_TIMEZONE)
 # Configuration des APIs externes
 CHEAPSHARK_API_URL = "https://www.cheapshark.com/api/1.0"
 
+# Limitation de débit des requêtes sortantes (requêtes/s, rafale, nombre de nouvels essais)
+CHEAPSHARK_RATE_LIMIT = float(os.getenv("CHEAPSHARK_RATE_LIMIT", "1"))
+CHEAPSHARK_BURST = int(os.getenv("CHEAPSHARK_BURST", "3"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+
+# Taille de page demandée à CheapShark pour les recherches (60 maximum)
+CHEAPSHARK_SEARCH_PAGE_SIZE = int(os.getenv("CHEAPSHARK_SEARCH_PAGE_SIZE", "60"))
+
 # Configuration des canaux Discord
 ANNOUNCE_CHANNEL_ID = int(os.getenv("ANNOUNCE_CHANNEL_ID", "0")) or None
+PRICE_ALERT_CHANNEL_ID = int(os.getenv("PRICE_ALERT_CHANNEL_ID", "0")) or None
+
+# Annonce hebdomadaire automatique : jour (0 = lundi ... 6 = dimanche, -1 = désactivée) et heure de Paris
+ANNOUNCE_WEEKDAY = int(os.getenv("ANNOUNCE_WEEKDAY", "-1"))
+ANNOUNCE_TIME = os.getenv("ANNOUNCE_TIME", "18:00")
+# Retard maximal (heures) pour rattraper une annonce manquée pendant un arrêt du bot
+ANNOUNCE_CATCH_UP_HOURS = int(os.getenv("ANNOUNCE_CATCH_UP_HOURS", "12"))
 
 # Synchronisation périodique (secondes) - 0 pour désactiver
 SYNC_INTERVAL_SECONDS = int(os.getenv("SYNC_INTERVAL_SECONDS", "3600"))
 
+# Rappels aux participants N minutes avant le début d'un événement (0 = désactivés)
+REMINDER_MINUTES_BEFORE = int(os.getenv("REMINDER_MINUTES_BEFORE", "0"))
+# Canal des rappels (mentions groupées) ; sans canal, les rappels sont envoyés en message privé
+REMINDER_CHANNEL_ID = int(os.getenv("REMINDER_CHANNEL_ID", "0")) or None
+
+# Archivage des événements terminés (secondes) - 0 pour désactiver
+ARCHIVE_INTERVAL_SECONDS = int(os.getenv("ARCHIVE_INTERVAL_SECONDS", "3600"))
+
+# Rafraîchissement des prix des jeux suivis (secondes) - 0 pour désactiver
+DEALS_REFRESH_INTERVAL_SECONDS = int(os.getenv("DEALS_REFRESH_INTERVAL_SECONDS", "21600"))
+
+# Rafraîchissement de la liste des stores CheapShark (secondes)
+STORES_REFRESH_INTERVAL_SECONDS = int(os.getenv("STORES_REFRESH_INTERVAL_SECONDS", "86400"))
+
+# Historique des prix : un relevé par jour au-delà de N jours, suppression au-delà de M jours (0 = jamais)
+PRICE_HISTORY_DOWNSAMPLE_DAYS = int(os.getenv("PRICE_HISTORY_DOWNSAMPLE_DAYS", "30"))
+PRICE_HISTORY_RETENTION_DAYS = int(os.getenv("PRICE_HISTORY_RETENTION_DAYS", "730"))
+
+# Métriques : endpoint HTTP local au format Prometheus (port 0 = désactivé)
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+# Intervalle de mesure du retard de la boucle asyncio (secondes)
+LOOP_LAG_INTERVAL_SECONDS = float(os.getenv("LOOP_LAG_INTERVAL_SECONDS", "1"))
+# Blocage de la boucle au-delà duquel la pile d'appels est journalisée (secondes, 0 = désactivé)
+LOOP_STALL_THRESHOLD_SECONDS = float(os.getenv("LOOP_STALL_THRESHOLD_SECONDS", "0.5"))
+# Mode debug asyncio : signale chaque callback plus long que le seuil (coûteux, pour le diagnostic)
+ASYNCIO_DEBUG = os.getenv("ASYNCIO_DEBUG", "0").lower() in ("1", "true", "yes")
+
+# Profilage à la demande ($profile) : "cprofile" (déterministe) ou "sampling" (échantillonnage)
+PROFILER_MODE = os.getenv("PROFILER_MODE", "cprofile").lower()
+PROFILE_SAMPLING_INTERVAL_MS = float(os.getenv("PROFILE_SAMPLING_INTERVAL_MS", "5"))
+PROFILE_RETENTION_DAYS = int(os.getenv("PROFILE_RETENTION_DAYS", "7"))  # Rétention des profils dans data/profiles
+
 # Cooldown inscriptions/désinscriptions (secondes) - 0 pour désactiver
 SUBSCRIPTION_COOLDOWN_SECONDS = int(os.getenv("SUBSCRIPTION_COOLDOWN_SECONDS", "600"))
 
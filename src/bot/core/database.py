@@ -1,12 +1,51 @@
 """Gestion du moteur de base de données SQLAlchemy"""
 import logging
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker, Session
 from bot.core.config import DB_PATH_SQLITE, LOG_LEVEL
+from bot.core.utils import normalize_name
 
 logger = logging.getLogger(__name__)
 
+# Index plein texte trigramme (FTS5) sur les noms normalisés des jeux,
+# maintenu par triggers à partir de la table games
+GAMES_FTS_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS games_fts USING fts5(
+        normalized_name, content='games', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS games_fts_ai AFTER INSERT ON games BEGIN
+        INSERT INTO games_fts(rowid, normalized_name) VALUES (new.id, new.normalized_name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS games_fts_ad AFTER DELETE ON games BEGIN
+        INSERT INTO games_fts(games_fts, rowid, normalized_name) VALUES ('delete', old.id, old.normalized_name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS games_fts_au AFTER UPDATE OF normalized_name ON games BEGIN
+        INSERT INTO games_fts(games_fts, rowid, normalized_name) VALUES ('delete', old.id, old.normalized_name);
+        INSERT INTO games_fts(rowid, normalized_name) VALUES (new.id, new.normalized_name);
+    END""",
+]
+
+# Reconstruction des agrégats de participation à partir de l'historique
+# (participations actives et archivées), pour une base antérieure aux agrégats
+_ALL_PARTICIPATIONS = """
+    SELECT event_discord_id, user_discord_id, joined_at FROM event_participations
+    UNION ALL
+    SELECT event_discord_id, user_discord_id, joined_at FROM event_participations_archive
+"""
+ATTENDANCE_BACKFILL_SQL = [
+    f"""INSERT INTO attendance_monthly (user_discord_id, month, signups, cancellations)
+        SELECT user_discord_id, strftime('%Y-%m', joined_at), COUNT(*), 0
+        FROM ({_ALL_PARTICIPATIONS})
+        GROUP BY user_discord_id, strftime('%Y-%m', joined_at)""",
+    f"""INSERT INTO attendance_event_type (event_type, month, signups, cancellations)
+        SELECT COALESCE(events.event_type, 'unknown'), strftime('%Y-%m', p.joined_at), COUNT(*), 0
+        FROM ({_ALL_PARTICIPATIONS}) AS p
+        LEFT JOIN events ON events.discord_id = p.event_discord_id
+        GROUP BY COALESCE(events.event_type, 'unknown'), strftime('%Y-%m', p.joined_at)""",
+]
+
 
 class DatabaseEngine:
     """Gestionnaire du moteur de base de données"""
@@ -15,6 +54,7 @@ class DatabaseEngine:
         self.db_path = db_path
         self.engine = None
         self.SessionLocal = None
+        self.fts_enabled = False
         self._setup_database()
     
     def _setup_database(self):
@@ -55,8 +95,77 @@ class DatabaseEngine:
         """Crée toutes les tables"""
         from bot.domain.entities import Base
         Base.metadata.create_all(bind=self.engine)
+        self._add_missing_columns(Base.metadata)
+        self._setup_game_search_index()
+        self._setup_attendance_stats()
         logger.info("✅ [DATABASE] Tables créées")
     
+    def _add_missing_columns(self, metadata):
+        """
+        Ajoute les colonnes et index apparus dans les entités sur les tables existantes.
+        
+        create_all ne modifie pas les tables déjà présentes : sans outil de migration,
+        les nouvelles colonnes sont ajoutées via ALTER TABLE (elles doivent être nullables).
+        """
+        inspector = inspect(self.engine)
+        with self.engine.begin() as connection:
+            for table in metadata.sorted_tables:
+                if not inspector.has_table(table.name):
+                    continue
+                
+                existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+                missing_columns = [column for column in table.columns if column.name not in existing_columns]
+                
+                for column in missing_columns:
+                    column_type = column.type.compile(dialect=self.engine.dialect)
+                    connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                    logger.info(f"🔧 [DATABASE] Colonne ajoutée : {table.name}.{column.name}")
+                
+                existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+                for index in table.indexes:
+                    if index.name not in existing_indexes:
+                        index.create(bind=connection, checkfirst=True)
+                        logger.info(f"🔧 [DATABASE] Index ajouté : {index.name}")
+    
+    def _setup_game_search_index(self):
+        """Renseigne les noms normalisés manquants et crée l'index trigramme des jeux"""
+        with self.engine.begin() as connection:
+            # Noms vides : titres non latins normalisés avant la conservation de toutes les écritures
+            rows = connection.execute(
+                text("SELECT id, name FROM games WHERE normalized_name IS NULL OR normalized_name = ''")
+            ).fetchall()
+            for game_id, name in rows:
+                connection.execute(
+                    text("UPDATE games SET normalized_name = :normalized WHERE id = :id"),
+                    {"normalized": normalize_name(name), "id": game_id}
+                )
+        
+        try:
+            with self.engine.begin() as connection:
+                index_exists = connection.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'games_fts'")
+                ).first() is not None
+                for statement in GAMES_FTS_DDL:
+                    connection.execute(text(statement))
+                if rows or not index_exists:
+                    connection.execute(text("INSERT INTO games_fts(games_fts) VALUES ('rebuild')"))
+            self.fts_enabled = True
+        except OperationalError as e:
+            # SQLite < 3.34 : pas de tokenizer trigramme, recherche par LIKE
+            self.fts_enabled = False
+            logger.warning(f"⚠️ [DATABASE] Index trigramme indisponible, recherche dégradée : {e}")
+    
+    def _setup_attendance_stats(self):
+        """Reconstruit les agrégats de participation s'ils sont vides alors qu'un historique existe"""
+        with self.engine.begin() as connection:
+            if connection.execute(text("SELECT 1 FROM attendance_monthly LIMIT 1")).first() is not None:
+                return
+            if connection.execute(text(f"SELECT 1 FROM ({_ALL_PARTICIPATIONS}) LIMIT 1")).first() is None:
+                return
+            for statement in ATTENDANCE_BACKFILL_SQL:
+                connection.execute(text(statement))
+        logger.info("🔧 [DATABASE] Agrégats de participation reconstruits depuis l'historique")
+    
     def close(self):
         """Ferme le moteur de base de données"""
         if self.engine:
@@ -1,6 +1,6 @@
 """Interfaces (abstractions) pour les repositories"""
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List, Tuple
 from datetime import datetime
 
 
@@ -41,11 +41,21 @@ class UserRepository(Repository):
         """Récupère un utilisateur par son ID Discord"""
         pass
     
+    @abstractmethod
+    def get_by_discord_ids(self, discord_ids: Iterable[str]) -> Dict[str, Any]:
+        """Récupère plusieurs utilisateurs par ID Discord (ID Discord -> utilisateur), sans requête par utilisateur"""
+        pass
+    
     @abstractmethod
     def get_or_create_by_discord_id(self, discord_id: str, username: str, official_name: str = None):
         """Récupère ou crée un utilisateur par son ID Discord"""
         pass
     
+    @abstractmethod
+    def create_many(self, usernames: Dict[str, str]) -> int:
+        """Crée des utilisateurs (ID Discord -> nom) en une requête"""
+        pass
+    
     @abstractmethod
     def update_username(self, discord_id: str, new_name: str):
         """Met à jour le nom d'un utilisateur"""
@@ -66,7 +76,7 @@ class EventRepository(Repository):
         pass
     
     @abstractmethod
-    def create_by_discord_id(self, discord_id: str, name: str):
+    def create_by_discord_id(self, discord_id: str, name: str, event_type: Optional[str] = None):
         """Crée un événement avec un ID Discord"""
         pass
     
@@ -75,6 +85,16 @@ class EventRepository(Repository):
         """Met à jour le nom d'un événement"""
         pass
     
+    @abstractmethod
+    def mark_as_archived(self, participant_counts: Dict[str, int]) -> int:
+        """Marque les événements (ID Discord -> nombre de participants) comme passés et archivés, en une requête"""
+        pass
+    
+    @abstractmethod
+    def reactivate(self, event: Any):
+        """Annule l'archivage d'un événement de nouveau programmé sur Discord"""
+        pass
+    
     @abstractmethod
     def mark_as_passed(self, discord_id: str):
         """Marque un événement comme terminé"""
@@ -89,15 +109,50 @@ class ParticipationRepository(Repository):
         """Récupère les participations d'un événement"""
         pass
     
+    @abstractmethod
+    def count_by_events(self, event_discord_ids: List[str]) -> Dict[str, int]:
+        """Compte les participants de plusieurs événements en une requête"""
+        pass
+    
+    @abstractmethod
+    def get_participants_detail(self, event_discord_id: str) -> List[Tuple[str, Optional[str], datetime]]:
+        """Récupère (user_discord_id, username, joined_at) des participants, triés par date d'inscription"""
+        pass
+    
+    @abstractmethod
+    def get_by_user(self, user_discord_id: str, event_discord_ids: Optional[List[str]] = None) -> List[Tuple[str, datetime]]:
+        """Récupère (event_discord_id, joined_at) des inscriptions d'un utilisateur, éventuellement restreintes à des événements"""
+        pass
+    
+    @abstractmethod
+    def archive_by_events(self, event_discord_ids: List[str]) -> int:
+        """Déplace les participations des événements donnés vers la table d'archive"""
+        pass
+    
+    @abstractmethod
+    def restore_by_events(self, event_discord_ids: List[str]) -> int:
+        """Ramène les participations archivées des événements donnés dans la table active"""
+        pass
+    
     @abstractmethod
     def create_participation(self, event_discord_id: str, user_discord_id: str):
         """Crée une participation"""
         pass
     
+    @abstractmethod
+    def create_participations(self, event_discord_id: str, user_discord_ids: Iterable[str]) -> int:
+        """Crée les participations d'un événement en une requête"""
+        pass
+    
     @abstractmethod
     def remove_participation(self, event_discord_id: str, user_discord_id: str):
         """Supprime une participation"""
         pass
+    
+    @abstractmethod
+    def remove_participations(self, event_discord_id: str, user_discord_ids: Iterable[str]) -> List[str]:
+        """Supprime des participations d'un événement en un seul flush ; retourne les utilisateurs concernés"""
+        pass
 
 
 class GameRepository(Repository):
@@ -105,13 +160,23 @@ class GameRepository(Repository):
     
     @abstractmethod
     def get_by_name(self, name: str):
-        """Récupère un jeu par son nom"""
+        """Récupère un jeu par son nom (casse, accents et ponctuation ignorés)"""
+        pass
+    
+    @abstractmethod
+    def search_by_name(self, query: str, limit: int = 10) -> List[Tuple[Any, float]]:
+        """Recherche approchée de jeux par nom, triée par score de similarité décroissant"""
         pass
     
     @abstractmethod
     def create_game(self, name: str, steam_id: str = None, epic_id: str = None):
         """Crée un nouveau jeu"""
         pass
+    
+    @abstractmethod
+    def set_alert_price(self, name: str, alert_price: Optional[float]):
+        """Définit le seuil d'alerte de prix d'un jeu"""
+        pass
 
 
 class DealRepository(Repository):
@@ -122,6 +187,11 @@ class DealRepository(Repository):
         """Récupère les promotions d'un jeu"""
         pass
     
+    @abstractmethod
+    def get_by_deal_id(self, deal_id: str):
+        """Récupère une promotion par son ID CheapShark"""
+        pass
+    
     @abstractmethod
     def create_deal(self, game_id: int, deal_id: str, title: str, sale_price: float, 
                    normal_price: float, savings: float, store_id: str, 
@@ -130,6 +200,88 @@ class DealRepository(Repository):
         pass
 
 
+class PriceHistoryRepository(Repository):
+    """Repository pour l'historique des prix"""
+    
+    @abstractmethod
+    def get_latest_by_game(self, game_id: int) -> Dict[str, Any]:
+        """Récupère le dernier relevé de prix de chaque store pour un jeu"""
+        pass
+    
+    @abstractmethod
+    def get_lowest(self, game_id: int):
+        """Récupère le relevé le plus bas jamais observé pour un jeu"""
+        pass
+    
+    @abstractmethod
+    def append(self, game_id: int, store_id: str, sale_price: float,
+               normal_price: float = None, observed_at: datetime = None):
+        """Ajoute un relevé de prix (la table est en ajout seul)"""
+        pass
+    
+    @abstractmethod
+    def downsample(self, before: datetime) -> int:
+        """Ne conserve qu'un relevé par jour, jeu et store (le plus bas) avant la date donnée, ainsi que le dernier relevé de chaque jeu et store"""
+        pass
+    
+    @abstractmethod
+    def purge(self, before: datetime) -> int:
+        """Supprime les relevés antérieurs à la date donnée, sauf le dernier relevé de chaque jeu et store"""
+        pass
+
+
+class StoreRepository(Repository):
+    """Repository pour les stores"""
+    
+    @abstractmethod
+    def upsert_stores(self, stores: List[Dict[str, Any]]) -> int:
+        """Crée ou met à jour les stores (clés : store_id, name, is_active)"""
+        pass
+    
+    @abstractmethod
+    def get_last_update(self) -> Optional[datetime]:
+        """Retourne la date de dernière mise à jour de la liste des stores"""
+        pass
+
+
+class AttendanceStatsRepository(Repository):
+    """Repository pour les agrégats de participation (lecture seule, alimentés par les inscriptions)"""
+    
+    @abstractmethod
+    def get_top_participants(self, month: str, limit: int = 10) -> List[Tuple[str, Optional[str], int, int]]:
+        """Récupère (user_discord_id, username, inscriptions, désinscriptions) des plus inscrits du mois"""
+        pass
+    
+    @abstractmethod
+    def get_user_stats(self, user_discord_id: str, month: Optional[str] = None) -> Tuple[int, int]:
+        """Retourne (inscriptions, désinscriptions) d'un utilisateur pour un mois, ou au total"""
+        pass
+    
+    @abstractmethod
+    def get_by_event_type(self, month: str) -> List[Tuple[str, int, int]]:
+        """Récupère (type d'événement, inscriptions, désinscriptions) du mois"""
+        pass
+
+
+class JobRepository(Repository):
+    """Repository pour les tâches planifiées"""
+    
+    @abstractmethod
+    def get_by_name(self, name: str):
+        """Récupère une tâche planifiée par son nom"""
+        pass
+    
+    @abstractmethod
+    def save_next_run(self, name: str, schedule: str, next_run_at: datetime):
+        """Crée la tâche si besoin et enregistre sa planification et sa prochaine exécution"""
+        pass
+    
+    @abstractmethod
+    def record_run(self, name: str, run_at: datetime, status: str, next_run_at: datetime, error: Optional[str] = None):
+        """Enregistre le résultat d'une exécution et la prochaine échéance"""
+        pass
+
+
 class DatabaseRepository(Repository):
     """Repository pour les opérations générales de base de données"""
     
@@ -142,3 +294,8 @@ class DatabaseRepository(Repository):
     def get_stats(self) -> Dict[str, int]:
         """Récupère les statistiques de la base de données"""
         pass
+    
+    @abstractmethod
+    def get_storage_report(self, statement_counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """État du stockage (fichiers, pages, tables, index et leur utilisation par les requêtes)"""
+        pass
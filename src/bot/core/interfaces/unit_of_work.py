@@ -3,7 +3,8 @@ from abc import ABC, abstractmethod
 from typing import Protocol
 from bot.core.interfaces.repository import (
     UserRepository, EventRepository, ParticipationRepository,
-    GameRepository, DealRepository, DatabaseRepository
+    GameRepository, DealRepository, PriceHistoryRepository, StoreRepository,
+    AttendanceStatsRepository, JobRepository, DatabaseRepository
 )
 
 
@@ -16,6 +17,10 @@ class UnitOfWork(Protocol):
     participations: ParticipationRepository
     games: GameRepository
     deals: DealRepository
+    price_history: PriceHistoryRepository
+    stores: StoreRepository
+    attendance: AttendanceStatsRepository
+    jobs: JobRepository
     database: DatabaseRepository
     
     def __enter__(self):
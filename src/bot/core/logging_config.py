@@ -1,11 +1,110 @@
 """
 Configuration du logging pour le bot Discord.
+
+Les handlers (fichier et console) sont exécutés par un QueueListener sur un
+thread dédié : la boucle asyncio ne fait que déposer les enregistrements dans
+une file bornée. Si la file est pleine, l'enregistrement est abandonné et
+compté plutôt que de bloquer la boucle.
+
+Avec LOG_FORMAT=json, chaque ligne est un objet JSON portant, en plus du
+message, les champs standard passés via `extra` (component, guild, event_id,
+duration_ms, rows_changed) : les durées peuvent être agrégées hors ligne.
 """
+import atexit
+import copy
+import json
 import logging
-from datetime import datetime, timedelta
+import queue
+import re
+from datetime import datetime, timedelta, timezone
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Any, Dict
+
+from bot.core.config import LOGS_DIR, LOG_FORMAT, LOG_RETENTION_DAYS, LOG_QUEUE_SIZE, PARIS_TZ
+
+# Champs standard des logs structurés
+LOG_FIELDS = ("component", "guild", "event_id", "duration_ms", "rows_changed")
+STRUCTURED_LOGS = LOG_FORMAT == "json"
+
+# Attributs propres à LogRecord : tout autre attribut provient de `extra`
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+# Mise en forme des tracebacks avant leur passage dans la file
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+# Préfixe "[TAG]" des messages, utilisé comme composant par défaut
+_COMPONENT_TAG = re.compile(r"\[([A-Z][A-Z0-9_-]*)\]")
 
-from bot.core.config import LOGS_DIR, LOG_RETENTION_DAYS, PARIS_TZ
+
+class JsonFormatter(logging.Formatter):
+    """Une ligne JSON par enregistrement, avec les champs standard et supplémentaires présents"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": message,
+        }
+        for field in LOG_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and key not in entry:
+                entry[key] = value  # Champs supplémentaires (ex : command, status)
+        if "component" not in entry:
+            match = _COMPONENT_TAG.search(message)
+            if match:
+                entry["component"] = match.group(1).lower()
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler non bloquant : compte les enregistrements perdus quand la file est pleine"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._unreported = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self._unreported:
+                # Signaler les pertes dès que la file a de nouveau de la place
+                self.queue.put_nowait(self._drop_report())
+                self._unreported = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self._unreported += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Copie déposée dans la file : message et arguments conservés, traceback
+        déjà formaté dans `exc_text` (les frames ne traversent pas la file).
+        
+        Le QueueHandler standard fusionne le traceback dans le message, ce qui
+        le retirerait du champ `exc_info` des logs JSON.
+        """
+        record = copy.copy(record)
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def _drop_report(self) -> logging.LogRecord:
+        return logging.LogRecord(
+            "DictaBot", logging.WARNING, __file__, 0,
+            "⚠️ [LOGS] %d message(s) de log perdu(s) (file pleine)", (self._unreported,), None,
+        )
 
 
 def _get_session_log_path() -> Path:
@@ -16,8 +115,8 @@ def _get_session_log_path() -> Path:
     return LOGS_DIR / filename
 
 
-def _cleanup_old_logs() -> None:
-    """Supprime les fichiers de log plus anciens que LOG_RETENTION_DAYS."""
+def cleanup_old_logs() -> None:
+    """Supprime les fichiers de log plus anciens que LOG_RETENTION_DAYS (lancé en tâche de fond par le bot)."""
     if not LOGS_DIR.exists():
         return
     cutoff = datetime.now(PARIS_TZ) - timedelta(days=LOG_RETENTION_DAYS)
@@ -46,19 +145,39 @@ for handler in root_logger.handlers[:]:
 # Chemin du fichier de log pour cette session
 _session_log_path = _get_session_log_path()
 
-# Configuration propre du logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(_session_log_path, encoding="utf-8"),
-        logging.StreamHandler(),
-    ],
-    force=True,
-)
-
-# Nettoyage des anciens logs (après config du logger)
-_cleanup_old_logs()
+# Handlers d'écriture, exécutés sur le thread du QueueListener
+_formatter = JsonFormatter() if STRUCTURED_LOGS else logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+_output_handlers = [
+    logging.FileHandler(_session_log_path, encoding="utf-8"),
+    logging.StreamHandler(),
+]
+for _handler in _output_handlers:
+    _handler.setFormatter(_formatter)
+
+# Seul le QueueHandler (non bloquant) est attaché au logger racine
+_queue_handler = DroppingQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+_listener = QueueListener(_queue_handler.queue, *_output_handlers, respect_handler_level=True)
+_listener.start()
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler], force=True)
+
+
+def get_dropped_log_count() -> int:
+    """Nombre d'enregistrements de log perdus depuis le démarrage (file pleine)"""
+    return _queue_handler.dropped
+
+
+def stop_logging() -> None:
+    """Vide la file de logs et arrête le thread d'écriture"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        for handler in _output_handlers:
+            handler.flush()
+
+
+atexit.register(stop_logging)
 
 # Configuration spécifique pour Discord.py (moins verbeux)
 logging.getLogger("discord").setLevel(logging.WARNING)
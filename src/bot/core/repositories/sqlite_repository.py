@@ -2,18 +2,41 @@
 Repositories SQLite pour l'accès aux données
 """
 import logging
-from typing import Dict, Any, Optional, List
+import os
+import re
+from difflib import SequenceMatcher
+from typing import Dict, Any, Iterable, Optional, List, Tuple
 from datetime import datetime
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy import case, text, func, insert, literal, select
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.orm import Session, aliased
 from bot.core.interfaces.repository import (
     UserRepository, EventRepository, ParticipationRepository,
-    GameRepository, DealRepository, DatabaseRepository
+    GameRepository, DealRepository, PriceHistoryRepository, StoreRepository,
+    AttendanceStatsRepository, JobRepository, DatabaseRepository
+)
+from bot.core.utils import normalize_name
+from bot.domain.entities import (
+    User, Event, EventParticipation, ArchivedParticipation, Game, Deal, PriceHistory, Store,
+    MonthlyAttendance, EventTypeAttendance, ScheduledJob
 )
-from bot.domain.entities import User, Event, EventParticipation, Game, Deal
 
 logger = logging.getLogger(__name__)
 
+# Détail d'EXPLAIN QUERY PLAN : index utilisé, ou parcours complet d'une table
+_PLAN_INDEX = re.compile(r"USING (?:COVERING )?INDEX (\S+)")
+_PLAN_FULL_SCAN = re.compile(r"^SCAN (?:TABLE )?(\S+)")
+_EXPLAINABLE = ("SELECT", "UPDATE", "DELETE", "WITH")
+
+# Identifiants par requête IN (sous la limite historique de 999 paramètres de SQLite)
+IN_BATCH_SIZE = 500
+
+
+def _batches(values: Iterable[str]) -> Iterable[List[str]]:
+    values = list(values)
+    for start in range(0, len(values), IN_BATCH_SIZE):
+        yield values[start:start + IN_BATCH_SIZE]
+
 
 class SQLiteUserRepository(UserRepository):
     """Repository SQLite pour les utilisateurs"""
@@ -30,6 +53,15 @@ class SQLiteUserRepository(UserRepository):
     def get_by_discord_id(self, discord_id: str) -> Optional[User]:
         return self.session.query(User).filter(User.discord_id == discord_id).first()
     
+    def get_by_discord_ids(self, discord_ids: Iterable[str]) -> Dict[str, User]:
+        users: Dict[str, User] = {}
+        for batch in _batches(discord_ids):
+            users.update(
+                (user.discord_id, user)
+                for user in self.session.query(User).filter(User.discord_id.in_(batch))
+            )
+        return users
+    
     def get_or_create_by_discord_id(self, discord_id: str, username: str, official_name: str = None) -> User:
         user = self.get_by_discord_id(discord_id)
         if not user:
@@ -47,6 +79,16 @@ class SQLiteUserRepository(UserRepository):
                 user.updated_at = datetime.utcnow()
         return user
     
+    def create_many(self, usernames: Dict[str, str]) -> int:
+        if not usernames:
+            return 0
+        # INSERT en masse (executemany) : une requête quel que soit le nombre d'utilisateurs
+        self.session.execute(insert(User), [
+            {'discord_id': discord_id, 'username': username, 'official_name': username}
+            for discord_id, username in usernames.items()
+        ])
+        return len(usernames)
+    
     def create(self, entity: User) -> User:
         self.session.add(entity)
         self.session.flush()
@@ -96,8 +138,8 @@ class SQLiteEventRepository(EventRepository):
         self.session.flush()
         return entity
     
-    def create_by_discord_id(self, discord_id: str, name: str) -> Event:
-        event = Event(discord_id=discord_id, name=name)
+    def create_by_discord_id(self, discord_id: str, name: str, event_type: Optional[str] = None) -> Event:
+        event = Event(discord_id=discord_id, name=name, event_type=event_type)
         self.session.add(event)
         self.session.flush()
         return event
@@ -115,6 +157,27 @@ class SQLiteEventRepository(EventRepository):
             self.session.flush()
         return event
     
+    def mark_as_archived(self, participant_counts: Dict[str, int]) -> int:
+        if not participant_counts:
+            return 0
+        # UPDATE en masse : aucun événement n'est chargé en mémoire
+        now = datetime.utcnow()
+        return self.session.query(Event).filter(
+            Event.discord_id.in_(list(participant_counts))
+        ).update({
+            Event.is_passed: True,
+            Event.participant_count: case(participant_counts, value=Event.discord_id, else_=0),
+            Event.archived_at: now,
+            Event.updated_at: now,
+        }, synchronize_session=False)
+    
+    def reactivate(self, event: Event) -> Event:
+        event.is_passed = False
+        event.archived_at = None
+        event.updated_at = datetime.utcnow()
+        self.session.flush()
+        return event
+    
     def mark_as_passed(self, discord_id: str) -> Optional[Event]:
         event = self.get_by_discord_id(discord_id)
         if event:
@@ -148,11 +211,83 @@ class SQLiteParticipationRepository(ParticipationRepository):
             EventParticipation.event_discord_id == event_discord_id
         ).all()
     
+    def count_by_events(self, event_discord_ids: List[str]) -> Dict[str, int]:
+        if not event_discord_ids:
+            return {}
+        rows = self.session.query(
+            EventParticipation.event_discord_id,
+            func.count(EventParticipation.id)
+        ).filter(
+            EventParticipation.event_discord_id.in_(event_discord_ids)
+        ).group_by(EventParticipation.event_discord_id).all()
+        return {event_id: count for event_id, count in rows}
+    
+    def get_participants_detail(self, event_discord_id: str) -> List[Tuple[str, Optional[str], datetime]]:
+        rows = self.session.query(
+            EventParticipation.user_discord_id,
+            User.username,
+            EventParticipation.joined_at
+        ).outerjoin(
+            User, User.discord_id == EventParticipation.user_discord_id
+        ).filter(
+            EventParticipation.event_discord_id == event_discord_id
+        ).order_by(EventParticipation.joined_at).all()
+        return [tuple(row) for row in rows]
+    
     def create(self, entity: EventParticipation) -> EventParticipation:
         self.session.add(entity)
         self.session.flush()
         return entity
     
+    def get_by_user(self, user_discord_id: str, event_discord_ids: Optional[List[str]] = None) -> List[Tuple[str, datetime]]:
+        # Lecture seule de l'index (user_discord_id, event_discord_id, joined_at)
+        query = self.session.query(
+            EventParticipation.event_discord_id,
+            EventParticipation.joined_at
+        ).filter(EventParticipation.user_discord_id == user_discord_id)
+        if event_discord_ids is not None:
+            if not event_discord_ids:
+                return []
+            query = query.filter(EventParticipation.event_discord_id.in_(event_discord_ids))
+        return [tuple(row) for row in query.all()]
+    
+    def archive_by_events(self, event_discord_ids: List[str]) -> int:
+        if not event_discord_ids:
+            return 0
+        # INSERT ... SELECT puis DELETE en masse : aucune participation n'est chargée en mémoire
+        self.session.execute(
+            insert(ArchivedParticipation).from_select(
+                ['event_discord_id', 'user_discord_id', 'joined_at', 'archived_at'],
+                select(
+                    EventParticipation.event_discord_id,
+                    EventParticipation.user_discord_id,
+                    EventParticipation.joined_at,
+                    literal(datetime.utcnow(), ArchivedParticipation.archived_at.type),
+                ).where(EventParticipation.event_discord_id.in_(event_discord_ids))
+            )
+        )
+        return self.session.query(EventParticipation).filter(
+            EventParticipation.event_discord_id.in_(event_discord_ids)
+        ).delete(synchronize_session=False)
+    
+    def restore_by_events(self, event_discord_ids: List[str]) -> int:
+        if not event_discord_ids:
+            return 0
+        # Opération inverse de archive_by_events, en masse : les agrégats de participation ne changent pas
+        self.session.execute(
+            insert(EventParticipation).from_select(
+                ['event_discord_id', 'user_discord_id', 'joined_at'],
+                select(
+                    ArchivedParticipation.event_discord_id,
+                    ArchivedParticipation.user_discord_id,
+                    ArchivedParticipation.joined_at,
+                ).where(ArchivedParticipation.event_discord_id.in_(event_discord_ids))
+            )
+        )
+        return self.session.query(ArchivedParticipation).filter(
+            ArchivedParticipation.event_discord_id.in_(event_discord_ids)
+        ).delete(synchronize_session=False)
+    
     def create_participation(self, event_discord_id: str, user_discord_id: str) -> EventParticipation:
         participation = EventParticipation(
             event_discord_id=event_discord_id,
@@ -166,6 +301,31 @@ class SQLiteParticipationRepository(ParticipationRepository):
         self.session.flush()
         return entity
     
+    def create_participations(self, event_discord_id: str, user_discord_ids: Iterable[str]) -> int:
+        now = datetime.utcnow()
+        rows = [
+            {'event_discord_id': event_discord_id, 'user_discord_id': user_discord_id, 'joined_at': now}
+            for user_discord_id in user_discord_ids
+        ]
+        if rows:
+            # INSERT en masse via l'ORM : les agrégats de participation sont mis à jour (attendance_aggregator)
+            self.session.execute(insert(EventParticipation), rows)
+        return len(rows)
+    
+    def remove_participations(self, event_discord_id: str, user_discord_ids: Iterable[str]) -> List[str]:
+        # Suppressions ORM (et non en masse) : les agrégats de participation comptent les désinscriptions
+        removed: List[str] = []
+        for batch in _batches(user_discord_ids):
+            for participation in self.session.query(EventParticipation).filter(
+                EventParticipation.event_discord_id == event_discord_id,
+                EventParticipation.user_discord_id.in_(batch)
+            ):
+                self.session.delete(participation)
+                removed.append(participation.user_discord_id)
+        if removed:
+            self.session.flush()
+        return removed
+    
     def remove_participation(self, event_discord_id: str, user_discord_id: str) -> bool:
         participation = self.session.query(EventParticipation).filter(
             EventParticipation.event_discord_id == event_discord_id,
@@ -188,8 +348,12 @@ class SQLiteParticipationRepository(ParticipationRepository):
 class SQLiteGameRepository(GameRepository):
     """Repository SQLite pour les jeux"""
     
-    def __init__(self, session: Session):
+    # Nombre de candidats extraits de l'index avant le classement par similarité
+    SEARCH_CANDIDATES_FACTOR = 3
+    
+    def __init__(self, session: Session, fts_enabled: bool = False):
         self.session = session
+        self.fts_enabled = fts_enabled
     
     def get_by_id(self, id: int) -> Optional[Game]:
         return self.session.query(Game).filter(Game.id == id).first()
@@ -198,20 +362,75 @@ class SQLiteGameRepository(GameRepository):
         return self.session.query(Game).all()
     
     def get_by_name(self, name: str) -> Optional[Game]:
-        return self.session.query(Game).filter(Game.name == name).first()
+        game = self.session.query(Game).filter(Game.name == name).first()
+        if game:
+            return game
+        normalized = normalize_name(name)
+        if not normalized:
+            return None  # Nom sans lettre ni chiffre : aucune correspondance approchée
+        return self.session.query(Game).filter(Game.normalized_name == normalized).first()
+    
+    def search_by_name(self, query: str, limit: int = 10) -> List[Tuple[Game, float]]:
+        normalized = normalize_name(query)
+        if not normalized:
+            return []
+        
+        candidate_ids = self._search_candidate_ids(normalized, limit * self.SEARCH_CANDIDATES_FACTOR)
+        if not candidate_ids:
+            return []
+        
+        games = self.session.query(Game).filter(Game.id.in_(candidate_ids)).all()
+        scored = [(game, self._similarity(normalized, game.normalized_name or '')) for game in games]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:limit]
+    
+    def _search_candidate_ids(self, normalized: str, limit: int) -> List[int]:
+        """Extrait les candidats depuis l'index trigramme (ou par LIKE sans FTS5)"""
+        if self.fts_enabled and len(normalized) >= 3:
+            # Un trigramme commun suffit : la tolérance aux fautes vient du classement bm25
+            trigrams = dict.fromkeys(normalized[i:i + 3] for i in range(len(normalized) - 2))
+            match_query = " OR ".join(f'"{trigram}"' for trigram in trigrams)
+            rows = self.session.execute(
+                text("SELECT rowid FROM games_fts WHERE games_fts MATCH :query ORDER BY rank LIMIT :limit"),
+                {"query": match_query, "limit": limit}
+            ).fetchall()
+            return [row[0] for row in rows]
+        
+        rows = self.session.query(Game.id).filter(
+            Game.normalized_name.like(f"%{normalized}%")
+        ).limit(limit).all()
+        return [row[0] for row in rows]
+    
+    @staticmethod
+    def _similarity(query: str, candidate: str) -> float:
+        """Score de similarité entre 0 et 1 (un nom contenant la requête est favorisé)"""
+        score = SequenceMatcher(None, query, candidate).ratio()
+        if query in candidate:
+            score = max(score, 0.5 + 0.5 * len(query) / len(candidate))
+        return score
     
     def create(self, entity: Game) -> Game:
+        entity.normalized_name = normalize_name(entity.name)
         self.session.add(entity)
         self.session.flush()
         return entity
     
     def create_game(self, name: str, steam_id: str = None, epic_id: str = None) -> Game:
-        game = Game(name=name, steam_id=steam_id, epic_id=epic_id)
+        game = Game(name=name, normalized_name=normalize_name(name), steam_id=steam_id, epic_id=epic_id)
         self.session.add(game)
         self.session.flush()
         return game
     
+    def set_alert_price(self, name: str, alert_price: Optional[float]) -> Optional[Game]:
+        game = self.get_by_name(name)
+        if game:
+            game.alert_price = alert_price
+            game.updated_at = datetime.utcnow()
+            self.session.flush()
+        return game
+    
     def update(self, entity: Game) -> Game:
+        entity.normalized_name = normalize_name(entity.name)
         entity.updated_at = datetime.utcnow()
         self.session.flush()
         return entity
@@ -239,6 +458,9 @@ class SQLiteDealRepository(DealRepository):
     def get_by_game(self, game_id: int) -> List[Deal]:
         return self.session.query(Deal).filter(Deal.game_id == game_id).all()
     
+    def get_by_deal_id(self, deal_id: str) -> Optional[Deal]:
+        return self.session.query(Deal).filter(Deal.deal_id == deal_id).first()
+    
     def create(self, entity: Deal) -> Deal:
         self.session.add(entity)
         self.session.flush()
@@ -277,6 +499,247 @@ class SQLiteDealRepository(DealRepository):
         return False
 
 
+class SQLitePriceHistoryRepository(PriceHistoryRepository):
+    """Repository SQLite pour l'historique des prix"""
+    
+    def __init__(self, session: Session):
+        self.session = session
+    
+    def get_by_id(self, id: int) -> Optional[PriceHistory]:
+        return self.session.query(PriceHistory).filter(PriceHistory.id == id).first()
+    
+    def get_all(self) -> List[PriceHistory]:
+        return self.session.query(PriceHistory).all()
+    
+    def get_latest_by_game(self, game_id: int) -> Dict[str, PriceHistory]:
+        # Dernier relevé par store, résolu via l'index (game_id, store_id, observed_at)
+        latest = self.session.query(
+            PriceHistory.store_id,
+            func.max(PriceHistory.observed_at).label('observed_at')
+        ).filter(PriceHistory.game_id == game_id).group_by(PriceHistory.store_id).subquery()
+        
+        rows = self.session.query(PriceHistory).join(
+            latest,
+            (PriceHistory.store_id == latest.c.store_id) & (PriceHistory.observed_at == latest.c.observed_at)
+        ).filter(PriceHistory.game_id == game_id).all()
+        return {row.store_id: row for row in rows}
+    
+    def get_lowest(self, game_id: int) -> Optional[PriceHistory]:
+        return self.session.query(PriceHistory).filter(
+            PriceHistory.game_id == game_id
+        ).order_by(PriceHistory.sale_price, PriceHistory.observed_at).first()
+    
+    def create(self, entity: PriceHistory) -> PriceHistory:
+        self.session.add(entity)
+        self.session.flush()
+        return entity
+    
+    def append(self, game_id: int, store_id: str, sale_price: float,
+               normal_price: float = None, observed_at: datetime = None) -> PriceHistory:
+        entry = PriceHistory(
+            game_id=game_id,
+            store_id=store_id,
+            sale_price=sale_price,
+            normal_price=normal_price,
+            observed_at=observed_at or datetime.utcnow()
+        )
+        self.session.add(entry)
+        self.session.flush()
+        return entry
+    
+    def update(self, entity: PriceHistory) -> PriceHistory:
+        return entity  # Table en ajout seul
+    
+    @staticmethod
+    def _superseded():
+        # Un relevé plus récent existe pour le même jeu et store : le dernier prix connu est conservé
+        newer = aliased(PriceHistory)
+        return select(newer.id).where(
+            newer.game_id == PriceHistory.game_id,
+            newer.store_id == PriceHistory.store_id,
+            newer.observed_at > PriceHistory.observed_at
+        ).exists()
+    
+    def downsample(self, before: datetime) -> int:
+        ranked = self.session.query(
+            PriceHistory.id,
+            func.row_number().over(
+                partition_by=(PriceHistory.game_id, PriceHistory.store_id, func.date(PriceHistory.observed_at)),
+                order_by=(PriceHistory.sale_price, PriceHistory.observed_at)
+            ).label('rank')
+        ).filter(PriceHistory.observed_at < before).subquery()
+        
+        redundant_ids = self.session.query(ranked.c.id).filter(ranked.c.rank > 1)
+        return self.session.query(PriceHistory).filter(
+            PriceHistory.id.in_(redundant_ids.scalar_subquery()),
+            self._superseded()
+        ).delete(synchronize_session=False)
+    
+    def purge(self, before: datetime) -> int:
+        return self.session.query(PriceHistory).filter(
+            PriceHistory.observed_at < before,
+            self._superseded()
+        ).delete(synchronize_session=False)
+    
+    def delete(self, id: int) -> bool:
+        return False  # Table en ajout seul
+
+
+class SQLiteStoreRepository(StoreRepository):
+    """Repository SQLite pour les stores"""
+    
+    def __init__(self, session: Session):
+        self.session = session
+    
+    def get_by_id(self, id: int) -> Optional[Store]:
+        return self.session.query(Store).filter(Store.id == id).first()
+    
+    def get_all(self) -> List[Store]:
+        return self.session.query(Store).all()
+    
+    def create(self, entity: Store) -> Store:
+        self.session.add(entity)
+        self.session.flush()
+        return entity
+    
+    def update(self, entity: Store) -> Store:
+        entity.updated_at = datetime.utcnow()
+        self.session.flush()
+        return entity
+    
+    def upsert_stores(self, stores: List[Dict[str, Any]]) -> int:
+        existing = {store.store_id: store for store in self.get_all()}
+        now = datetime.utcnow()
+        for data in stores:
+            store = existing.get(data['store_id'])
+            if store is None:
+                store = Store(store_id=data['store_id'])
+                self.session.add(store)
+            store.name = data['name']
+            store.is_active = data.get('is_active', True)
+            store.updated_at = now
+        self.session.flush()
+        return len(stores)
+    
+    def get_last_update(self) -> Optional[datetime]:
+        return self.session.query(func.max(Store.updated_at)).scalar()
+    
+    def delete(self, id: int) -> bool:
+        store = self.get_by_id(id)
+        if store:
+            self.session.delete(store)
+            return True
+        return False
+
+
+class SQLiteAttendanceStatsRepository(AttendanceStatsRepository):
+    """Repository SQLite pour les agrégats de participation"""
+    
+    def __init__(self, session: Session):
+        self.session = session
+    
+    def get_by_id(self, id: int) -> Optional[MonthlyAttendance]:
+        return self.session.query(MonthlyAttendance).filter(MonthlyAttendance.id == id).first()
+    
+    def get_all(self) -> List[MonthlyAttendance]:
+        return self.session.query(MonthlyAttendance).all()
+    
+    def create(self, entity: Any):
+        return None  # Agrégats alimentés uniquement par les inscriptions
+    
+    def update(self, entity: Any):
+        return None  # Agrégats alimentés uniquement par les inscriptions
+    
+    def delete(self, id: int) -> bool:
+        return False  # Agrégats alimentés uniquement par les inscriptions
+    
+    def get_top_participants(self, month: str, limit: int = 10) -> List[Tuple[str, Optional[str], int, int]]:
+        # Parcours de l'index (month, signups) par ordre décroissant : coût borné par `limit`
+        rows = self.session.query(
+            MonthlyAttendance.user_discord_id,
+            User.username,
+            MonthlyAttendance.signups,
+            MonthlyAttendance.cancellations
+        ).outerjoin(
+            User, User.discord_id == MonthlyAttendance.user_discord_id
+        ).filter(
+            MonthlyAttendance.month == month,
+            MonthlyAttendance.signups > 0
+        ).order_by(MonthlyAttendance.signups.desc()).limit(limit).all()
+        return [tuple(row) for row in rows]
+    
+    def get_user_stats(self, user_discord_id: str, month: Optional[str] = None) -> Tuple[int, int]:
+        query = self.session.query(
+            func.coalesce(func.sum(MonthlyAttendance.signups), 0),
+            func.coalesce(func.sum(MonthlyAttendance.cancellations), 0)
+        ).filter(MonthlyAttendance.user_discord_id == user_discord_id)
+        if month is not None:
+            query = query.filter(MonthlyAttendance.month == month)
+        signups, cancellations = query.one()
+        return signups, cancellations
+    
+    def get_by_event_type(self, month: str) -> List[Tuple[str, int, int]]:
+        rows = self.session.query(
+            EventTypeAttendance.event_type,
+            EventTypeAttendance.signups,
+            EventTypeAttendance.cancellations
+        ).filter(EventTypeAttendance.month == month).order_by(EventTypeAttendance.signups.desc()).all()
+        return [tuple(row) for row in rows]
+
+
+class SQLiteJobRepository(JobRepository):
+    """Repository SQLite pour les tâches planifiées"""
+    
+    def __init__(self, session: Session):
+        self.session = session
+    
+    def get_by_id(self, id: int) -> Optional[ScheduledJob]:
+        return self.session.query(ScheduledJob).filter(ScheduledJob.id == id).first()
+    
+    def get_all(self) -> List[ScheduledJob]:
+        return self.session.query(ScheduledJob).all()
+    
+    def get_by_name(self, name: str) -> Optional[ScheduledJob]:
+        return self.session.query(ScheduledJob).filter(ScheduledJob.name == name).first()
+    
+    def create(self, entity: ScheduledJob) -> ScheduledJob:
+        self.session.add(entity)
+        self.session.flush()
+        return entity
+    
+    def update(self, entity: ScheduledJob) -> ScheduledJob:
+        self.session.flush()
+        return entity
+    
+    def save_next_run(self, name: str, schedule: str, next_run_at: datetime) -> ScheduledJob:
+        job = self.get_by_name(name)
+        if job is None:
+            job = ScheduledJob(name=name)
+            self.session.add(job)
+        job.schedule = schedule
+        job.next_run_at = next_run_at
+        self.session.flush()
+        return job
+    
+    def record_run(self, name: str, run_at: datetime, status: str, next_run_at: datetime,
+                   error: Optional[str] = None) -> Optional[ScheduledJob]:
+        job = self.get_by_name(name)
+        if job:
+            job.last_run_at = run_at
+            job.last_status = status
+            job.last_error = error
+            job.next_run_at = next_run_at
+            self.session.flush()
+        return job
+    
+    def delete(self, id: int) -> bool:
+        job = self.get_by_id(id)
+        if job:
+            self.session.delete(job)
+            return True
+        return False
+
+
 class SQLiteDatabaseRepository(DatabaseRepository):
     """Repository SQLite pour les opérations générales"""
     
@@ -321,12 +784,14 @@ class SQLiteDatabaseRepository(DatabaseRepository):
             }
     
     def get_stats(self) -> Dict[str, int]:
-        """Récupère les statistiques de la base de données"""
+        """Récupère les statistiques de la base de données (une seule requête à sous-requêtes scalaires)"""
         try:
-            users_count = self.session.query(User).count()
-            active_events_count = self.session.query(Event).filter(Event.is_passed == False).count()
-            participations_count = self.session.query(EventParticipation).count()
-            games_count = self.session.query(Game).count()
+            users_count, active_events_count, participations_count, games_count = self.session.query(
+                self.session.query(func.count(User.id)).scalar_subquery(),
+                self.session.query(func.count(Event.id)).filter(Event.is_passed == False).scalar_subquery(),
+                self.session.query(func.count(EventParticipation.id)).scalar_subquery(),
+                self.session.query(func.count(Game.id)).scalar_subquery(),
+            ).one()
             
             return {
                 'users': users_count,
@@ -337,3 +802,103 @@ class SQLiteDatabaseRepository(DatabaseRepository):
         except Exception as e:
             logger.error(f"❌ [DB-STATS] Erreur de statistiques : {e}")
             return {'users': 0, 'active_events': 0, 'participations': 0, 'games': 0}
+    
+    def get_storage_report(self, statement_counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """
+        État du stockage : fichiers, pages, cache, tables et index.
+        
+        Les tailles par table et par index viennent de la table virtuelle dbstat
+        (None si SQLite est compilé sans). L'utilisation des index est déduite du
+        plan (EXPLAIN QUERY PLAN) des requêtes de `statement_counts`, pondéré par
+        leur nombre d'exécutions.
+        """
+        connection = self.session.connection()
+        db_file = next(row[2] for row in connection.exec_driver_sql("PRAGMA database_list") if row[1] == 'main')
+        
+        objects = connection.exec_driver_sql(
+            "SELECT type, name, tbl_name FROM sqlite_master "
+            "WHERE type IN ('table', 'index') AND name NOT LIKE 'sqlite_stat%' ORDER BY name"
+        ).fetchall()
+        tables = [name for kind, name, _ in objects if kind == 'table']
+        
+        # Nombre de lignes de toutes les tables en une requête
+        row_counts = dict(connection.exec_driver_sql(" UNION ALL ".join(
+            f"SELECT '{name}', COUNT(*) FROM \"{name}\"" for name in tables
+        )).fetchall()) if tables else {}
+        
+        try:
+            sizes = dict(connection.exec_driver_sql("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name").fetchall())
+        except OperationalError:
+            sizes = {}
+        
+        analyzed = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        ).first() is not None
+        index_stats = dict(connection.exec_driver_sql(
+            "SELECT idx, stat FROM sqlite_stat1 WHERE idx IS NOT NULL"
+        ).fetchall()) if analyzed else {}
+        
+        index_usage, full_scans = self._plan_usage(statement_counts or {})
+        
+        return {
+            'file': db_file,
+            'file_size': self._file_size(db_file),
+            'wal_size': self._file_size(f"{db_file}-wal") if db_file else None,
+            'journal_mode': self._pragma("journal_mode"),
+            'page_size': self._pragma("page_size"),
+            'page_count': self._pragma("page_count"),
+            'freelist_count': self._pragma("freelist_count"),
+            'cache_size': self._pragma("cache_size"),  # Négatif : taille en Kio, positif : nombre de pages
+            'analyzed': analyzed,
+            'tables': [
+                {
+                    'name': name,
+                    'rows': row_counts.get(name, 0),
+                    'size': sizes.get(name),
+                    'full_scans': full_scans.get(name, 0),
+                }
+                for name in tables
+            ],
+            'indexes': [
+                {
+                    'name': name,
+                    'table': table,
+                    'size': sizes.get(name),
+                    'executions': index_usage.get(name, 0),
+                    'stat': index_stats.get(name),
+                }
+                for kind, name, table in objects if kind == 'index'
+            ],
+        }
+    
+    def _pragma(self, name: str) -> Any:
+        return self.session.connection().exec_driver_sql(f"PRAGMA {name}").scalar()
+    
+    @staticmethod
+    def _file_size(path: Optional[str]) -> Optional[int]:
+        """Taille du fichier en octets, None s'il n'existe pas (base en mémoire, pas de WAL)"""
+        return os.path.getsize(path) if path and os.path.exists(path) else None
+    
+    def _plan_usage(self, statement_counts: Dict[str, int]) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Exécutions utilisant chaque index et parcours complets par table, d'après les plans de requêtes"""
+        connection = self.session.connection()
+        index_usage: Dict[str, int] = {}
+        full_scans: Dict[str, int] = {}
+        for statement, executions in statement_counts.items():
+            if not statement.upper().startswith(_EXPLAINABLE):
+                continue
+            try:
+                plan = connection.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {statement}", (None,) * statement.count("?")
+                ).fetchall()
+            except DBAPIError:
+                continue  # Requête non analysable hors de son contexte (paramètres nommés, table temporaire...)
+            for row in plan:
+                detail = row[-1]
+                index = _PLAN_INDEX.search(detail)
+                scan = _PLAN_FULL_SCAN.match(detail)
+                if index:
+                    index_usage[index.group(1)] = index_usage.get(index.group(1), 0) + executions
+                elif scan:
+                    full_scans[scan.group(1)] = full_scans.get(scan.group(1), 0) + executions
+        return index_usage, full_scans
@@ -1,6 +1,8 @@
 """
 Utilitaires pour la conversion et validation de données
 """
+import re
+import unicodedata
 from typing import Union, Optional
 
 
@@ -147,3 +149,24 @@ def truncate_string(text: str, max_length: int = 100, suffix: str = "...") -> st
         return text
     
     return text[:max_length - len(suffix)] + suffix
+
+
+def normalize_name(text: Optional[str]) -> str:
+    """
+    Normalise un nom pour la recherche (casse, accents et ponctuation ignorés).
+    
+    Les lettres de toutes les écritures sont conservées : un titre non latin
+    garde une clé de recherche propre.
+    
+    Args:
+        text: Nom à normaliser
+        
+    Returns:
+        Nom normalisé (ex: "ÉLDEN-Ring" -> "elden ring", "Ведьмак 3" -> "ведьмак 3")
+    """
+    if not text:
+        return ""
+    
+    decomposed = unicodedata.normalize("NFKD", text)
+    without_accents = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return re.sub(r"[\W_]+", " ", without_accents.casefold()).strip()
@@ -9,6 +9,11 @@ from .event import Event
 from .game import Game
 from .deal import Deal
 from .event_participation import EventParticipation
+from .price_history import PriceHistory
+from .store import Store
+from .archived_participation import ArchivedParticipation
+from .attendance_stats import MonthlyAttendance, EventTypeAttendance
+from .scheduled_job import ScheduledJob
 
 
 __all__ = [
@@ -18,4 +23,10 @@ __all__ = [
     'Game',
     'Deal',
     'EventParticipation',
+    'PriceHistory',
+    'Store',
+    'ArchivedParticipation',
+    'MonthlyAttendance',
+    'EventTypeAttendance',
+    'ScheduledJob',
 ]
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from datetime import datetime
+from .entities import Base
+
+
+class ArchivedParticipation(Base):
+    """Entité participation archivée (événements passés, hors de la table chaude)"""
+    __tablename__ = 'event_participations_archive'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_discord_id = Column(String, ForeignKey('events.discord_id'), nullable=False)
+    user_discord_id = Column(String, nullable=False)
+    joined_at = Column(DateTime, nullable=False)
+    archived_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    # Index de consultation de l'historique par événement et par utilisateur
+    __table_args__ = (
+        Index('ix_participations_archive_event', 'event_discord_id'),
+        Index('ix_participations_archive_user', 'user_discord_id', 'joined_at'),
+    )
+    
+    def __repr__(self):
+        return f"<ArchivedParticipation(id={self.id}, event_discord_id='{self.event_discord_id}', user_discord_id='{self.user_discord_id}')>"
@@ -0,0 +1,40 @@
+from sqlalchemy import Column, Integer, String, Index, UniqueConstraint
+from .entities import Base
+
+
+class MonthlyAttendance(Base):
+    """Agrégat d'inscriptions par utilisateur et par mois (mis à jour à chaque inscription/désinscription)"""
+    __tablename__ = 'attendance_monthly'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_discord_id = Column(String, nullable=False)
+    month = Column(String, nullable=False)  # 'AAAA-MM' (UTC)
+    signups = Column(Integer, nullable=False, default=0)
+    cancellations = Column(Integer, nullable=False, default=0)
+    
+    # Unicité (utilisateur, mois) et classement mensuel lu directement dans l'index
+    __table_args__ = (
+        UniqueConstraint('user_discord_id', 'month', name='unique_attendance_user_month'),
+        Index('ix_attendance_monthly_month_signups', 'month', 'signups'),
+    )
+    
+    def __repr__(self):
+        return f"<MonthlyAttendance(user_discord_id='{self.user_discord_id}', month='{self.month}', signups={self.signups}, cancellations={self.cancellations})>"
+
+
+class EventTypeAttendance(Base):
+    """Agrégat d'inscriptions par type d'événement et par mois"""
+    __tablename__ = 'attendance_event_type'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_type = Column(String, nullable=False)
+    month = Column(String, nullable=False)  # 'AAAA-MM' (UTC)
+    signups = Column(Integer, nullable=False, default=0)
+    cancellations = Column(Integer, nullable=False, default=0)
+    
+    __table_args__ = (
+        UniqueConstraint('month', 'event_type', name='unique_attendance_type_month'),
+    )
+    
+    def __repr__(self):
+        return f"<EventTypeAttendance(event_type='{self.event_type}', month='{self.month}', signups={self.signups}, cancellations={self.cancellations})>"
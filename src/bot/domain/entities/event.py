@@ -11,7 +11,10 @@ class Event(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     discord_id = Column(String, unique=True, nullable=False, index=True)
     name = Column(String, nullable=False)
+    event_type = Column(String, nullable=True)  # Type Discord : voice, stage_instance, external
     is_passed = Column(Boolean, default=False)
+    participant_count = Column(Integer, nullable=True)  # Renseigné à l'archivage
+    archived_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .entities import Base
@@ -17,8 +17,14 @@ class EventParticipation(Base):
     event = relationship("Event", foreign_keys=[event_discord_id], back_populates="participations")
     user = relationship("User", foreign_keys=[user_discord_id], back_populates="participations")
     
-    # Contrainte unique
-    __table_args__ = (UniqueConstraint('event_discord_id', 'user_discord_id', name='unique_participation'),)
+    # Clé de version des caches de rendu (participations d'un événement)
+    __version_key__ = 'event_discord_id'
+    
+    # Contrainte unique (index côté événement) et index couvrant côté utilisateur
+    __table_args__ = (
+        UniqueConstraint('event_discord_id', 'user_discord_id', name='unique_participation'),
+        Index('ix_event_participations_user_event', 'user_discord_id', 'event_discord_id', 'joined_at'),
+    )
     
     def __repr__(self):
         return f"<EventParticipation(id={self.id}, event_discord_id='{self.event_discord_id}', user_discord_id='{self.user_discord_id}')>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, Float, DateTime
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .entities import Base
@@ -10,13 +10,16 @@ class Game(Base):
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String, unique=True, nullable=False, index=True)
+    normalized_name = Column(String, nullable=True, index=True)  # Nom normalisé pour la recherche
     steam_id = Column(String, nullable=True)
     epic_id = Column(String, nullable=True)
+    alert_price = Column(Float, nullable=True)  # Seuil d'alerte de baisse de prix
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relations
     deals = relationship("Deal", back_populates="game", cascade="all, delete-orphan")
+    price_history = relationship("PriceHistory", back_populates="game", cascade="all, delete-orphan")
     
     def __repr__(self):
         return f"<Game(id={self.id}, name='{self.name}', steam_id='{self.steam_id}', epic_id='{self.epic_id}')>"
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from .entities import Base
+
+
+class PriceHistory(Base):
+    """Entité historique de prix (série temporelle, une ligne par changement de prix)"""
+    __tablename__ = 'price_history'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    game_id = Column(Integer, ForeignKey('games.id'), nullable=False)
+    store_id = Column(String, nullable=False)
+    sale_price = Column(Float, nullable=False)
+    normal_price = Column(Float, nullable=True)
+    observed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    # Relations
+    game = relationship("Game", back_populates="price_history")
+    
+    # Index de la série temporelle
+    __table_args__ = (
+        Index('ix_price_history_game_store_observed', 'game_id', 'store_id', 'observed_at'),
+    )
+    
+    def __repr__(self):
+        return f"<PriceHistory(id={self.id}, game_id={self.game_id}, store_id='{self.store_id}', sale_price={self.sale_price}, observed_at={self.observed_at})>"
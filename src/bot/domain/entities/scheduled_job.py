@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from .entities import Base
+
+
+class ScheduledJob(Base):
+    """Entité tâche planifiée (prochaine exécution persistée pour survivre aux redémarrages)"""
+    __tablename__ = 'scheduled_jobs'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, unique=True, nullable=False, index=True)
+    schedule = Column(String, nullable=False)  # Description de la planification (détecte les changements de configuration)
+    next_run_at = Column(DateTime, nullable=False)  # UTC
+    last_run_at = Column(DateTime, nullable=True)  # UTC
+    last_status = Column(String, nullable=True)  # ok, error, skipped
+    last_error = Column(String, nullable=True)
+    
+    def __repr__(self):
+        return f"<ScheduledJob(name='{self.name}', schedule='{self.schedule}', next_run_at={self.next_run_at}, last_status={self.last_status})>"
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from datetime import datetime
+from .entities import Base
+
+
+class Store(Base):
+    """Entité store CheapShark (métadonnées mises en cache localement)"""
+    __tablename__ = 'stores'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    store_id = Column(String, unique=True, nullable=False, index=True)
+    name = Column(String, nullable=False)
+    is_active = Column(Boolean, default=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<Store(id={self.id}, store_id='{self.store_id}', name='{self.name}', is_active={self.is_active})>"
@@ -18,6 +18,9 @@ from .game import GameBase, GameCreate, GameUpdate, GameResponse
 # Modèles promotion
 from .deal import DealBase, DealCreate, DealUpdate, DealResponse
 
+# Modèles historique de prix
+from .price_history import PriceHistoryBase, PriceHistoryResponse
+
 __all__ = [
     # User models
     'UserBase',
@@ -43,4 +46,7 @@ __all__ = [
     'DealCreate',
     'DealUpdate',
     'DealResponse',
+    # Price history models
+    'PriceHistoryBase',
+    'PriceHistoryResponse',
 ]
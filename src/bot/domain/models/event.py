@@ -27,8 +27,10 @@ class EventUpdate(BaseModel):
 class EventResponse(EventBase):
     """Modèle de réponse pour les événements"""
     id: int
+    participant_count: Optional[int] = None
     created_at: datetime
     updated_at: datetime
+    archived_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
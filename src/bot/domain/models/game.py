@@ -11,6 +11,7 @@ class GameBase(BaseModel):
     name: str
     steam_id: Optional[str] = None
     epic_id: Optional[str] = None
+    alert_price: Optional[float] = None
 
 
 class GameCreate(GameBase):
@@ -23,6 +24,7 @@ class GameUpdate(BaseModel):
     name: Optional[str] = None
     steam_id: Optional[str] = None
     epic_id: Optional[str] = None
+    alert_price: Optional[float] = None
 
 
 class GameResponse(GameBase):
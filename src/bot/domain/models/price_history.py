@@ -0,0 +1,23 @@
+"""
+Modèles Pydantic pour l'historique des prix
+"""
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+
+class PriceHistoryBase(BaseModel):
+    """Modèle de base pour les relevés de prix"""
+    game_id: int
+    store_id: str
+    sale_price: float
+    normal_price: Optional[float] = None
+    observed_at: datetime
+
+
+class PriceHistoryResponse(PriceHistoryBase):
+    """Modèle de réponse pour les relevés de prix"""
+    id: int
+    
+    class Config:
+        from_attributes = True
@@ -1,20 +1,37 @@
 """
 Module des services métier
 Exporte tous les services du domaine
+
+Les services sont importés à la première utilisation : importer un service
+ne charge pas les autres (ni les modèles Pydantic dont il n'a pas besoin).
 """
+import importlib
+
+_SERVICE_MODULES = {
+    'UserService': '.user_service',
+    'EventService': '.event_service',
+    'ParticipationService': '.participation_service',
+    'GameService': '.game_service',
+    'DealService': '.deal_service',
+    'SynchronizationService': '.synchronization_service',
+    'StoreService': '.store_service',
+    'PriceTrackingService': '.price_tracking_service',
+    'EventArchiveService': '.event_archive_service',
+    'AnnouncementService': '.announcement_service',
+    'ReminderService': '.reminder_service',
+}
+
+__all__ = list(_SERVICE_MODULES)
+
+
+def __getattr__(name: str):
+    module = _SERVICE_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    service = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = service
+    return service
 
-from .user_service import UserService
-from .event_service import EventService
-from .participation_service import ParticipationService
-from .game_service import GameService
-from .deal_service import DealService
-from .synchronization_service import SynchronizationService
 
-__all__ = [
-    'UserService',
-    'EventService',
-    'ParticipationService',
-    'GameService',
-    'DealService',
-    'SynchronizationService',
-]
+def __dir__():
+    return sorted(list(globals()) + __all__)
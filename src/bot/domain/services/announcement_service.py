@@ -0,0 +1,76 @@
+"""
+Service de génération de l'annonce hebdomadaire des événements.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import datetime, time, timedelta, timezone
+from typing import List, Optional, Tuple
+
+import discord
+
+from bot.core.config import PARIS_TZ
+from bot.core.logging_config import logger
+from bot.domain.services.event_archive_service import LIVE_EVENT_STATUSES
+
+
+class AnnouncementService:
+    """Construit l'annonce des événements de la semaine à partir du cache Discord"""
+
+    @staticmethod
+    def get_week_window(now: datetime) -> Tuple[datetime, datetime]:
+        """
+        Fenêtre de l'annonce : de maintenant à la fin du dimanche (heure de Paris).
+
+        Le dimanche, la fenêtre couvre la semaine suivante.
+        """
+        local_now = now.astimezone(PARIS_TZ)
+        days_until_sunday = (6 - local_now.weekday()) or 7
+        sunday = local_now.date() + timedelta(days=days_until_sunday)
+        end_of_week = PARIS_TZ.localize(datetime.combine(sunday, time(23, 59, 59)))
+        return now, end_of_week
+
+    @staticmethod
+    async def get_upcoming_events(guild: discord.Guild) -> List[discord.ScheduledEvent]:
+        """
+        Événements programmés ou en cours, triés par date de début.
+
+        Le cache Discord (tenu à jour par la gateway) est utilisé en priorité ;
+        l'API REST n'est interrogée que si ce cache est vide (froid).
+        """
+        events = list(guild.scheduled_events)
+        if not events:
+            logger.info("🌐 [ANNONCE] Cache des événements vide, récupération via l'API Discord")
+            events = await guild.fetch_scheduled_events()
+
+        return sorted(
+            (e for e in events if e.start_time and e.status in LIVE_EVENT_STATUSES),
+            key=lambda e: e.start_time
+        )
+
+    async def build_week_announcement(self, guild: discord.Guild, now: Optional[datetime] = None) -> Optional[str]:
+        """Message d'annonce des événements de la semaine, ou None s'il n'y en a aucun"""
+        start, end_of_week = self.get_week_window(now or datetime.now(timezone.utc))
+
+        # Événements triés par date de début : la fenêtre de la semaine est une tranche
+        events = await self.get_upcoming_events(guild)
+        start_times = [e.start_time for e in events]
+        week_events = events[bisect_left(start_times, start):bisect_right(start_times, end_of_week)]
+
+        if not week_events:
+            return None
+
+        # Création du message
+        message = ""
+        message += "```"
+        message += "\n"
+        message += "Bonsoir tout le monde !"
+        message += "\n"
+        message += "@annonce Cette semaine, on propose les soirées suivantes :\n\n"
+
+        for event in week_events:
+            event_time_unix = int(event.start_time.timestamp())
+            message += f"- Soirée [**{event.name}**]({event.url}) <t:{event_time_unix}:F>\n"
+
+        message += "\n"
+        message += "Bonne semaine ! 😉"
+        message += "```"
+        return message
@@ -2,10 +2,10 @@
 Service métier pour les promotions
 """
 import logging
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 from bot.core.interfaces.unit_of_work import UnitOfWork
-from bot.domain.models import DealResponse
+from bot.domain.models import DealResponse, PriceHistoryResponse
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,12 @@ class DealService:
             deals = self.uow.deals.get_by_game(game_id)
             return [DealResponse.from_orm(deal) for deal in deals]
     
+    def get_lowest_price(self, game_id: int) -> Optional[PriceHistoryResponse]:
+        """Récupère le prix le plus bas jamais relevé pour un jeu"""
+        with self.uow:
+            entry = self.uow.price_history.get_lowest(game_id)
+            return PriceHistoryResponse.from_orm(entry) if entry else None
+    
     def create_deal(self, game_id: int, deal_id: str, title: str, sale_price: float, 
                    normal_price: float, savings: float, store_id: str, 
                    deal_rating: float = None, release_date: datetime = None, 
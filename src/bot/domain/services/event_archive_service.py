@@ -0,0 +1,61 @@
+"""
+Service d'archivage des événements terminés.
+
+Les événements qui ne sont plus programmés ni en cours sur Discord sont marqués
+`is_passed`, leur nombre de participants est conservé sur l'événement et leurs
+participations sont déplacées vers la table d'archive : la synchronisation et
+les commandes ne travaillent ainsi que sur les événements à venir.
+
+Une lecture vide du cache Discord (guild indisponible, cache pas encore
+rempli) ne doit pas tout archiver : le passage est alors ignoré. Un événement
+archivé qui redevient programmé est réactivé par la synchronisation.
+"""
+import logging
+from typing import Callable, Iterable, List
+
+import discord
+
+from bot.core.interfaces.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+# Statuts Discord des événements encore actifs (ensemble de travail)
+LIVE_EVENT_STATUSES = (discord.EventStatus.scheduled, discord.EventStatus.active)
+
+
+def get_live_events(guild: discord.Guild) -> List[discord.ScheduledEvent]:
+    """Événements programmés ou en cours de la guild (cache Discord)"""
+    return [event for event in guild.scheduled_events if event.status in LIVE_EVENT_STATUSES]
+
+
+class EventArchiveService:
+    """Archive les événements terminés et leurs participations"""
+
+    def __init__(self, uow_factory: Callable[[], UnitOfWork]):
+        self.uow_factory = uow_factory
+
+    def archive_ended_events(self, live_event_ids: Iterable[str]) -> int:
+        """Archive les événements actifs en base absents de `live_event_ids` ; retourne leur nombre"""
+        live_event_ids = set(live_event_ids)
+
+        with self.uow_factory() as uow:
+            active_ids = [event.discord_id for event in uow.events.get_active_events()]
+            if active_ids and not live_event_ids:
+                logger.warning(
+                    f"⚠️ [ARCHIVE] Aucun événement programmé sur Discord pour {len(active_ids)} actif(s) en base "
+                    "(cache incomplet ?), archivage ignoré"
+                )
+                return 0
+
+            ended_ids = [event_id for event_id in active_ids if event_id not in live_event_ids]
+            if not ended_ids:
+                return 0
+
+            counts = uow.participations.count_by_events(ended_ids)
+            moved = uow.participations.archive_by_events(ended_ids)
+            uow.events.mark_as_archived({event_id: counts.get(event_id, 0) for event_id in ended_ids})
+
+        logger.info(
+            f"🗄️ [ARCHIVE] {len(ended_ids)} événement(s) archivé(s), {moved} participation(s) déplacée(s)"
+        )
+        return len(ended_ids)
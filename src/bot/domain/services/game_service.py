@@ -2,7 +2,7 @@
 Service métier pour les jeux
 """
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from bot.core.interfaces.unit_of_work import UnitOfWork
 from bot.domain.models import GameResponse
 
@@ -12,6 +12,11 @@ logger = logging.getLogger(__name__)
 class GameService:
     """Service métier pour les jeux"""
     
+    # Score minimal pour proposer une correspondance approchée
+    FUZZY_MATCH_THRESHOLD = 0.6
+    # Score à partir duquel un nouveau jeu est considéré comme un doublon probable
+    DUPLICATE_THRESHOLD = 0.85
+    
     def __init__(self, uow: UnitOfWork):
         self.uow = uow
     
@@ -27,9 +32,34 @@ class GameService:
             game = self.uow.games.get_by_name(name)
             return GameResponse.from_orm(game) if game else None
     
+    def search_games(self, query: str, limit: int = 5) -> List[Tuple[GameResponse, float]]:
+        """Recherche approchée de jeux par nom, triée par pertinence"""
+        with self.uow:
+            matches = self.uow.games.search_by_name(query, limit)
+            return [
+                (GameResponse.from_orm(game), score)
+                for game, score in matches
+                if score >= self.FUZZY_MATCH_THRESHOLD
+            ]
+    
+    def find_similar_games(self, name: str) -> List[GameResponse]:
+        """Retourne les jeux suivis dont le nom est quasi identique (doublons probables)"""
+        with self.uow:
+            matches = self.uow.games.search_by_name(name, 3)
+            return [GameResponse.from_orm(game) for game, score in matches if score >= self.DUPLICATE_THRESHOLD]
+    
     def create_game(self, name: str, steam_id: str = None, epic_id: str = None) -> GameResponse:
         """Crée un nouveau jeu"""
         with self.uow:
             game = self.uow.games.create_game(name, steam_id, epic_id)
             self.uow.commit()
             return GameResponse.from_orm(game)
+    
+    def set_alert_price(self, name: str, alert_price: Optional[float]) -> Optional[GameResponse]:
+        """Définit (ou supprime avec None) le seuil d'alerte de prix d'un jeu"""
+        with self.uow:
+            game = self.uow.games.set_alert_price(name, alert_price)
+            if game:
+                self.uow.commit()
+                return GameResponse.from_orm(game)
+            return None
@@ -0,0 +1,226 @@
+"""
+Service de suivi des prix des jeux suivis (historique et alertes de baisse).
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import discord
+from discord.ext import commands
+
+from bot.core.config import PRICE_HISTORY_DOWNSAMPLE_DAYS, PRICE_HISTORY_RETENTION_DAYS
+from bot.core.interfaces.unit_of_work import UnitOfWork
+from bot.core.logging_config import logger
+from bot.core.utils import safe_float, safe_int, safe_str, format_currency
+from bot.infrastructure.cheapshark_client import CheapSharkClient, CheapSharkError
+from bot.domain.services.store_service import StoreService
+
+
+class TrackedGame(NamedTuple):
+    """Instantané d'un jeu suivi, détaché de la session"""
+    id: int
+    name: str
+    steam_id: Optional[str]
+    alert_price: Optional[float]
+
+
+class PriceDrop(NamedTuple):
+    """Passage du meilleur prix d'un jeu sous son seuil d'alerte"""
+    game_name: str
+    store_id: str
+    deal_id: str
+    previous_price: Optional[float]
+    sale_price: float
+    alert_price: float
+
+
+class PriceTrackingService:
+    """Alimente l'historique des prix et détecte les baisses sous le seuil d'alerte."""
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], UnitOfWork],
+        client: CheapSharkClient,
+        alert_channel_id: Optional[int],
+        store_service: Optional[StoreService] = None,
+    ) -> None:
+        self.uow_factory = uow_factory
+        self.client = client
+        self.alert_channel_id = alert_channel_id
+        self.store_service = store_service
+
+    async def refresh_tracked_games(self) -> List[PriceDrop]:
+        """Relève les prix de tous les jeux suivis et retourne les alertes à publier."""
+        with self.uow_factory() as uow:
+            games = [
+                TrackedGame(game.id, game.name, game.steam_id, game.alert_price)
+                for game in uow.games.get_all()
+            ]
+
+        drops: List[PriceDrop] = []
+        appended_total = 0
+
+        for game in games:
+            try:
+                deals_data = await self.client.fetch_game_deals(game.name, game.steam_id)
+            except CheapSharkError as exc:
+                logger.error("❌ [PRICES] Erreur lors du relevé des prix de %s : %s", game.name, exc)
+                continue
+
+            # La requête réseau est faite hors transaction, l'écriture est courte
+            with self.uow_factory() as uow:
+                appended, drop = self._ingest_deals(uow, game, deals_data, datetime.utcnow())
+
+            appended_total += appended
+            if drop:
+                drops.append(drop)
+
+        logger.info(
+            "✅ [PRICES] %d jeu(x) relevé(s), %d changement(s) de prix, %d alerte(s)",
+            len(games),
+            appended_total,
+            len(drops),
+        )
+        return drops
+
+    def _ingest_deals(
+        self,
+        uow: UnitOfWork,
+        game: TrackedGame,
+        deals_data: List[Dict[str, Any]],
+        observed_at: datetime,
+    ) -> Tuple[int, Optional[PriceDrop]]:
+        """Met à jour les promotions et n'ajoute à l'historique que les prix qui ont changé."""
+        latest = uow.price_history.get_latest_by_game(game.id)
+        current_prices = {store_id: entry.sale_price for store_id, entry in latest.items()}
+        previous_prices = dict(current_prices)
+        existing_deals = {deal.deal_id: deal for deal in uow.deals.get_by_game(game.id)}
+        best_deal_by_store: Dict[str, str] = {}
+        appended = 0
+
+        for deal_data in deals_data:
+            deal_id = safe_str(deal_data.get('dealID'))
+            store_id = safe_str(deal_data.get('storeID'))
+            sale_price = safe_float(deal_data.get('salePrice'))
+            normal_price = safe_float(deal_data.get('normalPrice'))
+            if not deal_id or not store_id or sale_price is None:
+                continue
+
+            self._upsert_deal(uow, game, existing_deals, deal_id, deal_data, sale_price, normal_price, store_id)
+            best_deal_by_store[store_id] = deal_id
+
+            if current_prices.get(store_id) == sale_price:
+                continue  # Prix inchangé : pas de nouveau point
+
+            uow.price_history.append(game.id, store_id, sale_price, normal_price, observed_at)
+            current_prices[store_id] = sale_price
+            appended += 1
+
+        if not appended or game.alert_price is None or not best_deal_by_store:
+            return appended, None
+
+        # Meilleurs prix calculés sur les seuls stores présents dans ce relevé : le dernier
+        # prix connu d'un store qui ne propose plus le jeu n'est plus disponible
+        previous_best = min(
+            (previous_prices[store_id] for store_id in best_deal_by_store if store_id in previous_prices),
+            default=None,
+        )
+        best_store, best_price = min(
+            ((store_id, current_prices[store_id]) for store_id in best_deal_by_store),
+            key=lambda item: item[1],
+        )
+        crossed = previous_best is None or previous_best > game.alert_price
+        if best_price <= game.alert_price and crossed:
+            return appended, PriceDrop(
+                game.name,
+                best_store,
+                best_deal_by_store.get(best_store, ''),
+                previous_best,
+                best_price,
+                game.alert_price,
+            )
+        return appended, None
+
+    @staticmethod
+    def _upsert_deal(
+        uow: UnitOfWork,
+        game: TrackedGame,
+        existing_deals: Dict[str, Any],
+        deal_id: str,
+        deal_data: Dict[str, Any],
+        sale_price: float,
+        normal_price: Optional[float],
+        store_id: str,
+    ) -> None:
+        """Crée ou met à jour la promotion courante correspondant au relevé."""
+        deal = existing_deals.get(deal_id) or uow.deals.get_by_deal_id(deal_id)
+        savings = safe_float(deal_data.get('savings')) or 0.0
+        if deal is None:
+            release_ts = safe_int(deal_data.get('releaseDate'))
+            change_ts = safe_int(deal_data.get('lastChange'))
+            deal = uow.deals.create_deal(
+                game.id,
+                deal_id,
+                safe_str(deal_data.get('title')) or game.name,
+                sale_price,
+                normal_price if normal_price is not None else sale_price,
+                savings,
+                store_id,
+                safe_float(deal_data.get('dealRating')),
+                datetime.utcfromtimestamp(release_ts) if release_ts else None,
+                datetime.utcfromtimestamp(change_ts) if change_ts else None,
+            )
+            existing_deals[deal_id] = deal
+        elif deal.sale_price != sale_price or deal.savings != savings:
+            deal.sale_price = sale_price
+            deal.savings = savings
+            if normal_price is not None:
+                deal.normal_price = normal_price
+            uow.deals.update(deal)
+
+    def apply_retention(self) -> Tuple[int, int]:
+        """Sous-échantillonne puis purge l'historique ancien. Retourne (réduits, purgés)."""
+        now = datetime.utcnow()
+        with self.uow_factory() as uow:
+            downsampled = 0
+            purged = 0
+            if PRICE_HISTORY_DOWNSAMPLE_DAYS > 0:
+                downsampled = uow.price_history.downsample(now - timedelta(days=PRICE_HISTORY_DOWNSAMPLE_DAYS))
+            if PRICE_HISTORY_RETENTION_DAYS > 0:
+                purged = uow.price_history.purge(now - timedelta(days=PRICE_HISTORY_RETENTION_DAYS))
+
+        if downsampled or purged:
+            logger.info(
+                "🧹 [PRICES] Historique : %d relevé(s) sous-échantillonné(s), %d purgé(s)",
+                downsampled,
+                purged,
+            )
+        return downsampled, purged
+
+    async def publish_alerts(self, bot: commands.Bot, drops: List[PriceDrop]) -> None:
+        """Publie les alertes de baisse de prix dans le canal dédié."""
+        if not drops:
+            return
+
+        channel = bot.get_channel(self.alert_channel_id) if self.alert_channel_id else None
+        if channel is None:
+            logger.warning(
+                "⚠️ [PRICES] Canal d'alertes introuvable (%s), %d alerte(s) ignorée(s).",
+                self.alert_channel_id,
+                len(drops),
+            )
+            return
+
+        for drop in drops:
+            store_name = self.store_service.get_name(drop.store_id) if self.store_service else drop.store_id
+            message = (
+                f"📉 **{drop.game_name}** passe à {format_currency(drop.sale_price)} "
+                f"(seuil : {format_currency(drop.alert_price)}) | Store: {store_name}"
+            )
+            if drop.deal_id:
+                message += f"\nhttps://www.cheapshark.com/redirect?dealID={drop.deal_id}"
+            try:
+                await channel.send(message)
+            except discord.HTTPException as exc:
+                logger.error("❌ [PRICES] Erreur lors de l'envoi de l'alerte : %s", exc)
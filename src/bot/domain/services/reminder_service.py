@@ -0,0 +1,185 @@
+"""
+Service de rappels envoyés aux participants avant le début d'un événement.
+
+Les échéances de rappel sont gardées dans un tas (min-heap) : la tâche de
+distribution dort jusqu'à la plus proche au lieu d'interroger périodiquement
+tous les événements. Le tas est mis à jour au fil des événements Discord
+(création, modification, annulation) ; une entrée remplacée ou annulée reste
+dans le tas mais est ignorée à son extraction (invalidation paresseuse).
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import discord
+
+from bot.core.interfaces.unit_of_work import UnitOfWork
+from bot.core.logging_config import logger
+from bot.domain.services.event_archive_service import LIVE_EVENT_STATUSES, get_live_events
+from bot.domain.utils.create_text_table import DISCORD_MESSAGE_LIMIT, split_text
+from bot.infrastructure.http_scheduler import TokenBucket
+
+
+class ReminderService:
+    """Planifie et distribue les rappels d'événements (mentions groupées ou messages privés)"""
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], UnitOfWork],
+        minutes_before: int,
+        channel_id: Optional[int] = None,
+        dm_rate: float = 1.0,
+        dm_burst: int = 5,
+    ) -> None:
+        self.uow_factory = uow_factory
+        self.lead_time = timedelta(minutes=minutes_before)
+        self.channel_id = channel_id
+        self.dm_rate = dm_rate
+        self.dm_burst = dm_burst
+        self._heap: List[Tuple[datetime, str]] = []
+        self._deadlines: Dict[str, datetime] = {}  # Échéance valide de chaque événement
+        self._events: Dict[str, discord.ScheduledEvent] = {}
+        self._reminded: Dict[str, datetime] = {}  # Échéance pour laquelle le rappel est parti
+        self._bot: Optional[discord.Client] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._dm_bucket: Optional[TokenBucket] = None
+        self._deliveries: Set[asyncio.Task] = set()
+
+    @property
+    def is_running(self) -> bool:
+        return self._runner is not None and not self._runner.done()
+
+    def start(self, bot: discord.Client, guild: discord.Guild) -> None:
+        """Construit le tas à partir des événements programmés et démarre la distribution"""
+        if self.is_running:
+            return
+        self._bot = bot
+        self._wakeup = asyncio.Event()
+        self._dm_bucket = TokenBucket(self.dm_rate, self.dm_burst)
+
+        now = datetime.now(timezone.utc)
+        for event in get_live_events(guild):
+            if event.start_time and event.start_time - self.lead_time <= now:
+                # Échéance dépassée au démarrage : rappel considéré comme déjà envoyé
+                self._reminded[str(event.id)] = event.start_time - self.lead_time
+            self.schedule_event(event)
+
+        self._runner = asyncio.get_running_loop().create_task(self._run())
+        logger.info(f"⏰ [REMINDER] Rappels activés ({len(self._deadlines)} événement(s), {self.lead_time} avant)")
+
+    def stop(self) -> None:
+        """Arrête la distribution"""
+        if self._runner and not self._runner.done():
+            self._runner.cancel()
+        for task in list(self._deliveries):
+            task.cancel()
+
+    def schedule_event(self, event: discord.ScheduledEvent) -> None:
+        """Ajoute ou met à jour l'échéance d'un événement (création, modification)"""
+        event_id = str(event.id)
+        if event.status not in LIVE_EVENT_STATUSES or event.start_time is None:
+            self.cancel_event(event_id)
+            return
+
+        deadline = event.start_time - self.lead_time
+        self._events[event_id] = event
+        if deadline in (self._deadlines.get(event_id), self._reminded.get(event_id)):
+            return
+
+        # Nouvel événement ou horaire modifié : un (nouveau) rappel sera envoyé
+        self._deadlines[event_id] = deadline
+        self._reminded.pop(event_id, None)
+        heapq.heappush(self._heap, (deadline, event_id))
+        if self._wakeup is not None and self._heap[0][1] == event_id:
+            self._wakeup.set()
+
+    def cancel_event(self, event_id: str) -> None:
+        """Retire un événement annulé, terminé ou supprimé"""
+        self._deadlines.pop(event_id, None)
+        self._events.pop(event_id, None)
+        self._reminded.pop(event_id, None)
+
+    def on_user_add(self, event: discord.ScheduledEvent, user_id: str) -> None:
+        """Inscription tardive (rappel déjà parti, événement pas commencé) : rappel individuel"""
+        event_id = str(event.id)
+        if event_id not in self._reminded or self._bot is None:
+            return
+        if event.start_time and event.start_time > datetime.now(timezone.utc):
+            self._spawn(self._deliver(event, [user_id]))
+
+    async def _run(self) -> None:
+        """Dort jusqu'à la prochaine échéance valide puis déclenche le rappel"""
+        while True:
+            self._wakeup.clear()
+            timeout = None
+            while self._heap:
+                deadline, event_id = self._heap[0]
+                if self._deadlines.get(event_id) != deadline:
+                    heapq.heappop(self._heap)  # Entrée périmée
+                    continue
+                delay = (deadline - datetime.now(timezone.utc)).total_seconds()
+                if delay > 0:
+                    timeout = delay
+                    break
+                heapq.heappop(self._heap)
+                del self._deadlines[event_id]
+                self._reminded[event_id] = deadline
+                event = self._events.get(event_id)
+                if event is not None:
+                    self._spawn(self._deliver(event, None))
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _spawn(self, coroutine) -> None:
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._deliveries.add(task)
+        task.add_done_callback(self._deliveries.discard)
+
+    async def _deliver(self, event: discord.ScheduledEvent, user_ids: Optional[List[str]]) -> None:
+        """Envoie le rappel aux participants (tous, ou seulement `user_ids`)"""
+        try:
+            if user_ids is None:
+                with self.uow_factory() as uow:
+                    user_ids = [p.user_discord_id for p in uow.participations.get_by_event(str(event.id))]
+            if not user_ids:
+                return
+
+            start_unix = int(event.start_time.timestamp())
+            text = f"⏰ Rappel : **{event.name}** commence <t:{start_unix}:R> (<t:{start_unix}:t>)\n{event.url}"
+
+            channel = self._bot.get_channel(self.channel_id) if self.channel_id else None
+            if channel is not None:
+                await self._send_mentions(channel, text, user_ids)
+            else:
+                await self._send_direct_messages(event.guild, text, user_ids)
+            logger.info(f"⏰ [REMINDER] Rappel envoyé pour {event.name} ({len(user_ids)} participant(s))")
+        except Exception as exc:
+            logger.exception(f"❌ [REMINDER] Erreur lors de l'envoi du rappel de {event.name} : {exc}")
+
+    @staticmethod
+    async def _send_mentions(channel: discord.abc.Messageable, text: str, user_ids: List[str]) -> None:
+        """Mentions groupées en aussi peu de messages que possible"""
+        mentions = [f"<@{user_id}>" for user_id in user_ids]
+        for index, block in enumerate(split_text(mentions, DISCORD_MESSAGE_LIMIT - len(text) - 1)):
+            await channel.send(f"{text}\n{block}" if index == 0 else block)
+
+    async def _send_direct_messages(self, guild: Optional[discord.Guild], text: str, user_ids: List[str]) -> None:
+        """Messages privés, débit limité par un seau à jetons"""
+        for user_id in user_ids:
+            member = guild.get_member(int(user_id)) if guild else None
+            if member is None:
+                continue
+            await self._dm_bucket.take()
+            try:
+                await member.send(text)
+            except discord.Forbidden:
+                logger.debug(f"[REMINDER] Messages privés fermés pour {user_id}")
+            except discord.HTTPException as exc:
+                logger.warning(f"⚠️ [REMINDER] Échec du rappel privé pour {user_id} : {exc}")
@@ -0,0 +1,73 @@
+"""
+Service de cache des métadonnées des stores CheapShark
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional, Union
+
+from bot.core.config import STORES_REFRESH_INTERVAL_SECONDS
+from bot.core.interfaces.unit_of_work import UnitOfWork
+from bot.core.utils import safe_bool, safe_str
+from bot.infrastructure.cheapshark_client import CheapSharkClient, CheapSharkError
+
+logger = logging.getLogger(__name__)
+
+
+class StoreService:
+    """Résout les noms de stores depuis un dictionnaire en mémoire, persisté en base"""
+
+    def __init__(self, uow_factory: Callable[[], UnitOfWork], client: CheapSharkClient):
+        self.uow_factory = uow_factory
+        self.client = client
+        self._names: Dict[str, str] = {}
+        self._last_update: Optional[datetime] = None
+
+    def load(self) -> int:
+        """Charge les stores persistés en mémoire (aucun appel réseau)"""
+        with self.uow_factory() as uow:
+            self._names = {store.store_id: store.name for store in uow.stores.get_all()}
+            self._last_update = uow.stores.get_last_update()
+        return len(self._names)
+
+    def is_stale(self) -> bool:
+        """Retourne True si la liste des stores doit être rafraîchie"""
+        if not self._names or self._last_update is None:
+            return True
+        return datetime.utcnow() - self._last_update >= timedelta(seconds=STORES_REFRESH_INTERVAL_SECONDS)
+
+    async def refresh(self, force: bool = False) -> bool:
+        """Récupère la liste des stores auprès de CheapShark si elle est périmée"""
+        if not force and not self.is_stale():
+            return False
+
+        try:
+            stores_data = await self.client.fetch_stores()
+        except CheapSharkError as exc:
+            logger.error(f"❌ [STORES] Erreur lors de la récupération des stores : {exc}")
+            return False
+
+        stores = []
+        for data in stores_data:
+            store_id = safe_str(data.get('storeID'))
+            name = safe_str(data.get('storeName'))
+            if store_id and name:
+                is_active = safe_bool(data.get('isActive'))
+                stores.append({'store_id': store_id, 'name': name, 'is_active': is_active is not False})
+
+        if not stores:
+            return False
+
+        with self.uow_factory() as uow:
+            uow.stores.upsert_stores(stores)
+
+        self._names = {store['store_id']: store['name'] for store in stores}
+        self._last_update = datetime.utcnow()
+        logger.info(f"✅ [STORES] {len(stores)} stores mis en cache")
+        return True
+
+    def get_name(self, store_id: Union[str, int, None]) -> str:
+        """Retourne le nom d'un store, ou son ID s'il est inconnu"""
+        store_id = safe_str(store_id)
+        if not store_id:
+            return "N/A"
+        return self._names.get(store_id, store_id)
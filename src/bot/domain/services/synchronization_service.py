@@ -12,10 +12,29 @@ from discord.ext import commands
 from bot.core.config import PARIS_TZ, SUBSCRIPTION_COOLDOWN_SECONDS
 from bot.core.interfaces.unit_of_work import UnitOfWork
 from bot.core.logging_config import logger
+from bot.domain.services.event_archive_service import get_live_events
+from bot.infrastructure.metrics import SYNC_API_CALLS, SYNC_DURATION, SYNC_ROWS_WRITTEN
+from bot.infrastructure.tracing import Trace
 
 
 NotificationEntry = Tuple[str, str, str, str]
 
+# Éléments renvoyés par page par l'API Discord (participants d'un événement, membres de la guild)
+EVENT_USERS_PAGE_SIZE = 100
+GUILD_MEMBERS_PAGE_SIZE = 1000
+
+
+def _pages_received(items: int, page_size: int, complete: bool) -> int:
+    """
+    Pages effectivement reçues pour `items` éléments itérés.
+
+    Une pagination complète se termine par une page incomplète (éventuellement
+    vide) ; interrompue par une erreur, seules les pages déjà parcourues comptent.
+    """
+    if complete:
+        return items // page_size + 1
+    return -(-items // page_size)
+
 
 class SynchronizationService:
     """Assure la synchronisation des événements, participations et utilisateurs."""
@@ -57,64 +76,95 @@ class SynchronizationService:
             )
 
         notifications: List[NotificationEntry] = []
+        trace = Trace("sync")
 
         try:
-            discord_events: List[discord.ScheduledEvent] = list(guild.scheduled_events)
+            # Ensemble de travail : événements programmés ou en cours (les autres sont archivés)
+            discord_events: List[discord.ScheduledEvent] = get_live_events(guild)
             logger.info("📅 [SYNC] %d événements programmés trouvés sur Discord.", len(discord_events))
 
             with self.uow_factory() as uow:
-                db_events = {event.discord_id: event for event in uow.events.get_all()}
-
                 # 1. Synchronisation des événements manquants
-                for discord_event in discord_events:
-                    event_id = str(discord_event.id)
-                    if event_id not in db_events:
-                        uow.events.create_by_discord_id(event_id, discord_event.name)
-                        logger.info(
-                            "➕ [SYNC] Nouvel événement ajouté en base : %s (%s)",
-                            discord_event.name,
-                            event_id,
-                        )
+                with trace.span("events") as span:
+                    db_events = {event.discord_id: event for event in uow.events.get_active_events()}
+                    for discord_event in discord_events:
+                        event_id = str(discord_event.id)
+                        if event_id in db_events:
+                            continue
+                        existing = uow.events.get_by_discord_id(event_id)
+                        if existing is None:
+                            uow.events.create_by_discord_id(
+                                event_id, discord_event.name, getattr(discord_event.entity_type, 'name', None)
+                            )
+                            span.rows += 1
+                            logger.info(
+                                "➕ [SYNC] Nouvel événement ajouté en base : %s (%s)",
+                                discord_event.name,
+                                event_id,
+                            )
+                        elif existing.is_passed:
+                            # Archivé à tort (ex : cache Discord incomplet) : l'événement est de nouveau programmé
+                            uow.events.reactivate(existing)
+                            restored = uow.participations.restore_by_events([event_id])
+                            span.rows += 1 + restored
+                            logger.info(
+                                "♻️ [SYNC] Événement réactivé : %s (%s), %d participation(s) restaurée(s)",
+                                discord_event.name,
+                                event_id,
+                                restored,
+                            )
 
                 # 2. Synchronisation des participations
                 for discord_event in discord_events:
                     event_id = str(discord_event.id)
-                    participant_ids, user_lookup = await self._collect_event_participants(discord_event)
-
-                    db_participations = uow.participations.get_by_event(event_id)
-                    db_participants = {p.user_discord_id for p in db_participations}
-
-                    new_participants = participant_ids - db_participants
-                    removed_participants = db_participants - participant_ids
+                    event_label = f"{discord_event.name} ({event_id})"
 
-                    for user_id in new_participants:
-                        uow.participations.create_participation(event_id, user_id)
-
-                        user_event_obj = user_lookup.get(user_id)
-                        display_name = self._extract_display_name(user_event_obj, user_id)
-
-                        user_entity = uow.users.get_by_discord_id(user_id)
-                        if not user_entity:
-                            user_entity = uow.users.get_or_create_by_discord_id(user_id, display_name)
+                    with trace.span("fetch", event_label) as span:
+                        participant_ids, user_lookup, span.pages = await self._collect_event_participants(
+                            discord_event
+                        )
 
-                        username_db = user_entity.username if user_entity else display_name
+                    with trace.span("diff", event_label):
+                        db_participations = uow.participations.get_by_event(event_id)
+                        db_participants = {p.user_discord_id for p in db_participations}
+
+                        new_participants = participant_ids - db_participants
+                        removed_participants = db_participants - participant_ids
+
+                    with trace.span("apply", event_label) as span:
+                        # Utilisateurs chargés et créés en lot, participations écrites en un flush
+                        usernames = {
+                            user_id: user.username
+                            for user_id, user in uow.users.get_by_discord_ids(
+                                new_participants | removed_participants
+                            ).items()
+                        }
+                        missing_users = {
+                            user_id: self._extract_display_name(user_lookup.get(user_id), user_id)
+                            for user_id in new_participants if user_id not in usernames
+                        }
+                        uow.users.create_many(missing_users)
+                        usernames.update(missing_users)
+                        span.rows += uow.participations.create_participations(event_id, new_participants)
+
+                        for user_id in new_participants:
+                            username_db = usernames[user_id]
 
-                        if not self._is_in_subscription_cooldown(user_id, event_id):
-                            notifications.append(("join", event_id, user_id, username_db))
-                        self._record_subscription_action(user_id, event_id)
-                        logger.info(
-                            "✅ [SYNC] Inscription détectée pour l'événement %s (%s) : %s",
-                            discord_event.name,
-                            event_id,
-                            username_db,
-                        )
+                            if not self._is_in_subscription_cooldown(user_id, event_id):
+                                notifications.append(("join", event_id, user_id, username_db))
+                            self._record_subscription_action(user_id, event_id)
+                            logger.info(
+                                "✅ [SYNC] Inscription détectée pour l'événement %s (%s) : %s",
+                                discord_event.name,
+                                event_id,
+                                username_db,
+                            )
 
-                    for user_id in removed_participants:
-                        user_entity = uow.users.get_by_discord_id(user_id)
-                        username_db = user_entity.username if user_entity else user_id
+                        removed = uow.participations.remove_participations(event_id, removed_participants)
+                        span.rows += len(removed)
+                        for user_id in removed:
+                            username_db = usernames.get(user_id, user_id)
 
-                        removed = uow.participations.remove_participation(event_id, user_id)
-                        if removed:
                             if not self._is_in_subscription_cooldown(user_id, event_id):
                                 notifications.append(("leave", event_id, user_id, username_db))
                             self._record_subscription_action(user_id, event_id)
@@ -126,7 +176,7 @@ class SynchronizationService:
                             )
 
                 # 3. Synchronisation des membres
-                new_members, removed_members = await self._sync_members_table(uow, guild)
+                new_members, removed_members = await self._sync_members_table(uow, guild, trace)
                 if new_members or removed_members:
                     logger.info(
                         "👥 [SYNC] Utilisateurs synchronisés : %d ajout(s), %d suppression(s).",
@@ -134,15 +184,55 @@ class SynchronizationService:
                         removed_members,
                     )
 
+                # Le commit a lieu à la sortie du bloc
+                commit_span = trace.start("commit")
+            commit_span.finish()
+
             # 4. Notifications dans le canal dédié
-            if notifications and notification_channel:
-                await self._publish_notifications(notification_channel, notifications, discord_events)
+            with trace.span("notify"):
+                if notifications and notification_channel:
+                    await self._publish_notifications(notification_channel, notifications, discord_events)
 
-            logger.info("✅ [SYNC] Synchronisation terminée")
+            self._report_trace(trace, guild)
 
         except Exception as exc:
             logger.exception("❌ [SYNC] Erreur lors de la synchronisation : %s", exc)
 
+    @staticmethod
+    def _report_trace(trace: Trace, guild: discord.Guild) -> None:
+        """Journalise le rapport de la synchronisation et alimente les métriques"""
+        phases = trace.by_phase()
+        for phase, totals in phases.items():
+            SYNC_DURATION.observe(totals.duration, phase=phase)
+            if totals.rows:
+                SYNC_ROWS_WRITTEN.inc(totals.rows, phase=phase)
+        SYNC_DURATION.observe(trace.elapsed, phase='total')
+        SYNC_API_CALLS.observe(trace.pages)
+
+        # Détail par événement, du plus lent au plus rapide
+        events = sorted(trace.by_event().items(), key=lambda item: item[1].duration, reverse=True)
+        for event_label, totals in events:
+            logger.debug(
+                "🔎 [SYNC] %s : %.0f ms, %d page(s), %d ligne(s)",
+                event_label,
+                totals.duration * 1000,
+                totals.pages,
+                totals.rows,
+            )
+
+        report = trace.summary()
+        if events:
+            slowest_label, slowest = events[0]
+            report += f" | plus lent : {slowest_label} {slowest.duration * 1000:.0f} ms"
+
+        duration_ms = trace.elapsed * 1000
+        logger.info(
+            "✅ [SYNC] Synchronisation terminée : %s",
+            report,
+            extra={'component': 'sync', 'guild': guild.id, 'duration_ms': round(duration_ms, 1),
+                   'rows_changed': trace.rows, 'api_pages': trace.pages},
+        )
+
     async def _resolve_notification_channel(
         self,
         bot: commands.Bot,
@@ -174,16 +264,20 @@ class SynchronizationService:
     async def _collect_event_participants(
         self,
         discord_event: discord.ScheduledEvent,
-    ) -> Tuple[Set[str], Dict[str, Union[discord.abc.User, discord.Member, Any]]]:
-        """Retourne l'ensemble des participants d'un événement Discord."""
+    ) -> Tuple[Set[str], Dict[str, Union[discord.abc.User, discord.Member, Any]], int]:
+        """Retourne l'ensemble des participants d'un événement Discord et le nombre de pages reçues."""
         participants: Set[str] = set()
         user_lookup: Dict[str, Union[discord.abc.User, discord.Member, Any]] = {}
+        fetched = 0
+        complete = False
 
         try:
             async for event_user in discord_event.users(limit=None):
+                fetched += 1
                 user_id = str(event_user.id)
                 participants.add(user_id)
                 user_lookup[user_id] = event_user
+            complete = True
 
         except discord.Forbidden:
             logger.warning(
@@ -199,7 +293,7 @@ class SynchronizationService:
                 exc,
             )
 
-        return participants, user_lookup
+        return participants, user_lookup, _pages_received(fetched, EVENT_USERS_PAGE_SIZE, complete)
 
     async def handle_user_add(
         self,
@@ -306,13 +400,48 @@ class SynchronizationService:
         self,
         uow: UnitOfWork,
         guild: discord.Guild,
+        trace: Trace,
     ) -> Tuple[int, int]:
         """Synchronise la table des utilisateurs avec les membres de la guild."""
+        with trace.span("members_fetch") as span:
+            members_map, span.pages = await self._fetch_guild_members(guild)
+
+        if not members_map:
+            members_map = {str(member.id): member for member in guild.members}
+
+        with trace.span("members") as span:
+            db_users = uow.users.get_all()
+            db_users_map = {user.discord_id: user for user in db_users}
+
+            guild_member_ids = set(members_map.keys())
+            db_user_ids = set(db_users_map.keys())
+
+            new_member_ids = guild_member_ids - db_user_ids
+            removed_member_ids = db_user_ids - guild_member_ids
+
+            uow.users.create_many({user_id: members_map[user_id].display_name for user_id in new_member_ids})
+
+            for user_id in removed_member_ids:
+                user = db_users_map.get(user_id)
+                if user:
+                    uow.users.delete(user.id)
+
+            span.rows = len(new_member_ids) + len(removed_member_ids)
+
+        return len(new_member_ids), len(removed_member_ids)
+
+    @staticmethod
+    async def _fetch_guild_members(guild: discord.Guild) -> Tuple[Dict[str, discord.Member], int]:
+        """Membres de la guild via l'API (partiels en cas d'erreur) et nombre de pages reçues."""
         members_map: Dict[str, discord.Member] = {}
+        fetched = 0
+        complete = False
 
         try:
             async for member in guild.fetch_members(limit=None):
+                fetched += 1
                 members_map[str(member.id)] = member
+            complete = True
         except discord.Forbidden:
             logger.warning(
                 "⚠️ [SYNC] Accès refusé lors de la récupération des membres de la guild %s (%s).",
@@ -327,28 +456,7 @@ class SynchronizationService:
                 exc,
             )
 
-        if not members_map:
-            members_map = {str(member.id): member for member in guild.members}
-
-        db_users = uow.users.get_all()
-        db_users_map = {user.discord_id: user for user in db_users}
-
-        guild_member_ids = set(members_map.keys())
-        db_user_ids = set(db_users_map.keys())
-
-        new_member_ids = guild_member_ids - db_user_ids
-        removed_member_ids = db_user_ids - guild_member_ids
-
-        for user_id in new_member_ids:
-            member = members_map[user_id]
-            uow.users.get_or_create_by_discord_id(user_id, member.display_name)
-
-        for user_id in removed_member_ids:
-            user = db_users_map.get(user_id)
-            if user:
-                uow.users.delete(user.id)
-
-        return len(new_member_ids), len(removed_member_ids)
+        return members_map, _pages_received(fetched, GUILD_MEMBERS_PAGE_SIZE, complete)
 
     async def _publish_notifications(
         self,
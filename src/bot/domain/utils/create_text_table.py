@@ -1,27 +1,75 @@
+from typing import List, Tuple
 
 
-def create_text_table(data_rows: list[dict], columns: dict[str, str]) -> str:
-    """Crée un tableau de texte formaté pour un bloc de code Discord (Markdown)"""
-    
+# Limite de caractères d'un message Discord
+DISCORD_MESSAGE_LIMIT = 2000
+
+
+def _table_layout(data_rows: list[dict], columns: dict[str, str]) -> Tuple[str, str, List[str]]:
+    """Calcule l'en-tête, le séparateur et les lignes du tableau (largeurs communes à toutes les pages)"""
+
     # Calculer la largeur maximale de chaque colonne
     col_widths = {col: len(col) for col in columns.keys()}
-    
+
     for row in data_rows:
         for col_key, col_title in columns.items():
             value = str(row.get(col_key, ''))
             col_widths[col_key] = max(col_widths[col_key], len(value))
-            
+
     # Ajouter un peu de marge
     col_widths = {k: v + 2 for k, v in col_widths.items()}
-    
+
     # Création de l'en-tête et du séparateur
     header = " | ".join(col_title.ljust(col_widths[col_key]) for col_key, col_title in columns.items())
     separator = " | ".join("-" * col_widths[col_key] for col_key in columns.keys())
-    
-    # Ajout des lignes de données
-    table_content = f"{header}\n{separator}\n"
-    for row in data_rows:
-        line = " | ".join(str(row.get(col_key, '')).ljust(col_widths[col_key]) for col_key in columns.keys())
-        table_content += f"{line}\n"
-        
-    return table_content.strip()
+
+    # Lignes de données
+    lines = [
+        " | ".join(str(row.get(col_key, '')).ljust(col_widths[col_key]) for col_key in columns.keys())
+        for row in data_rows
+    ]
+    return header, separator, lines
+
+
+def create_text_table(data_rows: list[dict], columns: dict[str, str]) -> str:
+    """Crée un tableau de texte formaté pour un bloc de code Discord (Markdown)"""
+    header, separator, lines = _table_layout(data_rows, columns)
+    return "\n".join([header, separator, *lines]).strip()
+
+
+def paginate_text_table(data_rows: list[dict], columns: dict[str, str], max_length: int) -> List[str]:
+    """
+    Découpe un tableau de texte en pages de `max_length` caractères au plus.
+
+    Chaque page répète l'en-tête et le séparateur ; une ligne n'est jamais coupée.
+    """
+    header, separator, lines = _table_layout(data_rows, columns)
+    return _pack(lines, max_length, "\n", [header, separator])
+
+
+def split_text(items: List[str], max_length: int, separator: str = " ") -> List[str]:
+    """Regroupe des éléments (ex : mentions) en blocs de `max_length` caractères au plus"""
+    return _pack(items, max_length, separator, [])
+
+
+def _pack(items: List[str], max_length: int, separator: str, page_header: List[str]) -> List[str]:
+    """Remplit des pages avec les éléments dans l'ordre, sans dépasser `max_length`"""
+    header_length = sum(len(part) + len(separator) for part in page_header)
+    pages: List[str] = []
+    current: List[str] = []
+    current_length = header_length
+
+    for item in items:
+        item = item[:max(max_length - header_length, 1)]  # Élément seul trop long : tronqué
+        added_length = len(item) + (len(separator) if current else 0)
+        if current and current_length + added_length > max_length:
+            pages.append(separator.join(page_header + current).strip())
+            current = []
+            current_length = header_length
+            added_length = len(item)
+        current.append(item)
+        current_length += added_length
+
+    if current or not pages:
+        pages.append(separator.join(page_header + current).strip())
+    return pages
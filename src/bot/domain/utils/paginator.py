@@ -0,0 +1,58 @@
+"""
+Envoi de contenus paginés (messages multiples ou pages interactives à boutons)
+"""
+from typing import List, Optional
+
+import discord
+from discord.ext import commands
+
+
+# Place réservée au pied de page "Page x/y"
+PAGE_FOOTER_RESERVE = 32
+
+
+class PaginatorView(discord.ui.View):
+    """Vue Discord affichant une page à la fois avec des boutons précédent/suivant"""
+
+    def __init__(self, pages: List[str], author_id: Optional[int] = None, timeout: float = 300):
+        super().__init__(timeout=timeout)
+        self.pages = pages
+        self.author_id = author_id
+        self.index = 0
+        self._update_buttons()
+
+    def render(self) -> str:
+        """Contenu de la page courante avec son pied de page"""
+        return f"{self.pages[self.index]}\n-# Page {self.index + 1}/{len(self.pages)}"
+
+    def _update_buttons(self) -> None:
+        self.previous_page.disabled = self.index == 0
+        self.next_page.disabled = self.index >= len(self.pages) - 1
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Seul l'auteur de la commande peut tourner les pages
+        return self.author_id is None or interaction.user.id == self.author_id
+
+    async def _show(self, interaction: discord.Interaction) -> None:
+        self._update_buttons()
+        await interaction.response.edit_message(content=self.render(), view=self)
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.index = max(self.index - 1, 0)
+        await self._show(interaction)
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.index = min(self.index + 1, len(self.pages) - 1)
+        await self._show(interaction)
+
+
+async def send_pages(ctx: commands.Context, pages: List[str]) -> None:
+    """Envoie une page seule directement, plusieurs pages avec une vue interactive"""
+    if len(pages) == 1:
+        await ctx.send(pages[0])
+        return
+
+    view = PaginatorView(pages, author_id=ctx.author.id)
+    await ctx.send(view.render(), view=view)
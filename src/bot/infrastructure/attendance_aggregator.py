@@ -0,0 +1,114 @@
+"""
+Mise à jour incrémentale des agrégats de participation.
+
+Chaque inscription (INSERT) ou désinscription (DELETE) d'une participation via
+l'ORM incrémente, dans la même transaction, les compteurs du mois concerné :
+par utilisateur et par type d'événement. Les changements sont regroupés par
+flush (ou par INSERT en masse via l'ORM) : une requête pour les types
+d'événements, puis un upsert multi-lignes par table d'agrégats, quel que soit
+le nombre de participations.
+
+L'archivage, qui déplace les participations par DELETE en masse, ne déclenche
+pas ces écouteurs : les agrégats conservent donc l'historique des événements
+archivés.
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from bot.domain.entities import Event, EventParticipation, EventTypeAttendance, MonthlyAttendance
+
+# Type attribué aux participations dont l'événement n'a pas de type connu
+UNKNOWN_EVENT_TYPE = 'unknown'
+
+# Participations du flush en cours, dans session.info
+_PENDING_KEY = 'attendance_pending'
+# Lignes par upsert (4 paramètres par ligne, sous la limite historique de 999 de SQLite)
+_UPSERT_BATCH_SIZE = 200
+
+
+def month_key(moment: datetime) -> str:
+    """Clé de mois des agrégats ('AAAA-MM', UTC)"""
+    return moment.strftime('%Y-%m')
+
+
+def _upsert(connection: Connection, table, key_columns: Tuple[str, ...], deltas: Dict[tuple, List[int]]) -> None:
+    """Ajoute les deltas aux lignes d'agrégat par lots multi-lignes, en créant les lignes manquantes"""
+    rows = [
+        {**dict(zip(key_columns, key)), 'signups': signups, 'cancellations': cancellations}
+        for key, (signups, cancellations) in deltas.items()
+    ]
+    for start in range(0, len(rows), _UPSERT_BATCH_SIZE):
+        statement = sqlite_insert(table).values(rows[start:start + _UPSERT_BATCH_SIZE])
+        statement = statement.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={
+                'signups': table.c.signups + statement.excluded.signups,
+                'cancellations': table.c.cancellations + statement.excluded.cancellations,
+            },
+        )
+        connection.execute(statement)
+
+
+def _record(connection: Connection, changes: List[Tuple[str, str, Optional[datetime], int, int]]) -> None:
+    """
+    Applique les deltas (événement, utilisateur, date d'inscription, inscriptions, annulations) :
+    une requête pour les types d'événements, puis les upserts groupés par clé d'agrégat.
+    """
+    event_ids = {event_id for event_id, _, _, _, _ in changes}
+    event_types = dict(connection.execute(
+        select(Event.discord_id, Event.event_type).where(Event.discord_id.in_(event_ids))
+    ).all())
+
+    monthly: Dict[tuple, List[int]] = {}
+    by_type: Dict[tuple, List[int]] = {}
+    for event_id, user_id, joined_at, signups, cancellations in changes:
+        month = month_key(joined_at or datetime.utcnow())
+        event_type = event_types.get(event_id) or UNKNOWN_EVENT_TYPE
+        for deltas, key in ((monthly, (user_id, month)), (by_type, (month, event_type))):
+            totals = deltas.setdefault(key, [0, 0])
+            totals[0] += signups
+            totals[1] += cancellations
+
+    _upsert(connection, MonthlyAttendance.__table__, ('user_discord_id', 'month'), monthly)
+    _upsert(connection, EventTypeAttendance.__table__, ('month', 'event_type'), by_type)
+
+
+@event.listens_for(Session, 'before_flush')
+def _collect_participation_changes(session: Session, flush_context, instances) -> None:
+    """Retient les participations insérées et supprimées par ce flush"""
+    inserted = [obj for obj in session.new if isinstance(obj, EventParticipation)]
+    deleted = [obj for obj in session.deleted if isinstance(obj, EventParticipation)]
+    if inserted or deleted:
+        session.info[_PENDING_KEY] = (inserted, deleted)
+
+
+@event.listens_for(Session, 'after_flush')
+def _apply_participation_changes(session: Session, flush_context) -> None:
+    """Met à jour les agrégats des participations écrites par le flush"""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending is None:
+        return
+    inserted, deleted = pending
+    changes = [(p.event_discord_id, p.user_discord_id, p.joined_at, 1, 0) for p in inserted]
+    # Une désinscription est imputée au mois de l'inscription annulée
+    changes += [(p.event_discord_id, p.user_discord_id, p.joined_at, -1, 1) for p in deleted]
+    _record(session.connection(), changes)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _on_bulk_participation_insert(orm_execute_state) -> None:
+    """Inscriptions insérées en masse via l'ORM (session.execute(insert(EventParticipation), lignes))"""
+    mapper = orm_execute_state.bind_mapper
+    rows = orm_execute_state.parameters
+    if not (orm_execute_state.is_insert and mapper is not None and mapper.class_ is EventParticipation):
+        return
+    if not isinstance(rows, list) or not rows:
+        return  # INSERT ... SELECT (restauration d'archive) : historique déjà compté
+    _record(orm_execute_state.session.connection(), [
+        (row['event_discord_id'], row['user_discord_id'], row.get('joined_at'), 1, 0) for row in rows
+    ])
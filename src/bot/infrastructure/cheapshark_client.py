@@ -0,0 +1,105 @@
+"""
+Client HTTP pour l'API CheapShark
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import aiohttp
+
+from bot.core.config import (
+    CHEAPSHARK_API_URL,
+    CHEAPSHARK_RATE_LIMIT,
+    CHEAPSHARK_BURST,
+    CHEAPSHARK_SEARCH_PAGE_SIZE,
+)
+from bot.infrastructure.http_scheduler import HttpScheduler, RequestPriority
+from bot.infrastructure.json_stream import JsonArrayStream
+
+logger = logging.getLogger(__name__)
+
+
+class CheapSharkError(Exception):
+    """Erreur lors d'un appel à l'API CheapShark"""
+
+
+class DealSearchResult(NamedTuple):
+    """Résultat tronqué d'une recherche de promotions"""
+    deals: List[Dict[str, Any]]
+    count: int
+    has_more: bool
+
+
+class CheapSharkClient:
+    """Client asynchrone pour l'API CheapShark (requêtes ordonnancées par HttpScheduler)"""
+
+    API_NAME = "cheapshark"
+
+    def __init__(self, scheduler: HttpScheduler, base_url: str = CHEAPSHARK_API_URL):
+        self.scheduler = scheduler
+        self.base_url = base_url
+        scheduler.register_api(self.API_NAME, CHEAPSHARK_RATE_LIMIT, CHEAPSHARK_BURST)
+
+    async def _get_json(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        priority: RequestPriority = RequestPriority.BACKGROUND,
+    ) -> Any:
+        """Effectue un GET et retourne le JSON décodé"""
+        try:
+            status, data = await self.scheduler.get_json(
+                self.API_NAME, f"{self.base_url}{path}", params, priority
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            raise CheapSharkError(f"Erreur réseau sur {path} : {exc}") from exc
+        except ValueError as exc:
+            # JSON malformé ou tronqué
+            raise CheapSharkError(f"Réponse invalide sur {path} : {exc}") from exc
+        if status != 200:
+            raise CheapSharkError(f"HTTP {status} sur {path}")
+        return data
+
+    async def search_deals(self, title: str, limit: int = 10) -> DealSearchResult:
+        """
+        Recherche des promotions par titre (commande interactive).
+        
+        Une seule page triée côté serveur est demandée et lue en flux : seules les
+        `limit` premières promotions sont décodées, les autres sont comptées.
+        """
+        params = {
+            "title": title,
+            "pageSize": CHEAPSHARK_SEARCH_PAGE_SIZE,
+            "sortBy": "Deal Rating",
+        }
+
+        async def read_page(response: aiohttp.ClientResponse) -> DealSearchResult:
+            stream = JsonArrayStream(limit)
+            async for chunk in response.content.iter_chunked(8192):
+                stream.feed(chunk)
+                if stream.finished:
+                    break
+            total_pages = int(response.headers.get("X-Total-Page-Count", "1") or 1)
+            return DealSearchResult(stream.items, stream.count, total_pages > 1)
+
+        try:
+            status, result = await self.scheduler.request(
+                self.API_NAME, f"{self.base_url}/deals", params, RequestPriority.INTERACTIVE, read_page
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as exc:
+            raise CheapSharkError(f"Erreur lors de la recherche : {exc}") from exc
+        if status != 200:
+            raise CheapSharkError(f"HTTP {status} sur /deals")
+        return result
+
+    async def fetch_game_deals(self, name: str, steam_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Récupère les promotions d'un jeu suivi (par Steam App ID si connu, sinon titre exact)"""
+        if steam_id:
+            params = {"steamAppID": steam_id}
+        else:
+            params = {"title": name, "exact": 1}
+        return await self._get_json("/deals", params)
+
+    async def fetch_stores(self) -> List[Dict[str, Any]]:
+        """Récupère la liste des stores"""
+        return await self._get_json("/stores")
@@ -0,0 +1,48 @@
+"""
+Compteurs de version des données, incrémentés par l'Unit of Work à chaque commit.
+
+Ils permettent aux caches de rendu de savoir si les données ont changé sans
+interroger la base : une entrée de cache reste valide tant que la version
+qu'elle a mémorisée n'a pas bougé.
+"""
+from collections import defaultdict
+from typing import DefaultDict, Hashable, Iterable, Tuple
+
+
+class DataVersions:
+    """Versions globale, par table et par clé métier (ex : participations d'un événement)"""
+
+    def __init__(self):
+        self.global_version = 0
+        self._tables: DefaultDict[str, int] = defaultdict(int)
+        self._keys: DefaultDict[Tuple[str, Hashable], int] = defaultdict(int)
+
+    def bump(self, tables: Iterable[str], keys: Iterable[Tuple[str, Hashable]] = ()) -> None:
+        """Enregistre un commit ayant modifié les tables et clés données"""
+        tables = set(tables)
+        keys = set(keys)
+        if not tables and not keys:
+            return
+        self.global_version += 1
+        for table in tables:
+            self._tables[table] += 1
+        for key in keys:
+            self._keys[key] += 1
+
+    def table(self, table: str) -> int:
+        """Version d'une table (toute modification)"""
+        return self._tables[table]
+
+    def key(self, table: str, key: Hashable) -> Tuple[int, int]:
+        """
+        Version d'une clé métier.
+
+        Les modifications en masse (UPDATE/DELETE sans objets chargés) ne sont
+        connues qu'au niveau de la table : la version de la table fait donc
+        partie de celle de la clé lorsque la clé n'a pas pu être déterminée.
+        """
+        return self._tables[f"{table}:bulk"], self._keys[(table, key)]
+
+
+# Instance globale partagée par les Unit of Work et les caches
+data_versions = DataVersions()
@@ -0,0 +1,249 @@
+"""
+Ordonnanceur des requêtes HTTP sortantes vers les APIs externes.
+
+Chaque API dispose d'un seau à jetons (débit + rafale) et d'une file à priorités :
+les commandes interactives passent avant les rafraîchissements en arrière-plan.
+Les réponses 429/5xx sont rejouées avec un backoff exponentiel à gigue, en
+respectant l'en-tête Retry-After lorsqu'il est présent.
+"""
+import asyncio
+import itertools
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Voies de priorité (valeur basse = servie en premier)"""
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+class TokenBucket:
+    """Seau à jetons : `rate` jetons par seconde, au plus `capacity` en réserve"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def pause(self, seconds: float) -> None:
+        """Suspend la distribution de jetons (ex : après un 429)"""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    async def take(self) -> None:
+        """Attend qu'un jeton soit disponible puis le consomme"""
+        while True:
+            now = time.monotonic()
+            if now < self.paused_until:
+                await asyncio.sleep(self.paused_until - now)
+                continue
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def refund(self) -> None:
+        """Restitue un jeton pris mais non utilisé"""
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+
+class ApiStats:
+    """Compteurs d'une API (requêtes, rejeux, attente en file)"""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.failures = 0
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.wait_count += 1
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'throttled': self.throttled,
+            'failures': self.failures,
+            'queue_wait_avg_ms': round(self.wait_total / self.wait_count * 1000, 1) if self.wait_count else 0.0,
+            'queue_wait_max_ms': round(self.wait_max * 1000, 1),
+        }
+
+
+class _ApiLane:
+    """File à priorités et seau à jetons d'une API"""
+
+    def __init__(self, rate: float, burst: int):
+        self.bucket = TokenBucket(rate, burst)
+        self.queue: "asyncio.PriorityQueue[Tuple[int, int, asyncio.Future]]" = asyncio.PriorityQueue()
+        self.stats = ApiStats()
+        self.worker: Optional[asyncio.Task] = None
+
+    async def run(self) -> None:
+        """Distribue les jetons aux requêtes en attente, par ordre de priorité"""
+        while True:
+            # Attend une requête sans la retirer de la file : le jeton ira à la
+            # requête la plus prioritaire au moment où il devient disponible
+            entry = await self.queue.get()
+            if entry[2].done():
+                continue
+            self.queue.put_nowait(entry)
+            await self.bucket.take()
+            waiter = self._next_waiter()
+            if waiter is None:
+                self.bucket.refund()  # Requêtes annulées pendant l'attente du jeton
+            else:
+                waiter.set_result(None)
+
+    def _next_waiter(self) -> Optional[asyncio.Future]:
+        """Requête en attente la plus prioritaire (les requêtes annulées sont écartées)"""
+        while not self.queue.empty():
+            _priority, _seq, waiter = self.queue.get_nowait()
+            if not waiter.done():
+                return waiter
+        return None
+
+
+class HttpScheduler:
+    """Point de passage unique des requêtes HTTP vers les APIs externes"""
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 30.0):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._limits: Dict[str, Tuple[float, int]] = {}
+        self._lanes: Dict[str, _ApiLane] = {}
+        self._sequence = itertools.count()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def register_api(self, api: str, rate: float, burst: int = 1) -> None:
+        """Déclare une API avec son débit autorisé (requêtes/s) et sa rafale"""
+        self._limits[api] = (rate, burst)
+
+    def _get_lane(self, api: str) -> _ApiLane:
+        lane = self._lanes.get(api)
+        if lane is None:
+            rate, burst = self._limits.get(api, (1.0, 1))
+            lane = _ApiLane(rate, burst)
+            self._lanes[api] = lane
+        if lane.worker is None or lane.worker.done():
+            lane.worker = asyncio.get_running_loop().create_task(lane.run())
+        return lane
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def _acquire(self, lane: _ApiLane, priority: RequestPriority) -> None:
+        """Prend place dans la file de l'API et attend son jeton"""
+        waiter = asyncio.get_running_loop().create_future()
+        enqueued_at = time.monotonic()
+        await lane.queue.put((int(priority), next(self._sequence), waiter))
+        try:
+            await waiter
+        finally:
+            if not waiter.done():
+                waiter.cancel()
+        lane.stats.record_wait(time.monotonic() - enqueued_at)
+
+    async def get_json(
+        self,
+        api: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        priority: RequestPriority = RequestPriority.BACKGROUND,
+    ) -> Tuple[int, Any]:
+        """Effectue un GET ordonnancé et retourne (statut, JSON décodé ou None)"""
+        return await self.request(api, url, params, priority, lambda response: response.json(content_type=None))
+
+    async def request(
+        self,
+        api: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        priority: RequestPriority,
+        reader: Callable[[aiohttp.ClientResponse], Awaitable[Any]],
+    ) -> Tuple[int, Any]:
+        """Effectue un GET ordonnancé ; `reader` lit le corps des réponses 200"""
+        lane = self._get_lane(api)
+
+        for attempt in range(self.max_retries + 1):
+            await self._acquire(lane, priority)
+            lane.stats.requests += 1
+
+            async with self._get_session().get(url, params=params) as response:
+                if response.status not in self.RETRY_STATUSES:
+                    data = await reader(response) if response.status == 200 else None
+                    return response.status, data
+                retry_after = self._parse_retry_after(response.headers.get('Retry-After'))
+                status = response.status
+
+            if status == 429:
+                lane.stats.throttled += 1
+            if attempt == self.max_retries:
+                break
+
+            delay = retry_after if retry_after is not None else self._backoff(attempt)
+            if status == 429:
+                # La limite est globale à l'API : toute la voie est suspendue
+                lane.bucket.pause(delay)
+            lane.stats.retries += 1
+            logger.warning(f"⚠️ [HTTP] {api} : HTTP {status}, nouvel essai dans {delay:.1f} s")
+            await asyncio.sleep(delay)
+
+        lane.stats.failures += 1
+        return status, None
+
+    def _backoff(self, attempt: int) -> float:
+        """Backoff exponentiel avec gigue complète"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Interprète Retry-After (secondes ou date HTTP)"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Statistiques par API"""
+        return {api: lane.stats.as_dict() for api, lane in self._lanes.items()}
+
+    async def close(self) -> None:
+        """Arrête les files et ferme la session HTTP"""
+        for lane in self._lanes.values():
+            if lane.worker and not lane.worker.done():
+                lane.worker.cancel()
+        if self._session and not self._session.closed:
+            await self._session.close()
@@ -0,0 +1,216 @@
+"""
+Planificateur de tâches persistant.
+
+La prochaine échéance de chaque tâche est enregistrée en base (table
+`scheduled_jobs`) : un redémarrage reprend la planification là où elle en
+était. Une échéance manquée pendant un arrêt est rattrapée une seule fois au
+démarrage, sauf si son retard dépasse la tolérance de la tâche.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, time as dt_time, timedelta, tzinfo
+from typing import Awaitable, Callable, Dict, Optional
+
+import pytz
+
+from bot.core.interfaces.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+JobFunc = Callable[[], Awaitable[None]]
+
+
+class IntervalSchedule:
+    """Exécution toutes les `seconds` secondes (première exécution immédiate)"""
+
+    def __init__(self, seconds: int):
+        self.seconds = seconds
+
+    def first_run(self, now: datetime) -> datetime:
+        return now
+
+    def next_after(self, moment: datetime) -> datetime:
+        return moment + timedelta(seconds=self.seconds)
+
+    def __str__(self) -> str:
+        return f"interval:{self.seconds}s"
+
+
+class WeeklySchedule:
+    """Exécution hebdomadaire à un jour (0 = lundi) et une heure locale donnés"""
+
+    def __init__(self, weekday: int, at: dt_time, tz: tzinfo):
+        self.weekday = weekday
+        self.at = at
+        self.tz = tz
+
+    def first_run(self, now: datetime) -> datetime:
+        return self.next_after(now)
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Prochaine occurrence strictement après `moment` (UTC naïf), en UTC naïf"""
+        local = pytz.utc.localize(moment).astimezone(self.tz)
+        day = local.date() + timedelta(days=(self.weekday - local.weekday()) % 7)
+        while True:
+            candidate = self.tz.localize(datetime.combine(day, self.at))
+            if candidate > local:
+                return candidate.astimezone(pytz.utc).replace(tzinfo=None)
+            day += timedelta(days=7)
+
+    def __str__(self) -> str:
+        return f"weekly:{self.weekday}@{self.at.strftime('%H:%M')} {self.tz}"
+
+
+class _Job:
+    """Tâche enregistrée et son état en mémoire"""
+
+    def __init__(self, name: str, schedule, func: JobFunc, misfire_grace: Optional[timedelta]):
+        self.name = name
+        self.schedule = schedule
+        self.func = func
+        self.misfire_grace = misfire_grace
+        self.next_run_at: Optional[datetime] = None
+        self.task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.failures = 0
+        self.last_duration = 0.0
+
+
+class JobScheduler:
+    """Exécute les tâches à leur échéance et persiste leur planification"""
+
+    def __init__(self, uow_factory: Callable[[], UnitOfWork]):
+        self.uow_factory = uow_factory
+        self._jobs: Dict[str, _Job] = {}
+        self._wakeup: Optional[asyncio.Event] = None  # Créé dans la boucle asyncio du bot
+        self._runner: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._runner is not None and not self._runner.done()
+
+    def register(self, name: str, schedule, func: JobFunc, misfire_grace_seconds: Optional[int] = None) -> None:
+        """
+        Déclare une tâche.
+
+        `misfire_grace_seconds` : retard maximal toléré pour rattraper une échéance
+        manquée (None = toujours rattraper).
+        """
+        grace = timedelta(seconds=misfire_grace_seconds) if misfire_grace_seconds is not None else None
+        self._jobs[name] = _Job(name, schedule, func, grace)
+        if self.is_running:
+            self._load(self._jobs[name])
+            self._wakeup.set()
+
+    def has_job(self, name: str) -> bool:
+        return name in self._jobs
+
+    def start(self) -> None:
+        """Charge les échéances persistées et démarre la boucle du planificateur"""
+        if self.is_running:
+            return
+        self._wakeup = asyncio.Event()
+        for job in self._jobs.values():
+            self._load(job)
+        self._runner = asyncio.get_running_loop().create_task(self._run())
+        logger.info(f"⏱️ [SCHEDULER] Planificateur démarré ({len(self._jobs)} tâche(s))")
+
+    def stop(self) -> None:
+        """Arrête la boucle et les tâches en cours"""
+        if self._runner and not self._runner.done():
+            self._runner.cancel()
+        for job in self._jobs.values():
+            if job.task and not job.task.done():
+                job.task.cancel()
+
+    def _load(self, job: _Job) -> None:
+        """Reprend l'échéance persistée, ou calcule la première si la planification a changé"""
+        now = datetime.utcnow()
+        with self.uow_factory() as uow:
+            stored = uow.jobs.get_by_name(job.name)
+            if stored is not None and stored.schedule == str(job.schedule):
+                job.next_run_at = stored.next_run_at
+            else:
+                job.next_run_at = job.schedule.first_run(now)
+                uow.jobs.save_next_run(job.name, str(job.schedule), job.next_run_at)
+        logger.info(f"📅 [SCHEDULER] {job.name} : prochaine exécution {job.next_run_at:%Y-%m-%d %H:%M} UTC")
+
+    async def _run(self) -> None:
+        """Boucle principale : dort jusqu'à la prochaine échéance puis lance les tâches dues"""
+        while True:
+            now = datetime.utcnow()
+            for job in self._jobs.values():
+                if job.next_run_at is not None and job.next_run_at <= now and not self._is_busy(job):
+                    job.task = asyncio.get_running_loop().create_task(self._execute(job, scheduled=True))
+
+            pending = [job.next_run_at for job in self._jobs.values() if job.next_run_at and not self._is_busy(job)]
+            delay = (min(pending) - now).total_seconds() if pending else 3600
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(1.0, min(delay, 3600)))
+            except asyncio.TimeoutError:
+                pass
+
+    @staticmethod
+    def _is_busy(job: _Job) -> bool:
+        return job.task is not None and not job.task.done()
+
+    async def run_now(self, name: str) -> None:
+        """Exécute immédiatement une tâche (ex : au démarrage) et repousse son échéance"""
+        job = self._jobs[name]
+        if self._is_busy(job):
+            await job.task
+            return
+        job.task = asyncio.get_running_loop().create_task(self._execute(job, scheduled=False))
+        await job.task
+
+    async def _execute(self, job: _Job, scheduled: bool) -> None:
+        started_at = datetime.utcnow()
+
+        # Échéance manquée trop ancienne (ex : annonce d'une semaine passée) : ignorée
+        if scheduled and job.misfire_grace is not None and started_at - job.next_run_at > job.misfire_grace:
+            logger.warning(
+                f"⏭️ [SCHEDULER] {job.name} : échéance du {job.next_run_at:%Y-%m-%d %H:%M} UTC ignorée (trop ancienne)"
+            )
+            self._reschedule(job, started_at, 'skipped')
+            return
+
+        status, error = 'ok', None
+        start = time.perf_counter()
+        try:
+            await job.func()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            status, error = 'error', str(exc)
+            job.failures += 1
+            logger.exception(f"❌ [SCHEDULER] Erreur lors de l'exécution de {job.name} : {exc}")
+        job.runs += 1
+        job.last_duration = time.perf_counter() - start
+        self._reschedule(job, started_at, status, error)
+
+    def _reschedule(self, job: _Job, run_at: datetime, status: str, error: Optional[str] = None) -> None:
+        # Une seule exécution de rattrapage : la prochaine échéance part de l'exécution
+        job.next_run_at = job.schedule.next_after(run_at)
+        try:
+            with self.uow_factory() as uow:
+                uow.jobs.record_run(job.name, run_at, status, job.next_run_at, error)
+        except Exception as exc:
+            logger.error(f"❌ [SCHEDULER] Impossible d'enregistrer l'exécution de {job.name} : {exc}")
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def get_stats(self) -> Dict[str, Dict[str, object]]:
+        """État des tâches (prochaine échéance, exécutions, échecs, dernière durée)"""
+        return {
+            job.name: {
+                'schedule': str(job.schedule),
+                'next_run_at': job.next_run_at.isoformat() if job.next_run_at else None,
+                'running': self._is_busy(job),
+                'runs': job.runs,
+                'failures': job.failures,
+                'last_duration_ms': round(job.last_duration * 1000, 1),
+            }
+            for job in self._jobs.values()
+        }
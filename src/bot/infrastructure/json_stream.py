@@ -0,0 +1,119 @@
+"""
+Lecture incrémentale d'un tableau JSON.
+
+Seuls les `keep` premiers éléments sont décodés ; les suivants sont simplement
+comptés en suivant la profondeur d'imbrication, sans être matérialisés. La
+mémoire utilisée est donc bornée par la taille d'un bloc reçu et des éléments
+conservés, quelle que soit la taille de la réponse.
+"""
+import codecs
+import json
+import re
+from typing import Any, List
+
+# Caractères significatifs hors chaîne / dans une chaîne
+_STRUCTURAL = re.compile(r'["\[\]{},]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class JsonArrayStream:
+    """Parseur incrémental d'un tableau JSON de premier niveau"""
+
+    def __init__(self, keep: int):
+        self.keep = keep
+        self.items: List[Any] = []
+        self.count = 0
+        self.finished = False
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._skip_next = False
+        self._in_element = False
+        self._parts: List[str] = []
+
+    def feed(self, data: bytes) -> None:
+        """Traite un bloc d'octets de la réponse"""
+        if self.finished:
+            return
+
+        text = self._decoder.decode(data)
+        length = len(text)
+        position = 0
+
+        if not self._started:
+            position = text.find('[')
+            if position < 0:
+                if text.strip():
+                    raise ValueError("La réponse n'est pas un tableau JSON")
+                return
+            self._started = True
+            position += 1
+
+        segment_start = position
+        if self._skip_next and position < length:
+            # Caractère échappé en début de bloc
+            position += 1
+            self._skip_next = False
+
+        while position < length:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(text, position)
+                if match is None:
+                    position = length
+                    break
+                position = match.end()
+                if match.group() == '\\':
+                    if position >= length:
+                        self._skip_next = True
+                        break
+                    position += 1
+                else:
+                    self._in_string = False
+                continue
+
+            match = _STRUCTURAL.search(text, position)
+            if match is None:
+                position = length
+                break
+
+            char = match.group()
+            position = match.end()
+            if self._depth == 0 and not self._in_element and text[segment_start:match.start()].strip():
+                self._in_element = True  # Valeur scalaire (nombre, booléen, null)
+
+            if char == '"':
+                self._in_string = True
+                self._in_element = True
+            elif char in '{[':
+                self._depth += 1
+                self._in_element = True
+            elif char in '}]':
+                if self._depth == 0:
+                    # Fin du tableau de premier niveau
+                    self._end_element(text[segment_start:match.start()])
+                    self.finished = True
+                    return
+                self._depth -= 1
+            elif self._depth == 0:
+                self._end_element(text[segment_start:match.start()])
+                segment_start = position
+
+        remainder = text[segment_start:]
+        if self._depth == 0 and not self._in_string and remainder.strip():
+            self._in_element = True
+        if len(self.items) < self.keep:
+            self._parts.append(remainder)
+
+    def _end_element(self, tail: str) -> None:
+        """Clôt l'élément courant : décodé s'il fait partie des premiers, sinon compté"""
+        if len(self.items) < self.keep:
+            self._parts.append(tail)
+            raw = "".join(self._parts).strip()
+            if raw:
+                self.items.append(json.loads(raw))
+                self.count += 1
+        elif self._in_element:
+            self.count += 1
+        self._parts = []
+        self._in_element = False
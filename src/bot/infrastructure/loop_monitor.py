@@ -0,0 +1,150 @@
+"""
+Surveillance de la boucle asyncio : mesure du retard et détection des blocages.
+
+Une tâche dort `interval` secondes et mesure de combien son réveil dépasse
+l'échéance : ce dépassement est le temps pendant lequel la boucle était
+occupée par du code bloquant (SQLAlchemy, écriture de fichiers...).
+
+Un thread de surveillance vérifie que cette tâche se réveille à temps. Si la
+boucle reste bloquée au-delà du seuil, il capture la pile d'appels du thread
+de la boucle pendant le blocage : le log indique quelle commande, quel
+gestionnaire de la gateway ou quelle phase de synchronisation bloque.
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import List, Optional
+
+from bot.core.config import SRC_DIR
+from bot.infrastructure.metrics import EVENT_LOOP_LAG, metrics
+
+logger = logging.getLogger(__name__)
+
+LAST_LOOP_LAG = metrics.gauge("event_loop_lag_last_seconds", "Dernier retard mesuré de la boucle asyncio")
+LOOP_STALLS = metrics.counter("event_loop_stalls_total", "Blocages de la boucle asyncio au-delà du seuil")
+
+_THIS_FILE = Path(__file__).resolve()
+_SRC_DIR = SRC_DIR.resolve()
+_ASYNCIO_HANDLE_FILE = Path(asyncio.events.__file__).resolve()  # Handle._run : exécution d'un callback
+
+
+def _project_frames(stack: traceback.StackSummary) -> List[traceback.FrameSummary]:
+    """Cadres de la pile appartenant au code du bot (hors bibliothèques)"""
+    frames = []
+    for frame in stack:
+        path = Path(frame.filename).resolve()
+        if path != _THIS_FILE and _SRC_DIR in path.parents:
+            frames.append(frame)
+    return frames
+
+
+def _describe(frame: traceback.FrameSummary) -> str:
+    return f"{Path(frame.filename).resolve().relative_to(_SRC_DIR)}:{frame.lineno} ({frame.name})"
+
+
+class LoopLagMonitor:
+    """Échantillonne le retard de la boucle asyncio et signale les blocages"""
+
+    def __init__(self, interval: float = 1.0, stall_threshold: float = 0.5, debug: bool = False):
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.debug = debug
+        self.last_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._expected_wakeup = 0.0  # time.monotonic() du prochain réveil attendu
+        self._stall_location: Optional[str] = None  # Origine du blocage en cours (capturée par le thread)
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        loop = asyncio.get_running_loop()
+        if self.debug:
+            # Mode debug asyncio : chaque callback plus long que le seuil est signalé par le logger "asyncio"
+            loop.set_debug(True)
+            loop.slow_callback_duration = self.stall_threshold or 0.1
+        self._loop_thread_id = threading.get_ident()
+        self._expected_wakeup = time.monotonic() + self.interval
+        self._task = loop.create_task(self._run())
+
+        if self.stall_threshold > 0:
+            self._stopping.clear()
+            self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+            self._watchdog.start()
+        logger.info(
+            f"⏱️ [LOOP] Surveillance de la boucle activée (mesure toutes les {self.interval:g} s, "
+            f"seuil de blocage {self.stall_threshold:g} s{', mode debug asyncio' if self.debug else ''})"
+        )
+
+    def stop(self) -> None:
+        self._stopping.set()
+        if self.is_running:
+            self._task.cancel()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            self._expected_wakeup = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            self.last_lag = max(0.0, loop.time() - expected)
+            EVENT_LOOP_LAG.observe(self.last_lag)
+            LAST_LOOP_LAG.set(self.last_lag)
+
+            if self.stall_threshold > 0 and self.last_lag >= self.stall_threshold:
+                LOOP_STALLS.inc()
+                location, self._stall_location = self._stall_location, None
+                logger.warning(
+                    "🐢 [LOOP] Boucle bloquée pendant %.0f ms%s",
+                    self.last_lag * 1000,
+                    f" : {location}" if location else "",
+                    extra={'component': 'loop', 'duration_ms': round(self.last_lag * 1000, 1)},
+                )
+
+    def _watch(self) -> None:
+        """Thread de surveillance : capture la pile de la boucle pendant un blocage"""
+        check_every = max(self.stall_threshold / 2, 0.05)
+        reported_wakeup = None
+        while not self._stopping.wait(check_every):
+            expected = self._expected_wakeup
+            overdue = time.monotonic() - expected
+            if overdue < self.stall_threshold or expected == reported_wakeup:
+                continue
+            reported_wakeup = expected  # Une seule capture par blocage
+            self._report_stall(overdue)
+
+    def _report_stall(self, overdue: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        stack = traceback.extract_stack(frame)
+        # Seul le callback en cours compte (pas le lancement du bot ni la boucle elle-même)
+        callback_starts = [i for i, f in enumerate(stack) if Path(f.filename).resolve() == _ASYNCIO_HANDLE_FILE]
+        if callback_starts:
+            stack = traceback.StackSummary.from_list(stack[callback_starts[-1] + 1:])
+        project_frames = _project_frames(stack)
+        if project_frames:
+            # Point d'entrée (commande, gestionnaire, tâche) et appel bloquant le plus profond
+            entry, innermost = project_frames[0], project_frames[-1]
+            self._stall_location = (
+                _describe(entry) if entry is innermost else f"{_describe(entry)} → {_describe(innermost)}"
+            )
+        else:
+            self._stall_location = f"{stack[-1].filename}:{stack[-1].lineno} ({stack[-1].name})"
+        logger.warning(
+            "🐢 [LOOP] Boucle bloquée depuis %.0f ms dans %s\n%s",
+            overdue * 1000,
+            self._stall_location,
+            "".join(traceback.format_list(stack)).rstrip(),
+            extra={'component': 'loop', 'duration_ms': round(overdue * 1000, 1)},
+        )
@@ -0,0 +1,256 @@
+"""
+Registre de métriques en mémoire (compteurs, jauges, histogrammes).
+
+Les métriques sont exposées au format texte Prometheus (endpoint HTTP local
+optionnel) et résumées par la commande `$metrics`. Les jauges dérivées d'autres
+composants (caches, planificateurs, logs perdus) sont mises à jour par des
+collecteurs appelés juste avant chaque lecture.
+"""
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# Bornes (en secondes) adaptées aux durées du bot : de la requête SQL à la synchronisation complète
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class _Metric:
+    """Base commune : nom, description et étiquettes"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()  # Les collecteurs et l'endpoint peuvent lire depuis un autre thread
+
+    def _label_values(self, labels: Dict[str, object]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Étiquettes attendues pour {self.name} : {self.labelnames}, reçues : {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _format_labels(self, values: LabelValues, extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(zip(self.labelnames, values))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Valeur croissante (nombre d'exécutions, de commits...)"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def items(self) -> List[Tuple[LabelValues, float]]:
+        with self._lock:
+            return sorted(self._values.items())
+
+    def _render_samples(self) -> List[str]:
+        return [f"{self.name}{self._format_labels(key)} {_format_value(value)}" for key, value in self.items()]
+
+
+class Gauge(Counter):
+    """Valeur instantanée (taille de cache, retard de la boucle...)"""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class _HistogramValue:
+    __slots__ = ("bucket_counts", "count", "total", "maximum")
+
+    def __init__(self, buckets: int):
+        self.bucket_counts = [0] * buckets
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+
+class Histogram(_Metric):
+    """Distribution de durées (en secondes) ou de quantités"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._values: Dict[LabelValues, _HistogramValue] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = _HistogramValue(len(self.buckets))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry.bucket_counts[index] += 1
+                    break
+            entry.count += 1
+            entry.total += value
+            entry.maximum = max(entry.maximum, value)
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """Observe la durée du bloc, en secondes"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def summary(self) -> List[Tuple[LabelValues, int, float, float]]:
+        """(étiquettes, nombre, moyenne, maximum) par série"""
+        with self._lock:
+            return [
+                (key, entry.count, entry.total / entry.count if entry.count else 0.0, entry.maximum)
+                for key, entry in sorted(self._values.items())
+            ]
+
+    def _render_samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            for key, entry in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, entry.bucket_counts):
+                    cumulative += count
+                    labels = self._format_labels(key, ("le", _format_value(bound)))
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                lines.append(f"{self.name}_sum{self._format_labels(key)} {_format_value(entry.total)}")
+                lines.append(f"{self.name}_count{self._format_labels(key)} {entry.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Ensemble des métriques du bot, identifiées par leur nom"""
+
+    def __init__(self, namespace: str = "dictabot"):
+        self.namespace = namespace
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        full_name = f"{self.namespace}_{name}"
+        metric = self._metrics.get(full_name)
+        if metric is None:
+            metric = self._metrics[full_name] = cls(full_name, documentation, labelnames, **kwargs)
+        elif type(metric) is not cls:
+            raise ValueError(f"Métrique {full_name} déjà déclarée comme {metric.kind}")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Fonction appelée avant chaque lecture pour rafraîchir des jauges"""
+        self._collectors.append(collector)
+
+    def collect(self) -> List[_Metric]:
+        """Rafraîchit les jauges dérivées et retourne les métriques triées par nom"""
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception:
+                # Une source indisponible ne doit pas empêcher l'export des autres métriques
+                continue
+        return [self._metrics[name] for name in sorted(self._metrics)]
+
+    def render_prometheus(self) -> str:
+        """Export au format texte Prometheus (version 0.0.4)"""
+        lines: List[str] = []
+        for metric in self.collect():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Registre global partagé par les services et les cogs
+metrics = MetricsRegistry()
+
+# Métriques communes, déclarées ici pour être présentes dans l'export dès le démarrage
+SYNC_DURATION = metrics.histogram(
+    "sync_duration_seconds", "Durée de la synchronisation Discord/base par phase", ("phase",)
+)
+SYNC_API_CALLS = metrics.histogram(
+    "sync_api_calls", "Appels à l'API Discord par synchronisation (pages de participants)", buckets=(1, 2, 5, 10, 20, 50, 100, 200)
+)
+SYNC_ROWS_WRITTEN = metrics.counter("sync_rows_written_total", "Lignes écrites par la synchronisation", ("phase",))
+DB_TRANSACTION_DURATION = metrics.histogram(
+    "db_transaction_duration_seconds", "Durée des transactions (ouverture de l'unité de travail au commit)"
+)
+DB_QUERIES_PER_TRANSACTION = metrics.histogram(
+    "db_queries_per_transaction", "Requêtes SQL par unité de travail", buckets=(1, 2, 5, 10, 20, 50, 100, 500, 1000, 5000)
+)
+COMMAND_SQL_QUERIES = metrics.histogram(
+    "command_sql_queries", "Requêtes SQL par commande", ("command",), buckets=(0, 1, 2, 5, 10, 20, 50, 100, 500)
+)
+DB_COMMIT_DURATION = metrics.histogram("db_commit_duration_seconds", "Durée des commits SQLite")
+DB_COMMITS = metrics.counter("db_commits_total", "Transactions commitées", ("status",))
+GATEWAY_HANDLER_DURATION = metrics.histogram(
+    "gateway_handler_duration_seconds", "Durée de traitement des événements de la gateway", ("event",)
+)
+COMMAND_DURATION = metrics.histogram(
+    "command_duration_seconds", "Durée d'exécution des commandes", ("command", "status")
+)
+STARTUP_DURATION = metrics.gauge("startup_duration_seconds", "Durée des phases du dernier démarrage", ("phase",))
+EVENT_LOOP_LAG = metrics.histogram(
+    "event_loop_lag_seconds", "Retard de la boucle asyncio", buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
@@ -0,0 +1,42 @@
+"""
+Endpoint HTTP local exposant les métriques au format texte Prometheus.
+"""
+import logging
+from typing import Optional
+
+from aiohttp import web
+
+from bot.infrastructure.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain"
+
+
+class MetricsServer:
+    """Serveur aiohttp minimal servant `GET /metrics` dans la boucle du bot"""
+
+    def __init__(self, registry: MetricsRegistry, host: str, port: int):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"📈 [METRICS] Endpoint disponible sur http://{self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        """Ferme le socket d'écoute et libère le runner (sans effet s'il n'est pas démarré)"""
+        if self._runner is None:
+            return
+        runner, self._runner = self._runner, None
+        await runner.cleanup()
+        logger.info("🛑 [METRICS] Endpoint arrêté")
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(text=self.registry.render_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,206 @@
+"""
+Profilage à la demande d'une coroutine (commande, synchronisation).
+
+Deux modes :
+- "cprofile" : profil déterministe cProfile, enregistré au format pstats
+  (lisible avec `python -m pstats` ou snakeviz) ;
+- "sampling" : échantillonnage de la pile du thread de la boucle à intervalle
+  régulier, enregistré en piles repliées (format flamegraph / speedscope).
+  Surcoût faible, adapté à une opération longue en production.
+
+Le profil couvre le thread de la boucle asyncio pendant toute l'opération :
+les autres tâches actives à ce moment y apparaissent aussi.
+"""
+import asyncio
+import cProfile
+import logging
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable, List, NamedTuple
+
+from bot.core.config import DATA_DIR, PARIS_TZ
+
+logger = logging.getLogger(__name__)
+
+PROFILES_DIR = DATA_DIR / "profiles"
+PROFILER_MODES = ("cprofile", "sampling")
+
+_ASYNCIO_HANDLE_FILE = asyncio.events.__file__  # Handle._run : exécution d'un callback de la boucle
+_IDLE_LOOP = "<boucle en attente>"
+
+
+class FunctionStat(NamedTuple):
+    """Fonction du profil : appels (ou échantillons) et temps cumulé"""
+    function: str
+    calls: int
+    cumulative: float
+
+
+class ProfileResult(NamedTuple):
+    path: Path
+    mode: str
+    duration: float
+    top: List[FunctionStat]
+
+
+def _function_label(filename: str, lineno: int, name: str) -> str:
+    """Nom court : fichier relatif au projet (ou module de la bibliothèque), ligne, fonction"""
+    path = Path(filename)
+    parts = path.parts
+    for anchor in ("src", "site-packages"):
+        if anchor in parts:
+            path = Path(*parts[parts.index(anchor) + 1:])
+            break
+    else:
+        path = Path(path.name) if path.name else path
+    return f"{path}:{lineno}({name})" if lineno else name
+
+
+class _StackSampler:
+    """Échantillonne la pile d'un thread depuis un thread dédié"""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            # Pile du callback en cours uniquement (ni le lancement du bot ni la boucle elle-même)
+            stack = []
+            while frame is not None and frame.f_code.co_filename != _ASYNCIO_HANDLE_FILE:
+                code = frame.f_code
+                stack.append(_function_label(code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if frame is None:
+                stack = [_IDLE_LOOP]  # Aucun callback en cours : la boucle attend des E/S
+            self.stacks[tuple(reversed(stack))] += 1
+            self.samples += 1
+
+    def top(self, limit: int, duration: float) -> List[FunctionStat]:
+        """Fonctions présentes dans le plus d'échantillons, temps cumulé estimé au prorata de `duration`"""
+        inclusive: Counter = Counter()
+        for stack, count in self.stacks.items():
+            for function in set(stack):
+                inclusive[function] += count
+        return [
+            FunctionStat(function, count, duration * count / self.samples)
+            for function, count in inclusive.most_common(limit)
+        ]
+
+    def write_collapsed(self, path: Path) -> None:
+        """Piles repliées : "racine;...;feuille nombre" par ligne"""
+        with path.open("w", encoding="utf-8") as file:
+            for stack, count in self.stacks.most_common():
+                file.write(f"{';'.join(stack)} {count}\n")
+
+
+class Profiler:
+    """Exécute une coroutine sous profilage et enregistre le profil dans DATA_DIR/profiles"""
+
+    def __init__(self, mode: str = "cprofile", sampling_interval: float = 0.005, retention_days: int = 7,
+                 top_limit: int = 15):
+        if mode not in PROFILER_MODES:
+            raise ValueError(f"Mode de profilage inconnu : {mode} (attendu : {', '.join(PROFILER_MODES)})")
+        self.mode = mode
+        self.sampling_interval = sampling_interval
+        self.retention_days = retention_days
+        self.top_limit = top_limit
+        self._lock = threading.Lock()  # Un seul profil à la fois (cProfile n'est pas réentrant)
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    async def run(self, label: str, target: Callable[[], Awaitable[object]]) -> ProfileResult:
+        """Profile `target()` ; RuntimeError si un profil est déjà en cours"""
+        if not self._lock.acquire(blocking=False):
+            raise RuntimeError("Un profilage est déjà en cours")
+        try:
+            PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+            self._cleanup_old_profiles()
+            stem = f"{datetime.now(PARIS_TZ):%Y-%m-%d_%H-%M-%S}_{_safe_name(label)}"
+            if self.mode == "sampling":
+                return await self._run_sampling(stem, target)
+            return await self._run_cprofile(stem, target)
+        finally:
+            self._lock.release()
+
+    async def _run_cprofile(self, stem: str, target: Callable[[], Awaitable[object]]) -> ProfileResult:
+        profile = cProfile.Profile()
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            await target()
+        finally:
+            profile.disable()
+        duration = time.perf_counter() - start
+
+        path = PROFILES_DIR / f"{stem}.pstats"
+        profile.dump_stats(str(path))
+        stats = pstats.Stats(profile)
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:self.top_limit]
+        top = [
+            FunctionStat(_function_label(*func), call_count, cumulative)
+            for func, (_, call_count, _, cumulative, _) in rows
+        ]
+        logger.info(f"🔬 [PROFILE] Profil cProfile enregistré : {path.name} ({duration * 1000:.0f} ms)")
+        return ProfileResult(path, self.mode, duration, top)
+
+    async def _run_sampling(self, stem: str, target: Callable[[], Awaitable[object]]) -> ProfileResult:
+        sampler = _StackSampler(threading.get_ident(), self.sampling_interval)
+        start = time.perf_counter()
+        sampler.start()
+        try:
+            await target()
+        finally:
+            sampler.stop()
+        duration = time.perf_counter() - start
+
+        path = PROFILES_DIR / f"{stem}.folded"
+        sampler.write_collapsed(path)
+        logger.info(
+            f"🔬 [PROFILE] Profil échantillonné enregistré : {path.name} "
+            f"({sampler.samples} échantillons, {duration * 1000:.0f} ms)"
+        )
+        return ProfileResult(path, self.mode, duration, sampler.top(self.top_limit, duration))
+
+    def _cleanup_old_profiles(self) -> None:
+        """Supprime les profils plus anciens que la rétention"""
+        cutoff = datetime.now(PARIS_TZ) - timedelta(days=self.retention_days)
+        for path in PROFILES_DIR.iterdir():
+            try:
+                if datetime.fromtimestamp(path.stat().st_mtime, tz=PARIS_TZ) < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+
+def _safe_name(label: str) -> str:
+    return "".join(char if char.isalnum() or char in "-_" else "_" for char in label)[:40] or "profile"
+
+
+def format_top(result: ProfileResult) -> List[dict]:
+    """Lignes de tableau (fonction, appels ou échantillons, temps cumulé) pour l'affichage"""
+    return [
+        {'function': stat.function, 'calls': str(stat.calls), 'cumulative': f"{stat.cumulative * 1000:.1f} ms"}
+        for stat in result.top
+    ]
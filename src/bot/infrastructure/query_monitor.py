@@ -0,0 +1,155 @@
+"""
+Comptage des requêtes SQL et détection des N+1.
+
+Des écouteurs SQLAlchemy (sur tous les moteurs) mesurent chaque requête et
+l'attribuent aux portées de suivi actives : unité de travail, commande, ou
+bloc `track_queries()`. Une même forme de requête répétée de nombreuses fois
+dans une portée signale probablement un N+1 (une requête par élément au lieu
+d'une requête groupée).
+
+Les assistants `assert_max_queries` et `assert_no_n_plus_one` permettent de
+fixer un budget de requêtes sur un chemin critique.
+
+Les formes de requêtes exécutées depuis le démarrage sont aussi comptées
+globalement (`executed_statements`), pour analyser les index utilisés.
+Les requêtes d'introspection (EXPLAIN, PRAGMA, dbstat…) s'exécutent dans
+`untracked_statements()` pour ne pas fausser ce comptage.
+"""
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Répétitions d'une même forme de requête à partir desquelles un N+1 est suspecté
+DEFAULT_N_PLUS_ONE_THRESHOLD = 10
+# Formes de requêtes distinctes conservées pour `executed_statements`
+MAX_TRACKED_STATEMENTS = 1000
+
+_IN_LIST = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)")  # IN (?, ?, ?) -> IN (?)
+_WHITESPACE = re.compile(r"\s+")
+_SELECTED_COLUMNS = re.compile(r"^SELECT .+? FROM ")
+
+
+def statement_shape(statement: str) -> str:
+    """Forme normalisée d'une requête (listes IN et espaces réduits)"""
+    return _WHITESPACE.sub(" ", _IN_LIST.sub("(?)", statement)).strip()
+
+
+class QueryStats:
+    """Requêtes exécutées dans une portée de suivi"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter = Counter()
+        self.active = True
+
+    def record(self, shape: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.shapes[shape] += 1
+
+    def stop(self) -> "QueryStats":
+        """Termine la portée : les requêtes suivantes ne sont plus comptées"""
+        self.active = False
+        return self
+
+    def repeated(self, threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD) -> List[Tuple[str, int]]:
+        """Formes exécutées au moins `threshold` fois (N+1 probables), les plus fréquentes d'abord"""
+        if threshold <= 0:
+            return []
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+_active_scopes: ContextVar[Tuple[QueryStats, ...]] = ContextVar("active_query_scopes", default=())
+_statement_counts: Counter = Counter()  # Exécutions par forme de requête depuis le démarrage
+_counting_statements: ContextVar[bool] = ContextVar("counting_statements", default=True)
+
+
+def executed_statements() -> Dict[str, int]:
+    """Formes de requêtes exécutées depuis le démarrage et leur nombre d'exécutions"""
+    return dict(_statement_counts)
+
+
+@contextmanager
+def untracked_statements() -> Iterator[None]:
+    """Exclut de `executed_statements` les requêtes du bloc (les portées de suivi les comptent toujours)"""
+    token = _counting_statements.set(False)
+    try:
+        yield
+    finally:
+        _counting_statements.reset(token)
+
+
+def start_tracking(name: str) -> QueryStats:
+    """
+    Ouvre une portée de suivi dans le contexte courant (tâche asyncio ou thread).
+
+    La portée reste active jusqu'à `stats.stop()`, même si elle est terminée
+    depuis une autre tâche (ex : hooks de commande).
+    """
+    stats = QueryStats(name)
+    _active_scopes.set(tuple(scope for scope in _active_scopes.get() if scope.active) + (stats,))
+    return stats
+
+
+@contextmanager
+def track_queries(name: str = "bloc") -> Iterator[QueryStats]:
+    """Compte les requêtes exécutées dans le bloc"""
+    stats = start_tracking(name)
+    try:
+        yield stats
+    finally:
+        stats.stop()
+
+
+@contextmanager
+def assert_max_queries(limit: int, name: str = "bloc") -> Iterator[QueryStats]:
+    """Échoue (AssertionError) si le bloc exécute plus de `limit` requêtes"""
+    with track_queries(name) as stats:
+        yield stats
+    if stats.count > limit:
+        details = "\n".join(f"  {count}× {shape}" for shape, count in stats.shapes.most_common(5))
+        raise AssertionError(f"{name} : {stats.count} requêtes SQL (maximum {limit})\n{details}")
+
+
+@contextmanager
+def assert_no_n_plus_one(threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD, name: str = "bloc") -> Iterator[QueryStats]:
+    """Échoue (AssertionError) si une même forme de requête est répétée `threshold` fois ou plus"""
+    with track_queries(name) as stats:
+        yield stats
+    repeated = stats.repeated(threshold)
+    if repeated:
+        details = "\n".join(f"  {count}× {shape}" for shape, count in repeated)
+        raise AssertionError(f"{name} : N+1 probable\n{details}")
+
+
+def format_repeated(repeated: List[Tuple[str, int]], max_length: int = 200) -> str:
+    """Résumé des formes répétées pour les logs (colonnes sélectionnées omises)"""
+    return "; ".join(
+        f"{count}× {_SELECTED_COLUMNS.sub('SELECT … FROM ', shape)[:max_length]}" for shape, count in repeated
+    )
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started_at = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started: Optional[float] = getattr(context, "_query_started_at", None)
+    duration = time.perf_counter() - started if started is not None else 0.0
+    shape = statement_shape(statement)
+    if _counting_statements.get() and (shape in _statement_counts or len(_statement_counts) < MAX_TRACKED_STATEMENTS):
+        _statement_counts[shape] += 1
+    for scope in _active_scopes.get():
+        if scope.active:
+            scope.record(shape, duration)
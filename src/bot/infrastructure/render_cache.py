@@ -0,0 +1,60 @@
+"""
+Cache des réponses rendues par les commandes en lecture seule.
+
+Une entrée est identifiée par la commande et ses arguments, et mémorise la
+version des données (voir `data_versions`) avec laquelle elle a été rendue :
+tant que cette version n'a pas bougé, le rendu est servi depuis la mémoire.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class RenderCache:
+    """Cache LRU borné de rendus, invalidé par changement de version"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[Hashable, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, command: str, args: Hashable, version: Hashable, render: Callable[[], T]) -> T:
+        """Retourne le rendu en cache pour (commande, arguments) s'il est à jour, sinon le recalcule"""
+        key = (command, args)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        value = render()
+        self._entries[key] = (version, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, command: str = None) -> None:
+        """Vide le cache d'une commande, ou tout le cache"""
+        if command is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == command]:
+            del self._entries[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Taille du cache et taux de succès"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+# Instance globale partagée par les cogs
+render_cache = RenderCache()
@@ -0,0 +1,115 @@
+"""
+Traces légères d'une opération découpée en étapes (spans).
+
+Chaque span mesure sa durée et compte les pages d'API demandées et les lignes
+écrites. La trace agrège ensuite les spans par phase et par événement pour
+identifier l'étape ou l'événement qui ralentit l'opération.
+"""
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+class Span:
+    """Étape d'une trace (phase, événement concerné, durée, pages, lignes)"""
+
+    __slots__ = ("phase", "event", "started_at", "duration", "pages", "rows")
+
+    def __init__(self, phase: str, event: Optional[str] = None, started_at: Optional[float] = None):
+        self.phase = phase
+        self.event = event
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.duration: Optional[float] = None  # None tant que le span n'est pas terminé
+        self.pages = 0
+        self.rows = 0
+
+    def finish(self) -> None:
+        if self.duration is None:
+            self.duration = time.perf_counter() - self.started_at
+
+
+class PhaseTotals:
+    """Cumul des spans d'une phase (ou d'un événement)"""
+
+    __slots__ = ("duration", "pages", "rows", "spans")
+
+    def __init__(self):
+        self.duration = 0.0
+        self.pages = 0
+        self.rows = 0
+        self.spans = 0
+
+    def add(self, span: Span) -> None:
+        self.duration += span.duration
+        self.pages += span.pages
+        self.rows += span.rows
+        self.spans += 1
+
+
+class Trace:
+    """Ensemble des spans d'une opération"""
+
+    def __init__(self, name: str, started_at: Optional[float] = None):
+        self.name = name
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.spans: List[Span] = []
+
+    def start(self, phase: str, event: Optional[str] = None, started_at: Optional[float] = None) -> Span:
+        """
+        Ouvre un span terminé explicitement par `finish()` (étape à cheval sur un bloc).
+        `started_at` (time.perf_counter) permet de dater le début d'une étape déjà commencée.
+        """
+        span = Span(phase, event, started_at)
+        self.spans.append(span)
+        return span
+
+    @contextmanager
+    def span(self, phase: str, event: Optional[str] = None) -> Iterator[Span]:
+        """Span couvrant le bloc ; les compteurs `pages` et `rows` sont renseignés dans le bloc"""
+        span = self.start(phase, event)
+        try:
+            yield span
+        finally:
+            span.finish()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def _finished(self) -> Iterator[Span]:
+        return (span for span in self.spans if span.duration is not None)
+
+    def by_phase(self) -> Dict[str, PhaseTotals]:
+        """Totaux par phase, dans l'ordre d'apparition"""
+        totals: Dict[str, PhaseTotals] = {}
+        for span in self._finished():
+            totals.setdefault(span.phase, PhaseTotals()).add(span)
+        return totals
+
+    def by_event(self) -> Dict[str, PhaseTotals]:
+        """Totaux par événement (spans rattachés à un événement uniquement)"""
+        totals: Dict[str, PhaseTotals] = {}
+        for span in self._finished():
+            if span.event is not None:
+                totals.setdefault(span.event, PhaseTotals()).add(span)
+        return totals
+
+    @property
+    def pages(self) -> int:
+        return sum(span.pages for span in self._finished())
+
+    @property
+    def rows(self) -> int:
+        return sum(span.rows for span in self._finished())
+
+    def summary(self) -> str:
+        """Résumé sur une ligne : durée totale puis détail par phase"""
+        parts = [f"{self.elapsed * 1000:.0f} ms"]
+        for phase, totals in self.by_phase().items():
+            details = [f"{totals.duration * 1000:.0f} ms"]
+            if totals.pages:
+                details.append(f"{totals.pages} page(s)")
+            if totals.rows:
+                details.append(f"{totals.rows} ligne(s)")
+            parts.append(f"{phase} {', '.join(details)}")
+        return " | ".join(parts)
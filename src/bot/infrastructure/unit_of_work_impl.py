@@ -2,14 +2,28 @@
 Implémentation Unit of Work pour la gestion des transactions
 """
 import logging
-from typing import Optional
+import time
+from itertools import chain
+from typing import Hashable, Optional, Set, Tuple
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from bot.core.database import db_engine
+from bot.core.config import SQL_N_PLUS_ONE_THRESHOLD
+from bot.core.logging_config import STRUCTURED_LOGS
+from bot.infrastructure.data_versions import data_versions
+from bot.infrastructure.metrics import (
+    DB_COMMITS, DB_COMMIT_DURATION, DB_QUERIES_PER_TRANSACTION, DB_TRANSACTION_DURATION
+)
+from bot.infrastructure.query_monitor import QueryStats, format_repeated, start_tracking
 from bot.core.interfaces.unit_of_work import UnitOfWork
 from bot.core.repositories.sqlite_repository import (
     SQLiteUserRepository, SQLiteEventRepository, SQLiteParticipationRepository,
-    SQLiteGameRepository, SQLiteDealRepository, SQLiteDatabaseRepository
+    SQLiteGameRepository, SQLiteDealRepository, SQLitePriceHistoryRepository,
+    SQLiteStoreRepository, SQLiteAttendanceStatsRepository, SQLiteJobRepository,
+    SQLiteDatabaseRepository
 )
+# Écouteurs ORM alimentant les agrégats de participation
+import bot.infrastructure.attendance_aggregator  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
@@ -20,17 +34,30 @@ class SQLiteUnitOfWork:
     def __init__(self):
         self.session: Optional[Session] = None
         self._repositories = {}
+        self._touched_tables: Set[str] = set()
+        self._touched_keys: Set[Tuple[str, Hashable]] = set()
+        self._rows_changed = 0
+        self._started_at = 0.0
+        self._queries: Optional[QueryStats] = None
     
     def __enter__(self):
         """Context manager entry - démarre une transaction"""
+        self._started_at = time.perf_counter()
+        self._queries = start_tracking("uow")
         self.session = db_engine.get_session()
+        event.listen(self.session, "before_flush", self._collect_changes)
+        event.listen(self.session, "do_orm_execute", self._collect_bulk_changes)
         
         # Initialiser les repositories avec la session
         self.users = SQLiteUserRepository(self.session)
         self.events = SQLiteEventRepository(self.session)
         self.participations = SQLiteParticipationRepository(self.session)
-        self.games = SQLiteGameRepository(self.session)
+        self.games = SQLiteGameRepository(self.session, db_engine.fts_enabled)
         self.deals = SQLiteDealRepository(self.session)
+        self.price_history = SQLitePriceHistoryRepository(self.session)
+        self.stores = SQLiteStoreRepository(self.session)
+        self.attendance = SQLiteAttendanceStatsRepository(self.session)
+        self.jobs = SQLiteJobRepository(self.session)
         self.database = SQLiteDatabaseRepository(self.session)
         
         return self
@@ -44,13 +71,50 @@ class SQLiteUnitOfWork:
         
         self.close()
     
+    def _collect_changes(self, session, flush_context, instances):
+        """Mémorise les tables (et clés métier) modifiées avant chaque flush"""
+        for entity in chain(session.new, session.dirty, session.deleted):
+            self._rows_changed += 1
+            table = entity.__table__.name
+            self._touched_tables.add(table)
+            version_key = getattr(type(entity), '__version_key__', None)
+            if version_key:
+                self._touched_keys.add((table, getattr(entity, version_key)))
+    
+    def _collect_bulk_changes(self, orm_execute_state):
+        """Mémorise les tables modifiées par des INSERT/UPDATE/DELETE en masse"""
+        is_bulk_write = orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete
+        if is_bulk_write and orm_execute_state.bind_mapper:
+            table = orm_execute_state.bind_mapper.local_table.name
+            self._touched_tables.update((table, f"{table}:bulk"))
+    
     def commit(self):
         """Valide la transaction"""
         if self.session:
             try:
+                start = time.perf_counter()
                 self.session.commit()
-                logger.debug("✅ [UOW] Transaction commitée")
+                end = time.perf_counter()
+                duration_ms = (end - start) * 1000
+                DB_COMMITS.inc(status='ok')
+                DB_COMMIT_DURATION.observe(end - start)
+                DB_TRANSACTION_DURATION.observe(end - self._started_at)
+                # En mode JSON, les transactions d'écriture sont journalisées pour le suivi des durées
+                level = logging.INFO if STRUCTURED_LOGS and self._touched_tables else logging.DEBUG
+                logger.log(
+                    level,
+                    "✅ [UOW] Transaction commitée (%.1f ms, %d ligne(s) modifiée(s))",
+                    duration_ms,
+                    self._rows_changed,
+                    extra={'component': 'uow', 'duration_ms': round(duration_ms, 1),
+                           'rows_changed': self._rows_changed},
+                )
+                data_versions.bump(self._touched_tables, self._touched_keys)
+                self._touched_tables.clear()
+                self._touched_keys.clear()
+                self._rows_changed = 0
             except Exception as e:
+                DB_COMMITS.inc(status='error')
                 logger.error(f"❌ [UOW] Erreur lors du commit : {e}")
                 self.session.rollback()
                 raise
@@ -60,6 +124,9 @@ class SQLiteUnitOfWork:
         if self.session:
             try:
                 self.session.rollback()
+                self._touched_tables.clear()
+                self._touched_keys.clear()
+                self._rows_changed = 0
                 logger.debug("🔄 [UOW] Transaction annulée")
             except Exception as e:
                 logger.error(f"❌ [UOW] Erreur lors du rollback : {e}")
@@ -74,6 +141,23 @@ class SQLiteUnitOfWork:
                 logger.error(f"❌ [UOW] Erreur lors de la fermeture : {e}")
             finally:
                 self.session = None
+                self._report_queries()
+
+    def _report_queries(self):
+        """Clôt le comptage des requêtes et signale les N+1 probables"""
+        if self._queries is None:
+            return
+        stats, self._queries = self._queries.stop(), None
+        DB_QUERIES_PER_TRANSACTION.observe(stats.count)
+        repeated = stats.repeated(SQL_N_PLUS_ONE_THRESHOLD)
+        if repeated:
+            logger.warning(
+                "🔁 [SQL] N+1 probable dans une transaction (%d requêtes, %.1f ms) : %s",
+                stats.count,
+                stats.duration * 1000,
+                format_repeated(repeated),
+                extra={'component': 'sql', 'duration_ms': round(stats.duration * 1000, 1), 'queries': stats.count},
+            )
 
 
 def create_unit_of_work() -> UnitOfWork:
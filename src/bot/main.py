@@ -2,31 +2,66 @@
 Point d'entrée principal du bot Discord
 """
 
+import asyncio
 import os
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Optional
 
 import discord
 from discord.ext import commands
-from discord.ext import tasks
 
-from bot.core.logging_config import logger
+from bot.core.logging_config import cleanup_old_logs, get_dropped_log_count, logger
 from bot.core.config import (
     validate_config,
     DISCORD_TOKEN,
     DISCORD_GUILD_ID,
     DISCORD_PREFIX,
     SYNC_INTERVAL_SECONDS,
+    ARCHIVE_INTERVAL_SECONDS,
+    DEALS_REFRESH_INTERVAL_SECONDS,
+    PRICE_ALERT_CHANNEL_ID,
+    HTTP_MAX_RETRIES,
+    PARIS_TZ,
+    ANNOUNCE_CHANNEL_ID,
+    ANNOUNCE_WEEKDAY,
+    ANNOUNCE_TIME,
+    ANNOUNCE_CATCH_UP_HOURS,
+    REMINDER_MINUTES_BEFORE,
+    REMINDER_CHANNEL_ID,
+    METRICS_HOST,
+    METRICS_PORT,
+    LOOP_LAG_INTERVAL_SECONDS,
+    LOOP_STALL_THRESHOLD_SECONDS,
+    ASYNCIO_DEBUG,
+    PROFILER_MODE,
+    PROFILE_SAMPLING_INTERVAL_MS,
+    PROFILE_RETENTION_DAYS,
 )
 from bot.core.database import db_engine
 
 from bot.infrastructure.unit_of_work_impl import create_unit_of_work
+from bot.infrastructure.cheapshark_client import CheapSharkClient
+from bot.infrastructure.http_scheduler import HttpScheduler
+from bot.infrastructure.job_scheduler import IntervalSchedule, JobScheduler, WeeklySchedule
+from bot.infrastructure.loop_monitor import LoopLagMonitor
+from bot.infrastructure.metrics import (
+    COMMAND_DURATION, COMMAND_SQL_QUERIES, GATEWAY_HANDLER_DURATION, STARTUP_DURATION, metrics
+)
+from bot.infrastructure.query_monitor import start_tracking
+from bot.infrastructure.profiler import Profiler
+from bot.infrastructure.render_cache import render_cache
+from bot.infrastructure.tracing import Trace
 from bot.domain.services import (
-    UserService,
-    EventService,
-    ParticipationService,
-    GameService,
-    DealService,
     SynchronizationService,
+    StoreService,
+    PriceTrackingService,
+    EventArchiveService,
+    AnnouncementService,
+    ReminderService,
 )
+from bot.domain.services.event_archive_service import get_live_events
 
 
 SYNC_NOTIFICATION_CHANNEL_ID = 1436713852661268592
@@ -35,7 +70,14 @@ SYNC_NOTIFICATION_CHANNEL_ID = 1436713852661268592
 class DiscordBot(commands.Bot):
     """Bot Discord principal avec Clean Architecture"""
     
-    def __init__(self):
+    def __init__(self, started_at: Optional[float] = None):
+        """`started_at` : instant (time.perf_counter) précédant les imports, pour mesurer leur durée"""
+        # Durée de chaque phase du démarrage, rapportée au premier on_ready
+        self._startup_trace = Trace("startup", started_at=started_at)
+        if started_at is not None:
+            self._startup_trace.start("imports", started_at=started_at).finish()
+        init_span = self._startup_trace.start("init")
+        
         # Validation de la configuration
         validate_config()
         
@@ -48,37 +90,107 @@ class DiscordBot(commands.Bot):
         
         # Services métier
         self.uow_factory = create_unit_of_work
-        self.user_service = None
-        self.event_service = None
-        self.participation_service = None
-        self.game_service = None
-        self.deal_service = None
         self.sync_service = SynchronizationService(self.uow_factory, SYNC_NOTIFICATION_CHANNEL_ID)
+        self.archive_service = EventArchiveService(self.uow_factory)
+        self.announcement_service = AnnouncementService()
+        self.job_scheduler = JobScheduler(self.uow_factory)
+        self.loop_monitor = LoopLagMonitor(LOOP_LAG_INTERVAL_SECONDS, LOOP_STALL_THRESHOLD_SECONDS, ASYNCIO_DEBUG)
+        self.profiler = Profiler(PROFILER_MODE, PROFILE_SAMPLING_INTERVAL_MS / 1000, PROFILE_RETENTION_DAYS)
+        self.reminder_service = ReminderService(self.uow_factory, REMINDER_MINUTES_BEFORE, REMINDER_CHANNEL_ID)
+        self.http_scheduler = HttpScheduler(max_retries=HTTP_MAX_RETRIES)
+        self.cheapshark_client = CheapSharkClient(self.http_scheduler)
+        self.store_service = StoreService(self.uow_factory, self.cheapshark_client)
+        self.price_service = PriceTrackingService(
+            self.uow_factory, self.cheapshark_client, PRICE_ALERT_CHANNEL_ID, self.store_service
+        )
         
         # Configuration
         self.token = DISCORD_TOKEN
         self.guild_id = DISCORD_GUILD_ID
+        self._startup_db_stats = None  # Statistiques relevées une fois par démarrage
+        self.metrics_server = None  # Endpoint Prometheus, démarré si METRICS_PORT > 0
+
+        # Mesure de la durée de chaque commande
+        self.before_invoke(self._start_command_timer)
         
         logger.info("🚀 [STARTUP] Démarrage de DictaBot...")
+        init_span.finish()
+        self._login_span = self._startup_trace.start("login")
+    
+    def _startup_phase(self, phase: str):
+        """Span d'une phase du démarrage (sans effet après le premier on_ready, ex : reconnexion)"""
+        return self._startup_trace.span(phase) if self._startup_trace else nullcontext()
     
     async def setup_hook(self):
         """Configuration initiale du bot"""
+        self._login_span.finish()
+        
+        # Nettoyage des anciens logs en tâche de fond (E/S disque hors de la boucle)
+        self._log_cleanup_task = asyncio.create_task(asyncio.to_thread(cleanup_old_logs))
+        
         # Créer les tables
-        db_engine.create_tables()
+        with self._startup_phase("tables"):
+            db_engine.create_tables()
         
-        # Initialiser les services métier
-        uow = self.uow_factory()
-        self.user_service = UserService(uow)
-        self.event_service = EventService(uow)
-        self.participation_service = ParticipationService(uow)
-        self.game_service = GameService(uow)
-        self.deal_service = DealService(uow)
+        # Charger le cache des stores (sans appel réseau)
+        with self._startup_phase("stores"):
+            self.store_service.load()
         
         # Charger les cogs
-        await self.load_cogs()
+        with self._startup_phase("cogs"):
+            await self.load_cogs()
+
+        # Métriques (retard de la boucle, endpoint Prometheus optionnel)
+        with self._startup_phase("metrics"):
+            self._register_metrics_collectors()
+            self.loop_monitor.start()
+            if METRICS_PORT > 0:
+                # Import à la demande : aiohttp.web n'est chargé que si l'endpoint est activé
+                from bot.infrastructure.metrics_server import MetricsServer
+                self.metrics_server = MetricsServer(metrics, METRICS_HOST, METRICS_PORT)
+                try:
+                    await self.metrics_server.start()
+                except OSError as e:
+                    # Libère le runner préparé avant l'échec d'écoute
+                    await self.metrics_server.stop()
+                    self.metrics_server = None
+                    logger.error(f"❌ [METRICS] Impossible d'ouvrir l'endpoint sur {METRICS_HOST}:{METRICS_PORT} : {e}")
         
         logger.info("✅ [SETUP] Configuration terminée")
+        self._gateway_span = self._startup_trace.start("gateway")
     
+    def _register_metrics_collectors(self):
+        """Jauges alimentées par les statistiques des caches, planificateurs et logs"""
+        cache_entries = metrics.gauge("cache_entries", "Entrées en cache", ("cache",))
+        cache_lookups = metrics.gauge("cache_lookups", "Accès au cache depuis le démarrage", ("cache", "result"))
+        cache_hit_ratio = metrics.gauge("cache_hit_ratio", "Taux de succès du cache", ("cache",))
+        http_requests = metrics.gauge("http_requests", "Requêtes HTTP sortantes par API", ("api", "outcome"))
+        http_queue_wait = metrics.gauge("http_queue_wait_avg_seconds", "Attente moyenne en file par API", ("api",))
+        job_runs = metrics.gauge("job_runs", "Exécutions des tâches planifiées", ("job", "outcome"))
+        job_duration = metrics.gauge("job_last_duration_seconds", "Durée de la dernière exécution", ("job",))
+        dropped_logs = metrics.gauge("dropped_logs", "Logs perdus (file pleine)")
+
+        def collect():
+            stats = render_cache.get_stats()
+            cache_entries.set(stats['entries'], cache='render')
+            cache_lookups.set(stats['hits'], cache='render', result='hit')
+            cache_lookups.set(stats['misses'], cache='render', result='miss')
+            cache_hit_ratio.set(stats['hit_rate'], cache='render')
+
+            for api, api_stats in self.http_scheduler.get_stats().items():
+                for outcome in ('requests', 'retries', 'throttled', 'failures'):
+                    http_requests.set(api_stats[outcome], api=api, outcome=outcome)
+                http_queue_wait.set(api_stats['queue_wait_avg_ms'] / 1000, api=api)
+
+            for job, job_stats in self.job_scheduler.get_stats().items():
+                job_runs.set(job_stats['runs'], job=job, outcome='runs')
+                job_runs.set(job_stats['failures'], job=job, outcome='failures')
+                job_duration.set(job_stats['last_duration_ms'] / 1000, job=job)
+
+            dropped_logs.set(get_dropped_log_count())
+
+        metrics.add_collector(collect)
+
     async def load_cogs(self):
         """Charge tous les cogs"""
         logger.info("🔧 [COGS] Chargement des extensions...")
@@ -97,23 +209,27 @@ class DiscordBot(commands.Bot):
         
         cogs_dir = "cogs"  # Pour le load_extension
 
-        files = [f for f in os.listdir(cogs_path) if f.endswith(".py") and f != "__init__.py"]
+        files = sorted(f for f in os.listdir(cogs_path) if f.endswith(".py") and f != "__init__.py")
         logger.info(f"📄 [COGS] Fichiers trouvés : {files}")
 
-        loaded_cogs = 0
-        for filename in files:
+        async def load(filename: str) -> bool:
             extension = f"{cogs_dir}.{filename[:-3]}"
             try:
                 await self.load_extension(extension)
                 logger.info(f"✅ [COGS] {filename} chargé")
-                loaded_cogs += 1
+                return True
             except Exception as e:
                 logger.error(f"❌ [COGS] Erreur lors du chargement de {filename} : {e}")
+                return False
+        
+        # Chargement concurrent : les setup()/cog_load() asynchrones des cogs se chevauchent
+        loaded_cogs = sum(await asyncio.gather(*(load(filename) for filename in files)))
         
         logger.info(f"📊 [COGS] {loaded_cogs} cogs chargés avec succès")
     
     async def on_ready(self):
         """Event appelé quand le bot est prêt"""
+        self._gateway_span.finish()
         logger.info(f"✅ [DISCORD] Connecté en tant que {self.user} (ID: {self.user.id})")
         
         # Vérification du serveur
@@ -131,35 +247,145 @@ class DiscordBot(commands.Bot):
         logger.info(f"✅ [GUILD] Serveur trouvé : {guild.name}")
         
         # Vérification de la santé de la base de données
-        await self._check_database_health()
+        with self._startup_phase("db_health"):
+            await self._check_database_health()
+        
+        # Tâches périodiques (planificateur persistant)
+        if not self.job_scheduler.is_running:
+            self._register_jobs()
+            self.job_scheduler.start()
+        
+        # Rappels avant les événements
+        if REMINDER_MINUTES_BEFORE > 0:
+            self.reminder_service.start(self, guild)
         
         # Synchronisation des données
         logger.info("🔄 [SYNC] Synchronisation avec Discord...")
-        await self.sync_service.sync_guild(self, guild)
-        
-        # Démarrer la synchronisation périodique (option 3 : approche hybride)
+        with self._startup_phase("sync"):
+            if self.job_scheduler.has_job("sync"):
+                await self.job_scheduler.run_now("sync")
+            else:
+                await self.sync_service.sync_guild(self, guild)
+
+        # Résumé final
+        await self._display_startup_summary()
+        if self._startup_trace:
+            self._report_startup()
+    
+    def _report_startup(self):
+        """Journalise la durée de chaque phase du démarrage (une seule fois)"""
+        trace, self._startup_trace = self._startup_trace, None
+        for phase, totals in trace.by_phase().items():
+            STARTUP_DURATION.set(totals.duration, phase=phase)
+        STARTUP_DURATION.set(trace.elapsed, phase="total")
+        slowest = max(trace.by_phase().items(), key=lambda item: item[1].duration)[0]
+        logger.info(
+            f"⏱️ [STARTUP] Démarrage en {trace.summary()} | plus lente : {slowest}",
+            extra={'component': 'startup', 'duration_ms': round(trace.elapsed * 1000, 1)},
+        )
+
+    def _register_jobs(self):
+        """Déclare les tâches périodiques auprès du planificateur"""
+        # Synchronisation périodique de rattrapage (événements manqués, déconnexions)
         if SYNC_INTERVAL_SECONDS > 0:
-            self._sync_loop.change_interval(seconds=SYNC_INTERVAL_SECONDS)
-            self._sync_loop.start(guild)
+            self.job_scheduler.register("sync", IntervalSchedule(SYNC_INTERVAL_SECONDS), self._sync_job)
             logger.info("⏱️ [SYNC] Synchronisation périodique activée (toutes les %d s)", SYNC_INTERVAL_SECONDS)
         else:
             logger.info("⏱️ [SYNC] Synchronisation périodique désactivée (SYNC_INTERVAL_SECONDS=0)")
 
-        # Résumé final
-        await self._display_startup_summary()
+        # Archivage des événements terminés
+        if ARCHIVE_INTERVAL_SECONDS > 0:
+            self.job_scheduler.register("archive", IntervalSchedule(ARCHIVE_INTERVAL_SECONDS), self._archive_job)
+            logger.info("⏱️ [ARCHIVE] Archivage périodique activé (toutes les %d s)", ARCHIVE_INTERVAL_SECONDS)
+
+        # Rafraîchissement de la liste des stores lorsqu'elle est périmée (vérifié toutes les heures)
+        self.job_scheduler.register("stores", IntervalSchedule(3600), self.store_service.refresh)
+
+        # Relevé des prix des jeux suivis
+        if DEALS_REFRESH_INTERVAL_SECONDS > 0:
+            self.job_scheduler.register("deals", IntervalSchedule(DEALS_REFRESH_INTERVAL_SECONDS), self._deals_job)
+            logger.info("⏱️ [PRICES] Relevé périodique des prix activé (toutes les %d s)", DEALS_REFRESH_INTERVAL_SECONDS)
 
-    @tasks.loop(minutes=60)  # Valeur par défaut, écrasée si SYNC_INTERVAL_SECONDS > 0
-    async def _sync_loop(self, guild: discord.Guild):
+        # Annonce hebdomadaire automatique (heure de Paris)
+        if 0 <= ANNOUNCE_WEEKDAY <= 6 and ANNOUNCE_CHANNEL_ID:
+            announce_at = datetime.strptime(ANNOUNCE_TIME, "%H:%M").time()
+            self.job_scheduler.register(
+                "announcement",
+                WeeklySchedule(ANNOUNCE_WEEKDAY, announce_at, PARIS_TZ),
+                self._announcement_job,
+                misfire_grace_seconds=ANNOUNCE_CATCH_UP_HOURS * 3600,
+            )
+            logger.info("⏱️ [ANNONCE] Annonce automatique activée (jour %d à %s)", ANNOUNCE_WEEKDAY, ANNOUNCE_TIME)
+
+    async def _sync_job(self):
         """Synchronisation périodique de rattrapage (événements manqués, déconnexions)."""
-        try:
-            logger.info("🔄 [SYNC] Synchronisation périodique en cours...")
+        guild = self.get_guild(self.guild_id)
+        if guild:
             await self.sync_service.sync_guild(self, guild)
-        except Exception as exc:
-            logger.exception("❌ [SYNC] Erreur lors de la synchronisation périodique : %s", exc)
 
-    @_sync_loop.before_loop
-    async def _sync_loop_before(self):
-        await self.wait_until_ready()
+    async def _archive_job(self):
+        """Archive les événements qui ne sont plus programmés ni en cours sur Discord."""
+        guild = self.get_guild(self.guild_id)
+        if guild is None or guild.unavailable:
+            logger.warning("⚠️ [ARCHIVE] Guild indisponible, archivage ignoré")
+            return
+        live_event_ids = [str(event.id) for event in get_live_events(guild)]
+        self.archive_service.archive_ended_events(live_event_ids)
+
+    async def _deals_job(self):
+        """Relève les prix des jeux suivis, publie les alertes et applique la rétention."""
+        drops = await self.price_service.refresh_tracked_games()
+        await self.price_service.publish_alerts(self, drops)
+        self.price_service.apply_retention()
+
+    async def _announcement_job(self):
+        """Publie l'annonce des événements de la semaine dans le canal d'annonces."""
+        guild = self.get_guild(self.guild_id)
+        channel = self.get_channel(ANNOUNCE_CHANNEL_ID)
+        if guild is None or channel is None:
+            logger.warning("⚠️ [ANNONCE] Guild ou canal d'annonce introuvable, annonce automatique ignorée")
+            return
+
+        message = await self.announcement_service.build_week_announcement(guild)
+        if message is None:
+            logger.info("📅 [ANNONCE] Aucun événement cette semaine, pas d'annonce")
+            return
+        await channel.send(message)
+        logger.info("📢 [ANNONCE] Annonce hebdomadaire publiée")
+
+    @staticmethod
+    async def _start_command_timer(ctx: commands.Context) -> None:
+        ctx.started_at = time.perf_counter()
+        ctx.sql_queries = start_tracking(f"command:{ctx.command.qualified_name}")
+
+    def _log_command(self, ctx: commands.Context, status: str) -> None:
+        """Journalise la durée et les requêtes SQL d'une commande (champs structurés en mode JSON)"""
+        started_at = getattr(ctx, 'started_at', None)
+        if ctx.command is None or started_at is None:
+            return
+        duration_ms = (time.perf_counter() - started_at) * 1000
+        queries = ctx.sql_queries.stop()
+        COMMAND_DURATION.observe(duration_ms / 1000, command=ctx.command.qualified_name, status=status)
+        COMMAND_SQL_QUERIES.observe(queries.count, command=ctx.command.qualified_name)
+        logger.info(
+            "⌨️ [COMMAND] %s%s : %s (%.1f ms, %d requête(s) SQL en %.1f ms)",
+            self.command_prefix,
+            ctx.command.qualified_name,
+            status,
+            duration_ms,
+            queries.count,
+            queries.duration * 1000,
+            extra={'component': 'command', 'guild': ctx.guild.id if ctx.guild else None,
+                   'duration_ms': round(duration_ms, 1), 'command': ctx.command.qualified_name,
+                   'status': status, 'queries': queries.count, 'sql_ms': round(queries.duration * 1000, 1)},
+        )
+
+    async def on_command_completion(self, ctx: commands.Context) -> None:
+        self._log_command(ctx, 'ok')
+
+    async def on_command_error(self, ctx: commands.Context, error: commands.CommandError) -> None:
+        self._log_command(ctx, 'error')
+        await super().on_command_error(ctx, error)
 
     async def on_scheduled_event_user_add(
         self, scheduled_event: discord.ScheduledEvent, user: discord.abc.User
@@ -167,7 +393,9 @@ class DiscordBot(commands.Bot):
         """Inscription en temps réel à un événement planifié."""
         if scheduled_event.guild_id != self.guild_id:
             return
-        await self.sync_service.handle_user_add(self, scheduled_event, user)
+        with GATEWAY_HANDLER_DURATION.time(event='scheduled_event_user_add'):
+            await self.sync_service.handle_user_add(self, scheduled_event, user)
+            self.reminder_service.on_user_add(scheduled_event, str(user.id))
 
     async def on_scheduled_event_user_remove(
         self, scheduled_event: discord.ScheduledEvent, user: discord.abc.User
@@ -175,7 +403,28 @@ class DiscordBot(commands.Bot):
         """Désinscription en temps réel d'un événement planifié."""
         if scheduled_event.guild_id != self.guild_id:
             return
-        await self.sync_service.handle_user_remove(self, scheduled_event, user)
+        with GATEWAY_HANDLER_DURATION.time(event='scheduled_event_user_remove'):
+            await self.sync_service.handle_user_remove(self, scheduled_event, user)
+
+    async def on_scheduled_event_create(self, scheduled_event: discord.ScheduledEvent) -> None:
+        """Nouvel événement : planification de son rappel."""
+        if scheduled_event.guild_id == self.guild_id and self.reminder_service.is_running:
+            with GATEWAY_HANDLER_DURATION.time(event='scheduled_event_create'):
+                self.reminder_service.schedule_event(scheduled_event)
+
+    async def on_scheduled_event_update(
+        self, before: discord.ScheduledEvent, after: discord.ScheduledEvent
+    ) -> None:
+        """Événement modifié (horaire, statut) : mise à jour de son rappel."""
+        if after.guild_id == self.guild_id and self.reminder_service.is_running:
+            with GATEWAY_HANDLER_DURATION.time(event='scheduled_event_update'):
+                self.reminder_service.schedule_event(after)
+
+    async def on_scheduled_event_delete(self, scheduled_event: discord.ScheduledEvent) -> None:
+        """Événement supprimé : annulation de son rappel."""
+        if scheduled_event.guild_id == self.guild_id:
+            with GATEWAY_HANDLER_DURATION.time(event='scheduled_event_delete'):
+                self.reminder_service.cancel_event(str(scheduled_event.id))
     
     async def _check_database_health(self):
         """Vérifie la santé de la base de données"""
@@ -183,12 +432,17 @@ class DiscordBot(commands.Bot):
             logger.info("🔍 [DB-HEALTH] Vérification de l'intégrité...")
             
             uow = self.uow_factory()
+            started_at = time.perf_counter()
             with uow:
                 health = uow.database.health_check()
                 
                 if health['status'] == 'healthy':
                     stats = health['stats']
-                    logger.info("📊 [DB-HEALTH] Statistiques de la base :")
+                    self._startup_db_stats = stats  # Réutilisées par le résumé de démarrage
+                    logger.info(
+                        "📊 [DB-HEALTH] Statistiques de la base :",
+                        extra={'component': 'db', 'duration_ms': round((time.perf_counter() - started_at) * 1000, 1)},
+                    )
                     logger.info(f"  - Utilisateurs enregistrés : {stats['users']}")
                     logger.info(f"  - Événements actifs : {stats['active_events']}")
                     logger.info(f"  - Participations totales : {stats['participations']}")
@@ -204,10 +458,12 @@ class DiscordBot(commands.Bot):
         """Affiche un résumé de démarrage"""
         logger.info("\n🎉 [STARTUP] Bot prêt et opérationnel !")
         
-        # Statistiques de la base de données
-        uow = self.uow_factory()
-        with uow:
-            stats = uow.database.get_stats()
+        # Statistiques de la base de données (déjà relevées par la vérification de santé)
+        stats = self._startup_db_stats
+        if stats is None:
+            uow = self.uow_factory()
+            with uow:
+                stats = uow.database.get_stats()
         
         cogs_count = len([cog for cog in self.cogs.values()])
         commands_count = len(self.commands)
@@ -235,24 +491,32 @@ class DiscordBot(commands.Bot):
 
     def run(self):
         """Lance le bot"""
-        super().run(self.token, reconnect=True)
+        # log_handler=None : discord.py ne doit pas ajouter son propre handler (synchrone) au logger racine
+        super().run(self.token, reconnect=True, log_handler=None)
     
-    def close(self):
-        """Ferme proprement le bot"""
+    async def close(self):
+        """Ferme proprement le bot (tâches, session HTTP, connexion Discord puis base)"""
+        if self.is_closed():
+            return
         logger.info("🛑 [SHUTDOWN] Arrêt du bot...")
         try:
-            if self._sync_loop.is_running():
-                self._sync_loop.cancel()
-            db_engine.close()
+            self.job_scheduler.stop()
+            self.reminder_service.stop()
+            self.loop_monitor.stop()
+            await self.http_scheduler.close()
+            if self.metrics_server:
+                await self.metrics_server.stop()
         except Exception as e:
             logger.error(f"❌ [SHUTDOWN] Erreur lors de la fermeture : {e}")
+        finally:
+            await super().close()
+            db_engine.close()
 
 
 if __name__ == "__main__":
     bot = DiscordBot()
     try:
+        # run() attend close() à l'arrêt, y compris sur Ctrl+C
         bot.run()
     except KeyboardInterrupt:
         logger.info("🛑 [SHUTDOWN] Arrêt demandé par l'utilisateur")
-    finally:
-        bot.close()
@@ -0,0 +1,192 @@
+"""
+Cog des commandes d'administration (réservées aux administrateurs du serveur)
+"""
+import copy
+import time
+from typing import Optional
+
+from discord.ext import commands
+
+from bot.domain.utils.create_text_table import DISCORD_MESSAGE_LIMIT, paginate_text_table
+from bot.infrastructure.metrics import Histogram, metrics
+from bot.infrastructure.profiler import format_top
+from bot.infrastructure.query_monitor import executed_statements, untracked_statements
+from bot.infrastructure.unit_of_work_impl import create_unit_of_work
+
+# Part de pages libres à partir de laquelle un VACUUM est conseillé
+VACUUM_FREE_PAGES_RATIO = 0.2
+
+
+def _format_series(labels) -> str:
+    return ",".join(labels) or "-"
+
+
+def _format_amount(metric_name: str, value: float) -> str:
+    """Durées affichées en millisecondes, autres valeurs telles quelles"""
+    if "seconds" in metric_name:
+        return f"{value * 1000:.1f} ms"
+    return f"{value:g}"
+
+
+def _format_size(size: Optional[int]) -> str:
+    if size is None:
+        return "-"
+    for unit in ("o", "Kio", "Mio"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "o" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} Gio"
+
+
+class AdminCommands(commands.Cog):
+    """🛠️ Administration - Cog pour le suivi du bot"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.name = "🛠️ Administration"
+        self.description = "Suivi des performances du bot"
+        self.uow_factory = create_unit_of_work
+
+    async def cog_check(self, ctx: commands.Context) -> bool:
+        # Commandes réservées aux administrateurs du serveur
+        return await commands.has_permissions(administrator=True).predicate(ctx)
+
+    @commands.command(name="metrics")
+    async def show_metrics(self, ctx: commands.Context):
+        """Affiche les métriques du bot (durées, compteurs, caches)"""
+        histogram_rows = []
+        value_rows = []
+        prefix = f"{metrics.namespace}_"
+        for metric in metrics.collect():
+            name = metric.name[len(prefix):]
+            if isinstance(metric, Histogram):
+                for labels, count, average, maximum in metric.summary():
+                    histogram_rows.append({
+                        'metric': name,
+                        'series': _format_series(labels),
+                        'count': count,
+                        'avg': _format_amount(name, average),
+                        'max': _format_amount(name, maximum),
+                    })
+            else:
+                for labels, value in metric.items():
+                    value_rows.append({
+                        'metric': name,
+                        'series': _format_series(labels),
+                        'value': _format_amount(name, value),
+                    })
+
+        histogram_columns = {'metric': 'Métrique', 'series': 'Série', 'count': 'N', 'avg': 'Moy.', 'max': 'Max'}
+        value_columns = {'metric': 'Métrique', 'series': 'Série', 'value': 'Valeur'}
+        budget = DISCORD_MESSAGE_LIMIT - 8  # Délimiteurs ```
+
+        await ctx.send("📈 **Métriques du bot**")
+        for rows, columns in ((histogram_rows, histogram_columns), (value_rows, value_columns)):
+            if rows:
+                for page in paginate_text_table(rows, columns, budget):
+                    await ctx.send(f"```\n{page}```")
+
+    @commands.command(name="dbstats")
+    async def show_db_stats(self, ctx: commands.Context):
+        """Affiche l'état de la base : tailles des tables et index, utilisation des index, fichiers, pages"""
+        started_at = time.perf_counter()
+        statements = executed_statements()
+        # Les requêtes d'introspection du rapport ne comptent pas dans les statistiques d'exécution
+        with untracked_statements(), self.uow_factory() as uow:
+            report = uow.database.get_storage_report(statements)
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+
+        page_size = report['page_size']
+        page_count = report['page_count']
+        free_ratio = report['freelist_count'] / page_count if page_count else 0.0
+        cache_size = report['cache_size']
+        cache_bytes = -cache_size * 1024 if cache_size < 0 else cache_size * page_size
+        wal = _format_size(report['wal_size']) if report['wal_size'] is not None else "absent"
+
+        lines = [
+            f"🗄️ **Base de données** (rapport en {elapsed_ms:.0f} ms)",
+            f"Fichier : {_format_size(report['file_size'])} · WAL : {wal} (journal {report['journal_mode']})",
+            f"Pages : {page_count} × {_format_size(page_size)}, dont {report['freelist_count']} libres "
+            f"({free_ratio:.0%})",
+            f"Cache de pages : {_format_size(cache_bytes)} par connexion",
+            f"ANALYZE : {'statistiques présentes' if report['analyzed'] else 'jamais exécuté (pas de sqlite_stat1)'}",
+            f"Utilisation des index : plans de {len(statements)} requête(s) distincte(s) exécutée(s) depuis le démarrage",
+        ]
+        if free_ratio >= VACUUM_FREE_PAGES_RATIO:
+            lines.append(f"💡 VACUUM conseillé : {free_ratio:.0%} des pages sont libres")
+        if not report['analyzed']:
+            lines.append("💡 ANALYZE conseillé : le planificateur n'a pas de statistiques sur les index")
+        await ctx.send("\n".join(lines))
+
+        tables = sorted(report['tables'], key=lambda t: (t['size'] or 0, t['rows']), reverse=True)
+        table_rows = [
+            {
+                'name': table['name'],
+                'rows': str(table['rows']),
+                'size': _format_size(table['size']),
+                'scans': str(table['full_scans']),
+            }
+            for table in tables
+        ]
+        index_rows = [
+            {
+                'name': index['name'],
+                'table': index['table'],
+                'size': _format_size(index['size']),
+                'executions': str(index['executions']),
+                'stat': index['stat'] or "-",
+            }
+            for index in sorted(report['indexes'], key=lambda i: (i['table'], i['name']))
+        ]
+        table_columns = {'name': 'Table', 'rows': 'Lignes', 'size': 'Taille', 'scans': 'Parcours complets'}
+        index_columns = {
+            'name': 'Index', 'table': 'Table', 'size': 'Taille', 'executions': 'Exécutions', 'stat': 'sqlite_stat1'
+        }
+        budget = DISCORD_MESSAGE_LIMIT - 8  # Délimiteurs ```
+        for rows, columns in ((table_rows, table_columns), (index_rows, index_columns)):
+            if rows:
+                for page in paginate_text_table(rows, columns, budget):
+                    await ctx.send(f"```\n{page}```")
+
+    @commands.command(name="profile")
+    async def profile(self, ctx: commands.Context, *, target: str):
+        """Profile une commande (ex : $profile list_events) ou une synchronisation ($profile sync)"""
+        if target == "sync":
+            guild = self.bot.get_guild(self.bot.guild_id)
+            if not guild:
+                await ctx.send("❌ Guild introuvable")
+                return
+            label = "sync"
+
+            async def run():
+                await self.bot.sync_service.sync_guild(self.bot, guild)
+        else:
+            message = copy.copy(ctx.message)
+            message.content = f"{ctx.prefix}{target}"
+            target_ctx = await self.bot.get_context(message)
+            if target_ctx.command is None or target_ctx.command is ctx.command:
+                await ctx.send(f"❌ Commande inconnue : `{target.split()[0]}`")
+                return
+            label = target_ctx.command.qualified_name
+
+            async def run():
+                await self.bot.invoke(target_ctx)
+
+        try:
+            result = await self.bot.profiler.run(label, run)
+        except RuntimeError as e:
+            await ctx.send(f"⏳ {e}")
+            return
+
+        unit = 'Échantillons' if result.mode == "sampling" else 'Appels'
+        columns = {'function': 'Fonction', 'calls': unit, 'cumulative': 'Cumulé'}
+        await ctx.send(
+            f"🔬 **Profil de `{label}`** ({result.mode}, {result.duration * 1000:.0f} ms) : `{result.path.name}`"
+        )
+        for page in paginate_text_table(format_top(result), columns, DISCORD_MESSAGE_LIMIT - 8):
+            await ctx.send(f"```\n{page}```")
+
+
+async def setup(bot: commands.Bot):
+    """Setup du cog"""
+    await bot.add_cog(AdminCommands(bot))
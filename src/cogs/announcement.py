@@ -1,6 +1,4 @@
-
 from discord.ext import commands
-from datetime import datetime, timedelta, timezone
 from bot.core.config import ANNOUNCE_CHANNEL_ID
 
 
@@ -19,44 +17,16 @@ class AnnouncementCommands(commands.Cog):
         if not guild:
             await ctx.send("❌ Guild introuvable")
             return
-        
-        now = datetime.now(timezone.utc)
-
-        days_until_sunday = 6 - now.weekday()
-        if days_until_sunday == 0:
-            days_until_sunday = 7
-            
-        end_of_week = now + timedelta(days=days_until_sunday, hours=23-now.hour, minutes=59-now.minute)
 
-        events = await guild.fetch_scheduled_events()
-        
-        week_events = [e for e in events if e.start_time and now <= e.start_time <= end_of_week]
+        message = await self.bot.announcement_service.build_week_announcement(guild)
 
-        if not week_events:
+        if not message:
             await ctx.send("📅 Aucun event prévu cette semaine.")
             return
 
-        # Tri par date
-        week_events.sort(key=lambda e: e.start_time)
-
-        # Création du message
-        message = ""
-        message += "```"
-        message += "\n"
-        message += "Bonsoir tout le monde !"
-        message += "\n"
-        message += "@annonce Cette semaine, on propose les soirées suivantes :\n\n"
-
-        for event in week_events:
-            event_time_unix = int(event.start_time.timestamp())
-            message += f"- Soirée [**{event.name}**]({event.url}) <t:{event_time_unix}:F>\n"
-
-        message += "\n"
-        message += "Bonne semaine ! 😉"
-        message += "```"
         # Envoyer le message d'annonce dans le channel de vérification des événements
         test_channel = self.bot.get_channel(ANNOUNCE_CHANNEL_ID) if ANNOUNCE_CHANNEL_ID else None
-        
+
         if test_channel:
             await test_channel.send(message)
         else:
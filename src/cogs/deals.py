@@ -2,14 +2,17 @@
 Cog pour la gestion des promotions de jeux
 Utilise la nouvelle architecture Clean Architecture
 """
-import aiohttp
 from discord.ext import commands
 
-from bot.domain.services import GameService, DealService
 from bot.infrastructure.unit_of_work_impl import create_unit_of_work
+from bot.infrastructure.cheapshark_client import CheapSharkError
+from bot.infrastructure.data_versions import data_versions
+from bot.infrastructure.render_cache import render_cache
 from bot.core.utils import safe_float, format_currency, format_percentage
 
-API_URL = "https://www.cheapshark.com/api/1.0"
+# Les services des jeux et promotions sont importés dans les commandes : leurs
+# modèles Pydantic ne sont chargés qu'au premier usage, pas au démarrage du bot.
+
 TEST_CHANNEL_ID = 1287444577933983806
 
 
@@ -21,14 +24,35 @@ class DealsCog(commands.Cog):
         self.name = "🎮 Suivi des Promotions"
         self.uow_factory = create_unit_of_work
     
-    @commands.command(name="addgame", help="Ajoute un jeu à suivre")
+    @commands.command(name="addgame", help="Ajoute un jeu à suivre (--force pour ignorer les doublons probables)")
     async def add_game(self, ctx, *, game_name: str):
         """Ajoute un jeu à suivre"""
         try:
             # Utiliser le service métier
+            from bot.domain.services import GameService
             uow = self.uow_factory()
             game_service = GameService(uow)
             
+            force = game_name.startswith("--force ")
+            if force:
+                game_name = game_name[len("--force "):].strip()
+            
+            # Détecter les doublons avant de créer le jeu
+            existing = game_service.get_game_by_name(game_name)
+            if existing:
+                await ctx.send(f"ℹ️ Le jeu **{existing.name}** est déjà suivi.")
+                return
+            
+            if not force:
+                similar_games = game_service.find_similar_games(game_name)
+                if similar_games:
+                    names = ", ".join(f"**{game.name}**" for game in similar_games)
+                    await ctx.send(
+                        f"⚠️ **Doublon probable**\n\nJeu(x) similaire(s) déjà suivi(s) : {names}\n"
+                        f"Pour l'ajouter quand même : `{ctx.prefix}addgame --force {game_name}`"
+                    )
+                    return
+            
             # Créer le jeu
             game = game_service.create_game(game_name)
             
@@ -46,48 +70,62 @@ class DealsCog(commands.Cog):
     async def list_games(self, ctx):
         """Liste tous les jeux suivis"""
         try:
-            # Utiliser le service métier
-            uow = self.uow_factory()
-            game_service = GameService(uow)
-            
-            # Récupérer tous les jeux
-            games = game_service.get_all_games()
-            
-            if not games:
-                await ctx.send("📋 **Jeux suivis**\n\nAucun jeu suivi pour le moment.")
-                return
-            
-            message = f"📋 **Jeux suivis**\n\n{len(games)} jeu(s) suivi(s)\n\n"
-            
-            # Limiter à 25 jeux (limite Discord)
-            games_to_show = games[:25]
-            
-            for game in games_to_show:
-                message += f"🎮 **{game.name}**\n"
-                message += f"ID: {game.id} | Steam: {game.steam_id or 'N/A'} | Epic: {game.epic_id or 'N/A'}\n\n"
-            
-            if len(games) > 25:
-                message += f"... et {len(games) - 25} autres jeux"
-            
+            # Liste déjà rendue si aucun jeu n'a changé depuis
+            message = render_cache.get_or_render(
+                'listgames', None, data_versions.table('games'), self._render_game_list
+            )
             await ctx.send(message)
             
         except Exception as e:
             await ctx.send(f"❌ **Erreur**\n\nImpossible de lister les jeux : {str(e)}")
     
+    def _render_game_list(self) -> str:
+        """Construit le message listant les jeux suivis"""
+        # Utiliser le service métier
+        from bot.domain.services import GameService
+        uow = self.uow_factory()
+        game_service = GameService(uow)
+
+        # Récupérer tous les jeux
+        games = game_service.get_all_games()
+
+        if not games:
+            return "📋 **Jeux suivis**\n\nAucun jeu suivi pour le moment."
+
+        message = f"📋 **Jeux suivis**\n\n{len(games)} jeu(s) suivi(s)\n\n"
+
+        # Limiter à 25 jeux (limite Discord)
+        games_to_show = games[:25]
+
+        for game in games_to_show:
+            message += f"🎮 **{game.name}**\n"
+            message += f"ID: {game.id} | Steam: {game.steam_id or 'N/A'} | Epic: {game.epic_id or 'N/A'}\n\n"
+
+        if len(games) > 25:
+            message += f"... et {len(games) - 25} autres jeux"
+
+        return message
+
     @commands.command(name="checkdeals", help="Vérifie les promotions pour un jeu")
     async def check_deals(self, ctx, *, game_name: str):
         """Vérifie les promotions pour un jeu"""
         try:
             # Utiliser le service métier
+            from bot.domain.services import GameService, DealService
             uow = self.uow_factory()
             game_service = GameService(uow)
             deal_service = DealService(uow)
             
-            # Trouver le jeu
+            # Trouver le jeu (nom normalisé, puis recherche approchée)
             game = game_service.get_game_by_name(game_name)
+            other_matches = []
             if not game:
-                await ctx.send(f"❌ **Jeu non trouvé**\n\nLe jeu **{game_name}** n'est pas suivi.")
-                return
+                matches = game_service.search_games(game_name)
+                if not matches:
+                    await ctx.send(f"❌ **Jeu non trouvé**\n\nLe jeu **{game_name}** n'est pas suivi.")
+                    return
+                game = matches[0][0]
+                other_matches = [match for match, _score in matches[1:]]
             
             # Récupérer les promotions existantes
             existing_deals = deal_service.get_deals_by_game(game.id)
@@ -107,53 +145,86 @@ class DealsCog(commands.Cog):
                     
                     message += f"💰 **{deal.title}**\n"
                     message += f"Prix: {sale_price_str} (au lieu de {normal_price_str})\n"
-                    message += f"Économie: {savings_percent} | Store: {deal.store_id}\n\n"
+                    message += f"Économie: {savings_percent} | Store: {self.bot.store_service.get_name(deal.store_id)}\n\n"
                 
                 if len(existing_deals) > 10:
                     message += f"... et {len(existing_deals) - 10} autres promotions"
             
+            # Plus bas historique depuis l'historique des prix
+            lowest = deal_service.get_lowest_price(game.id)
+            if lowest:
+                message = message.rstrip() + (
+                    f"\n\n📉 Plus bas historique : {format_currency(lowest.sale_price)} "
+                    f"(Store: {self.bot.store_service.get_name(lowest.store_id)}, le {lowest.observed_at.strftime('%d/%m/%Y')})"
+                )
+            
+            if other_matches:
+                names = ", ".join(f"**{match.name}**" for match in other_matches)
+                message = message.rstrip() + f"\n\n🔎 Autres correspondances : {names}"
+            
             await ctx.send(message)
             
         except Exception as e:
             await ctx.send(f"❌ **Erreur**\n\nImpossible de vérifier les promotions : {str(e)}")
     
+    @commands.command(name="setalert", help="Définit un seuil d'alerte de prix pour un jeu suivi (0 pour désactiver)")
+    async def set_alert(self, ctx, price: float, *, game_name: str):
+        """Définit un seuil d'alerte de prix pour un jeu suivi"""
+        try:
+            from bot.domain.services import GameService
+            uow = self.uow_factory()
+            game_service = GameService(uow)
+            
+            alert_price = price if price > 0 else None
+            game = game_service.set_alert_price(game_name, alert_price)
+            if not game:
+                await ctx.send(f"❌ **Jeu non trouvé**\n\nLe jeu **{game_name}** n'est pas suivi.")
+                return
+            
+            if alert_price is None:
+                await ctx.send(f"🔕 Alerte de prix désactivée pour **{game.name}**")
+            else:
+                await ctx.send(f"🔔 Alerte de prix pour **{game.name}** sous {format_currency(alert_price)}")
+            
+        except Exception as e:
+            await ctx.send(f"❌ **Erreur**\n\nImpossible de définir l'alerte : {str(e)}")
+    
     @commands.command(name="searchdeals", help="Recherche des promotions sur CheapShark")
     async def search_deals(self, ctx, *, search_term: str):
         """Recherche des promotions sur CheapShark"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{API_URL}/deals", params={"title": search_term}) as response:
-                    if response.status == 200:
-                        deals_data = await response.json()
-                        
-                        if not deals_data:
-                            await ctx.send(f"🔍 **Recherche de promotions**\n\nAucune promotion trouvée pour **{search_term}**")
-                            return
-                        
-                        message = f"🔍 **Promotions pour {search_term}**\n\n{len(deals_data)} promotion(s) trouvée(s)\n\n"
-                        
-                        # Limiter à 10 résultats
-                        deals_to_show = deals_data[:10]
-                        
-                        for deal in deals_to_show:
-                            savings_amount = safe_float(deal.get('savings', 0))
-                            sale_price = safe_float(deal.get('salePrice', 0))
-                            normal_price = safe_float(deal.get('normalPrice', 0))
-                            
-                            savings_percent = format_percentage(savings_amount, normal_price)
-                            sale_price_str = format_currency(sale_price)
-                            normal_price_str = format_currency(normal_price)
-                            
-                            message += f"🎮 **{deal.get('title', 'Titre inconnu')}**\n"
-                            message += f"Prix: {sale_price_str} (au lieu de {normal_price_str})\n"
-                            message += f"Économie: {savings_percent} | Store: {deal.get('storeID', 'N/A')}\n\n"
-                        
-                        if len(deals_data) > 10:
-                            message += f"... et {len(deals_data) - 10} autres promotions"
-                        
-                        await ctx.send(message)
-                    else:
-                        await ctx.send("❌ **Erreur API**\n\nImpossible de contacter l'API CheapShark")
+            try:
+                result = await self.bot.cheapshark_client.search_deals(search_term, limit=10)
+            except CheapSharkError:
+                await ctx.send("❌ **Erreur API**\n\nImpossible de contacter l'API CheapShark")
+                return
+            
+            if not result.deals:
+                await ctx.send(f"🔍 **Recherche de promotions**\n\nAucune promotion trouvée pour **{search_term}**")
+                return
+            
+            count_str = f"{result.count}+" if result.has_more else str(result.count)
+            message = f"🔍 **Promotions pour {search_term}**\n\n{count_str} promotion(s) trouvée(s)\n\n"
+            
+            # Seules les 10 premières promotions (les mieux notées) sont décodées
+            for deal in result.deals:
+                savings_amount = safe_float(deal.get('savings', 0))
+                sale_price = safe_float(deal.get('salePrice', 0))
+                normal_price = safe_float(deal.get('normalPrice', 0))
+                
+                savings_percent = format_percentage(savings_amount, normal_price)
+                sale_price_str = format_currency(sale_price)
+                normal_price_str = format_currency(normal_price)
+                
+                message += f"🎮 **{deal.get('title', 'Titre inconnu')}**\n"
+                message += f"Prix: {sale_price_str} (au lieu de {normal_price_str})\n"
+                message += f"Économie: {savings_percent} | Store: {self.bot.store_service.get_name(deal.get('storeID'))}\n\n"
+            
+            if result.count > len(result.deals):
+                more = "+" if result.has_more else ""
+                message += f"... et {result.count - len(result.deals)}{more} autres promotions"
+            
+            await ctx.send(message)
                         
         except Exception as e:
             await ctx.send(f"❌ **Erreur**\n\nErreur lors de la recherche : {str(e)}")
@@ -4,14 +4,32 @@ Cog pour la gestion des événements
 
 
 from datetime import datetime, timezone
+from typing import List, Tuple
 
 from discord.ext import commands
 
 from bot.infrastructure.unit_of_work_impl import create_unit_of_work
-from bot.domain.utils.create_text_table import create_text_table
+from bot.infrastructure.data_versions import data_versions
+from bot.infrastructure.render_cache import render_cache
+from bot.infrastructure.attendance_aggregator import month_key
+from bot.domain.utils.create_text_table import (
+    DISCORD_MESSAGE_LIMIT,
+    create_text_table,
+    paginate_text_table,
+    split_text,
+)
+from bot.domain.utils.paginator import PAGE_FOOTER_RESERVE, send_pages
 from bot.core.config import PARIS_TZ
 from bot.core.logging_config import logger
 
+# Libellés des types d'événements Discord
+EVENT_TYPE_LABELS = {
+    'voice': '🔊 Vocal',
+    'stage_instance': '🎤 Conférence',
+    'external': '📍 Externe',
+    'unknown': '❔ Inconnu',
+}
+
 
 class EventsCommands(commands.Cog):
     """📅 Cog pour gérer les événements et leurs inscriptions"""
@@ -33,43 +51,167 @@ class EventsCommands(commands.Cog):
                 await ctx.send("##📅 Aucun événement trouvé.")
                 return
 
-            message = "**📅 Événements Actifs**\n"
+            # Pages déjà rendues si ni les événements ni les participations n'ont changé
+            version = (
+                data_versions.table('event_participations'),
+                tuple((event.id, event.name, event.start_time) for event in events),
+            )
+            pages = render_cache.get_or_render(
+                'list_events', ctx.guild.id, version, lambda: self._render_event_list(events)
+            )
+
+            await send_pages(ctx, pages)
             
-            # Préparer les données pour l'affichage tabulaire
-            data_rows = []
+        except Exception as e:
+            logger.exception("❌ [EVENTS] Erreur lors de la récupération des événements : %s", e)
+            await ctx.send(f"❌ Erreur lors de la récupération des événements : {str(e)}")
+
+    def _render_event_list(self, events) -> List[str]:
+        """Construit les pages du tableau des événements"""
+        message = "**📅 Événements Actifs**\n"
+
+        # Préparer les données pour l'affichage tabulaire
+        data_rows = []
+
+        # Compter les participants de tous les événements en une seule requête
+        with self.uow_factory() as uow:
+            participants_map = uow.participations.count_by_events([str(event.id) for event in events])
+
+        for event in events:
+            participants_count = participants_map.get(str(event.id), 0)
+            event_time_str = event.start_time.astimezone(PARIS_TZ).strftime('%d/%m %H:%M') if event.start_time else "Date indéfinie"
+
+            data_rows.append({
+                'id': str(event.id),
+                'name': event.name,
+                'time': event_time_str,
+                'count': str(participants_count)
+            })
+
+        columns = {
+            'id': 'ID',
+            'name': 'Nom',
+            'time': 'Heure',
+            'count': 'Participants'
+        }
+
+        footer = "\nPour les détails, utilisez `$event_detail <ID>`"
+        budget = DISCORD_MESSAGE_LIMIT - PAGE_FOOTER_RESERVE - len(message) - len(footer) - len("```\n```")
+        return [
+            message + f"```\n{table_page}```" + footer
+            for table_page in paginate_text_table(data_rows, columns, budget)
+        ]
 
-            # Récupérer les participants en amont pour éviter l'ouverture/fermeture UOW répétée
-            participants_map = {}
+    @commands.command(name="my_events")
+    async def my_events(self, ctx: commands.Context):
+        """Lister les événements à venir auxquels vous êtes inscrit"""
+        try:
+            # Les événements actifs viennent du cache Discord, les inscriptions d'une requête indexée
+            events_discord = {str(event.id): event for event in ctx.guild.scheduled_events}
             with self.uow_factory() as uow:
-                for event in events:
-                    participations = uow.participations.get_by_event(str(event.id))
-                    participants_map[event.id] = len(participations)
-            
-            for event in events:
-                participants_count = participants_map.get(event.id, 0)
-                event_time_str = event.start_time.astimezone(PARIS_TZ).strftime('%d/%m %H:%M') if event.start_time else "Date indéfinie"
-                
+                participations = uow.participations.get_by_user(str(ctx.author.id), list(events_discord))
+
+            if not participations:
+                await ctx.send("##📅 Vous n'êtes inscrit à aucun événement à venir.")
+                return
+
+            participations.sort(key=lambda p: events_discord[p[0]].start_time or datetime.max.replace(tzinfo=timezone.utc))
+
+            data_rows = []
+            for event_discord_id, joined_at in participations:
+                event = events_discord[event_discord_id]
+                if joined_at.tzinfo is None:
+                    joined_at = joined_at.replace(tzinfo=timezone.utc)
                 data_rows.append({
-                    'id': str(event.id),
                     'name': event.name,
-                    'time': event_time_str,
-                    'count': str(participants_count)
+                    'time': event.start_time.astimezone(PARIS_TZ).strftime('%d/%m %H:%M') if event.start_time else "Date indéfinie",
+                    'joined_at': joined_at.astimezone(PARIS_TZ).strftime('%H:%M %d/%m'),
+                    'id': event_discord_id
                 })
 
             columns = {
-                'id': 'ID',
                 'name': 'Nom',
                 'time': 'Heure',
-                'count': 'Participants'
+                'joined_at': 'Inscrit le',
+                'id': 'ID'
             }
 
-            table_content = create_text_table(data_rows, columns)
+            message = f"**📅 Mes événements ({len(data_rows)})**\n"
+            budget = DISCORD_MESSAGE_LIMIT - PAGE_FOOTER_RESERVE - len(message) - len("```\n```")
+            pages = [
+                message + f"```\n{table_page}```"
+                for table_page in paginate_text_table(data_rows, columns, budget)
+            ]
+
+            await send_pages(ctx, pages)
 
-            await ctx.send(message + f"```\n{table_content}```\nPour les détails, utilisez `$event_detail <ID>`")
-            
         except Exception as e:
-            logger.exception("❌ [EVENTS] Erreur lors de la récupération des événements : %s", e)
-            await ctx.send(f"❌ Erreur lors de la récupération des événements : {str(e)}")
+            logger.exception("❌ [EVENTS] Erreur lors de la récupération de vos événements : %s", e)
+            await ctx.send(f"❌ Erreur lors de la récupération de vos événements : {str(e)}")
+
+    @commands.command(name="stats")
+    async def stats(self, ctx: commands.Context):
+        """Statistiques de participation du mois (classement, types d'événements, vos chiffres)"""
+        try:
+            month = month_key(datetime.utcnow())
+            user_id = str(ctx.author.id)
+
+            # Lectures des agrégats uniquement (aucun parcours des participations)
+            with self.uow_factory() as uow:
+                top_participants = uow.attendance.get_top_participants(month, limit=10)
+                by_type = uow.attendance.get_by_event_type(month)
+                month_signups, month_cancellations = uow.attendance.get_user_stats(user_id, month)
+                total_signups, total_cancellations = uow.attendance.get_user_stats(user_id)
+
+            message = f"## 📊 Statistiques de participation ({month})\n"
+
+            message += "### 🏆 Top participants du mois\n"
+            if top_participants:
+                top_rows = []
+                for rank, (participant_id, username, signups, cancellations) in enumerate(top_participants, 1):
+                    member = ctx.guild.get_member(int(participant_id))
+                    top_rows.append({
+                        'rank': str(rank),
+                        'username': member.display_name if member else (username or 'Utilisateur Inconnu'),
+                        'signups': str(signups),
+                        'rate': self._format_cancellation_rate(signups, cancellations)
+                    })
+                top_columns = {'rank': '#', 'username': 'Nom', 'signups': 'Inscriptions', 'rate': 'Annulations'}
+                message += f"```\n{create_text_table(top_rows, top_columns)}```\n"
+            else:
+                message += "*Aucune inscription ce mois-ci.*\n"
+
+            if by_type:
+                type_rows = [
+                    {
+                        'type': EVENT_TYPE_LABELS.get(event_type, event_type),
+                        'signups': str(signups),
+                        'rate': self._format_cancellation_rate(signups, cancellations)
+                    }
+                    for event_type, signups, cancellations in by_type
+                ]
+                type_columns = {'type': 'Type', 'signups': 'Inscriptions', 'rate': 'Annulations'}
+                message += f"### 🎭 Par type d'événement\n```\n{create_text_table(type_rows, type_columns)}```\n"
+
+            message += (
+                "### 👤 Vos statistiques\n"
+                f"Ce mois : **{month_signups}** inscription(s), taux d'annulation "
+                f"{self._format_cancellation_rate(month_signups, month_cancellations)}\n"
+                f"Au total : **{total_signups}** inscription(s), taux d'annulation "
+                f"{self._format_cancellation_rate(total_signups, total_cancellations)}"
+            )
+
+            await ctx.send(message[:DISCORD_MESSAGE_LIMIT])
+
+        except Exception as e:
+            logger.exception("❌ [EVENTS] Erreur lors du calcul des statistiques : %s", e)
+            await ctx.send(f"❌ Erreur lors du calcul des statistiques : {str(e)}")
+
+    @staticmethod
+    def _format_cancellation_rate(signups: int, cancellations: int) -> str:
+        """Part des inscriptions annulées (désinscriptions / inscriptions initiales)"""
+        total = signups + cancellations
+        return f"{cancellations / total:.0%}" if total else "-"
 
     @commands.command(name="event_detail")
     async def event_detail(self, ctx: commands.Context, event_id: int):
@@ -87,83 +229,101 @@ class EventsCommands(commands.Cog):
                 await ctx.send(f"❌ Aucun événement Discord trouvé avec l'ID `{event_id}`.")
                 return
 
-            # 2. Récupérer les participations et les données utilisateurs
-            participants_data = []
-            with self.uow_factory() as uow:
-                # Récupérer les participations depuis la base de données
-                participations = uow.participations.get_by_event(str(event_id))
-                
-                # Récupérer les données utilisateur
-                for participation in participations:
-                    # Tente de récupérer l'objet membre Discord pour avoir le nom à jour et mention
-                    member = ctx.guild.get_member(int(participation.user_discord_id))
-                    user = uow.users.get_by_discord_id(participation.user_discord_id)
-                    
-                    participants_data.append({
-                        'username': member.display_name if member else (user.username if user else 'Utilisateur Inconnu'),
-                        'discord_id': participation.user_discord_id, # Garder pour la mention
-                        'joined_at': participation.joined_at
-                    })
-            
-            # Trie par date d'inscription
-            participants_data.sort(key=lambda p: p['joined_at'])
-            participants_count = len(participants_data)
-            
-            # 3. Construction du message de détails (Markdown)
-            
-            message = f"## 📅 {discord_event.name}\n"
-            
-            if discord_event.description:
-                # Description dans un bloc de citation pour la démarquer
-                desc = discord_event.description.replace('\n', '\n> ')
-                message += f"> **📝 Description :**\n> {desc}\n"
-            
-            # 4. Liste des participants (format tabulaire ou liste simple)
-            message += f"### 👥 {participants_count} inscrits \n\n"
-
-            if participants_data:
-                # Préparer les données des participants pour le tableau
-                p_rows = []
-                for i, p in enumerate(participants_data, 1):
-                    # Convertir la date en timezone Paris avant l'affichage
-                    # Si joined_at est naïf (sans timezone), on le considère comme UTC
-                    if p['joined_at'].tzinfo is None:
-                        joined_at_utc = p['joined_at'].replace(tzinfo=timezone.utc)
-                    else:
-                        joined_at_utc = p['joined_at']
-                    joined_at_paris = joined_at_utc.astimezone(PARIS_TZ)
-                    p_rows.append({
-                        'rank': str(i).ljust(2),
-                        'username': p['username'],
-                        'joined_at': joined_at_paris.strftime('%H:%M %d/%m')
-                    })
-                
-                # Création du tableau des participants
-                p_columns = {
-                    'rank': '#',
-                    'username': 'Nom',
-                    'joined_at': 'Inscrit le'
-                }
-                
-                participants_table = create_text_table(p_rows, p_columns)
-                message += "```md\n"
-                message += participants_table
-                message += "```\n\n"
-                
-                # 5. CODE DE MENTION (Gardé Intact)
-                message += "Pour mentionner les participants, utilisez le code suivant : \n"
-
-                code_mentions = " ".join([f"<@{p['discord_id']}>" for p in participants_data])
-                message += f"```{code_mentions}```" # <-- CODE INTАCT
-                
-            else:
-                message += "*Aucun inscrit enregistré dans la base de données.*\n"
+            # Pages déjà rendues si ni les participations ni l'événement n'ont changé
+            version = (
+                data_versions.key('event_participations', str(event_id)),
+                data_versions.table('users'),
+                discord_event.name,
+                discord_event.description,
+            )
+            pages, mention_messages = render_cache.get_or_render(
+                'event_detail', event_id, version,
+                lambda: self._render_event_detail(ctx, discord_event, event_id)
+            )
 
-            await ctx.send(message)
+            await send_pages(ctx, pages)
+            for mention_message in mention_messages:
+                await ctx.send(mention_message)
             
         except Exception as e:
             await ctx.send(f"❌ Erreur lors de la récupération des détails : {str(e)}")
 
+    def _render_event_detail(self, ctx: commands.Context, discord_event, event_id: int) -> Tuple[List[str], List[str]]:
+        """Construit les pages de détails d'un événement et les messages de mentions"""
+        # 2. Récupérer les participants (participations JOIN users, triés par date d'inscription)
+        with self.uow_factory() as uow:
+            participants = uow.participations.get_participants_detail(str(event_id))
+        
+        # Fusion avec le cache des membres Discord pour avoir le nom à jour
+        participants_data = []
+        for user_discord_id, username, joined_at in participants:
+            member = ctx.guild.get_member(int(user_discord_id))
+            participants_data.append({
+                'username': member.display_name if member else (username or 'Utilisateur Inconnu'),
+                'discord_id': user_discord_id, # Garder pour la mention
+                'joined_at': joined_at
+            })
+        participants_count = len(participants_data)
+        
+        # 3. Construction du message de détails (Markdown)
+        header_parts = [f"## 📅 {discord_event.name}\n"]
+        
+        if discord_event.description:
+            # Description dans un bloc de citation pour la démarquer
+            desc = discord_event.description.replace('\n', '\n> ')
+            header_parts.append(f"> **📝 Description :**\n> {desc}\n")
+        
+        # 4. Liste des participants (format tabulaire ou liste simple)
+        header_parts.append(f"### 👥 {participants_count} inscrits \n\n")
+        header = "".join(header_parts)
+
+        if not participants_data:
+            return [header + "*Aucun inscrit enregistré dans la base de données.*\n"], []
+
+        # Préparer les données des participants pour le tableau
+        p_rows = []
+        for i, p in enumerate(participants_data, 1):
+            # Convertir la date en timezone Paris avant l'affichage
+            # Si joined_at est naïf (sans timezone), on le considère comme UTC
+            if p['joined_at'].tzinfo is None:
+                joined_at_utc = p['joined_at'].replace(tzinfo=timezone.utc)
+            else:
+                joined_at_utc = p['joined_at']
+            joined_at_paris = joined_at_utc.astimezone(PARIS_TZ)
+            p_rows.append({
+                'rank': str(i).ljust(2),
+                'username': p['username'],
+                'joined_at': joined_at_paris.strftime('%H:%M %d/%m')
+            })
+        
+        # Création du tableau des participants
+        p_columns = {
+            'rank': '#',
+            'username': 'Nom',
+            'joined_at': 'Inscrit le'
+        }
+        
+        # 5. CODE DE MENTION
+        mention_intro = "Pour mentionner les participants, utilisez le code suivant : \n"
+        mentions = [f"<@{p['discord_id']}>" for p in participants_data]
+        
+        # Tout tient dans un seul message : rendu historique
+        participants_table = create_text_table(p_rows, p_columns)
+        single_message = f"{header}```md\n{participants_table}```\n\n{mention_intro}```{' '.join(mentions)}```"
+        if len(single_message) <= DISCORD_MESSAGE_LIMIT:
+            return [single_message], []
+        
+        # Sinon : tableau en pages interactives, mentions en messages successifs
+        table_budget = DISCORD_MESSAGE_LIMIT - PAGE_FOOTER_RESERVE - len(header) - len("```md\n```")
+        pages = [
+            f"{header}```md\n{table_page}```"
+            for table_page in paginate_text_table(p_rows, p_columns, table_budget)
+        ]
+        mention_budget = DISCORD_MESSAGE_LIMIT - len(mention_intro) - len("``````")
+        mention_messages = [f"```{block}```" for block in split_text(mentions, mention_budget)]
+        mention_messages[0] = mention_intro + mention_messages[0]
+        return pages, mention_messages
+
 
 async def setup(bot: commands.Bot):
     """Setup du cog"""
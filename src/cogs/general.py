@@ -5,6 +5,8 @@ Utilise la nouvelle architecture Clean Architecture
 import discord
 from discord.ext import commands
 
+from bot.infrastructure.render_cache import render_cache
+
 
 class GeneralCommands(commands.Cog):
     """🔧 Commandes Générales - Cog pour les commandes générales et l'aide"""
@@ -24,8 +26,9 @@ class GeneralCommands(commands.Cog):
             await ctx.send_help(command)
             return
 
-        # Construire le message d'aide personnalisé
-        help_message = self._build_help_message()
+        # Construire le message d'aide personnalisé (recalculé seulement si les commandes changent)
+        version = (self.bot.command_prefix, tuple(self.bot.cogs), len(self.bot.all_commands))
+        help_message = render_cache.get_or_render('help', None, version, self._build_help_message)
         
         try:
             await ctx.send(help_message)
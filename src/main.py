@@ -2,8 +2,12 @@
 Point d'entrée principal de l'application
 """
 import sys
+import time
 from pathlib import Path
 
+# Début du démarrage : la durée des imports figure dans le rapport de démarrage
+started_at = time.perf_counter()
+
 # Ajouter le dossier src au PYTHONPATH
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
@@ -11,15 +15,11 @@ sys.path.insert(0, str(src_path))
 from bot.main import DiscordBot
 
 if __name__ == "__main__":
-    bot = DiscordBot()
+    bot = DiscordBot(started_at)
     try:
+        # run() attend bot.close() à l'arrêt, y compris sur Ctrl+C
         bot.run()
     except KeyboardInterrupt:
         print("🛑 Arrêt demandé par l'utilisateur")
     except Exception as e:
         print(f"❌ Erreur : {e}")
-    finally:
-        try:
-            bot.close()
-        except Exception as e:
-            print(f"❌ Erreur lors de la fermeture : {e}")
\ No newline at end of file